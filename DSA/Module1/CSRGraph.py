@@ -0,0 +1,525 @@
+import hashlib
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from Module1.Linked_list import DSALinkedList
+from Module1.MinHeap import DSAMinHeap
+from Module1.UnionFind import DSAUnionFind
+from Module1.GraphVertex import GraphErrorHandle, VertexLevelPair, DijkstraTree, DepotTree, IsochroneResult
+
+"""
+Frozen compressed sparse row (CSR) view of a DSAGraph.
+The neighbours of vertex i are neighbours[offsets[i]:offsets[i + 1]],
+with matching travel times in weights. Every undirected road is stored
+once in each direction, in the same order as the adjacency lists it was
+built from. The arrays are read only, build a new snapshot after the
+graph changes (DSAGraph.freeze does this for you).
+"""
+class DSACSRGraph:
+    MAGIC = b'DSACSR01'         # File signature and format version of saved snapshots
+    HEADER_DTYPE = np.dtype([('magic', 'S8'), ('vertex_count', '<i8'), ('entry_count', '<i8'),
+                             ('label_kind', '<i8'), ('label_bytes', '<i8'), ('version', '<i8')])
+    LABEL_STR = 0               # Labels stored as a UTF-8 blob plus int64 offsets
+    LABEL_INT = 1               # Labels stored as an int64 array
+
+    def __init__(self, labels, offsets, neighbours, weights, version=0):
+        if len(offsets) != len(labels) + 1:
+            raise GraphErrorHandle("Offsets must have one entry per vertex plus one")
+        if len(neighbours) != len(weights) or offsets[-1] != len(neighbours):
+            raise GraphErrorHandle("Neighbour and weight arrays don't match the offsets")
+        self.labels = labels                    # Vertex labels indexed by id
+        self.offsets = offsets                  # int32, row starts into neighbours/weights
+        self.neighbours = neighbours            # int32, neighbour id of each directed edge
+        self.weights = weights                  # float64, travel time of each directed edge
+        self.version = version                  # Graph version the snapshot was taken at
+        self.label_index = {}                   # label -> id, as in DSAGraph
+        self.components = None                  # Union-find over the roads, built on first use
+        self.row_views = None                   # memoryviews of the arrays, see _rowViews
+        self.search_heap = None                 # Reused by reachableWithin
+        self.fingerprint = None                 # Hash of the labels and arrays, see getFingerprint
+        for i in range(len(labels)):
+            self.label_index[labels[i]] = i
+        for array in (self.labels, self.offsets, self.neighbours, self.weights):
+            array.flags.writeable = False       # Snapshot is immutable
+
+    """Build a snapshot from a DSAGraph, walking every adjacency list once."""
+    @staticmethod
+    def fromGraph(graph):
+        vertex_count = graph.getVertexCount()
+        labels = graph.getLabelArray()
+        offsets = [0] * (vertex_count + 1)
+        neighbours = []                                     # Filled in adjacency order, then packed
+        weights = []
+        for i in range(vertex_count):
+            adj_node = graph.vertex_array[i].adjacent.head
+            while adj_node:
+                edge = adj_node.value
+                neighbours.append(edge.vertex.index)
+                weights.append(edge.weight)
+                adj_node = adj_node.next
+            offsets[i + 1] = len(neighbours)                # Row i ends where row i + 1 starts
+        offsets = np.array(offsets, dtype=np.int32)
+        neighbours = np.array(neighbours, dtype=np.int32)
+        weights = np.array(weights, dtype=np.float64)
+        return DSACSRGraph(labels, offsets, neighbours, weights, graph.getVersion())
+
+    def getVertexCount(self):
+        return len(self.labels)
+
+    def getEdgeCount(self):
+        return len(self.neighbours) // 2        # Undirected roads, each stored twice
+
+    def getVersion(self):
+        return self.version
+
+    """
+    64 bit hash of the labels, offsets, neighbours and weights. Version
+    counters start at 0 in every graph, this tells apart two networks
+    that happen to have had the same number of changes. Worked out once,
+    the arrays are read only.
+    """
+    def getFingerprint(self):
+        if self.fingerprint is None:
+            digest = hashlib.blake2b(digest_size=8)
+            labels = [label.item() if isinstance(label, np.generic) else label for label in self.labels]
+            digest.update(repr(labels).encode('utf-8'))     # numpy and Python ints hash the same
+            for array, dtype in ((self.offsets, '<i4'), (self.neighbours, '<i4'), (self.weights, '<f8')):
+                digest.update(np.ascontiguousarray(array, dtype=dtype))   # No copy for the usual layout
+            self.fingerprint = int.from_bytes(digest.digest(), 'little', signed=True)
+        return self.fingerprint
+
+    def hasVertex(self, label):
+        return label in self.label_index
+
+    def getVertexIndex(self, label):
+        idx = self.label_index.get(label)
+        if idx is None:
+            raise GraphErrorHandle(f"Vertex '{label}' not found")
+        return idx
+
+    def getLabelArray(self):
+        return self.labels
+
+    """
+    Save the snapshot as one binary file: a fixed header, then the offsets,
+    neighbours and weights arrays and the labels table, each section starting
+    on an 8 byte boundary so load can map them straight into memory.
+    """
+    def save(self, path):
+        vertex_count = self.getVertexCount()
+        label_kind, label_arrays = DSACSRGraph._encodeLabels(self.labels)
+
+        header = np.zeros(1, dtype=DSACSRGraph.HEADER_DTYPE)
+        header['magic'] = DSACSRGraph.MAGIC
+        header['vertex_count'] = vertex_count
+        header['entry_count'] = len(self.neighbours)
+        header['label_kind'] = label_kind
+        header['label_bytes'] = label_arrays[-1].nbytes
+        header['version'] = self.version
+        sections = (header, self.offsets.astype('<i4'), self.neighbours.astype('<i4'),
+                    self.weights.astype('<f8')) + label_arrays
+        DSACSRGraph._writeSections(path, sections)
+        return True
+
+    """Label types in a sequence, a subset of {'int', 'str'}, checked per distinct type not per label."""
+    @staticmethod
+    def _labelKinds(labels):
+        if isinstance(labels, np.ndarray) and labels.dtype.kind in ('i', 'u', 'U'):
+            return {'int'} if labels.dtype.kind in ('i', 'u') else {'str'}
+        kinds = set()
+        for label_type in set(map(type, labels)):
+            if issubclass(label_type, (bool, np.bool_)):
+                raise GraphErrorHandle("Hub labels can't be booleans")
+            if issubclass(label_type, (int, np.integer)):
+                kinds.add('int')
+            elif issubclass(label_type, str):
+                kinds.add('str')
+            else:
+                raise GraphErrorHandle(f"Hub labels must be ints or strings, not {label_type.__name__}")
+        return kinds
+
+    """
+    Labels as file sections: one int64 array, or UTF-8 offsets plus a byte
+    blob. Only all int or all str labels come back as they went in, so
+    anything else is rejected rather than saved as its str().
+    """
+    @staticmethod
+    def _encodeLabels(labels):
+        vertex_count = len(labels)
+        kinds = DSACSRGraph._labelKinds(labels)
+        if len(kinds) > 1:
+            raise GraphErrorHandle("Labels mix ints and strings, a saved file can only hold one type")
+        if kinds == {'int'}:
+            return DSACSRGraph.LABEL_INT, (np.asarray(labels.tolist(), dtype='<i8'),)
+        encoded = [str(label).encode('utf-8') for label in labels]
+        label_offsets = np.zeros(vertex_count + 1, dtype='<i8')
+        label_offsets[1:] = np.cumsum([len(e) for e in encoded]) if vertex_count > 0 else []
+        return DSACSRGraph.LABEL_STR, (label_offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8))
+
+    """Read back what _encodeLabels wrote, section(dtype, count) returns the next section."""
+    @staticmethod
+    def _decodeLabels(label_kind, section, vertex_count, label_bytes):
+        labels = np.empty(vertex_count, dtype=object)
+        if label_kind == DSACSRGraph.LABEL_INT:
+            labels[:] = np.asarray(section('<i8', vertex_count)).tolist()
+        else:
+            label_offsets = np.asarray(section('<i8', vertex_count + 1)).tolist()
+            blob = np.asarray(section(np.uint8, label_bytes)).tobytes()
+            for i in range(vertex_count):
+                labels[i] = blob[label_offsets[i]:label_offsets[i + 1]].decode('utf-8')
+        return labels
+
+    @staticmethod
+    def _writeSections(path, sections):
+        with open(path, 'wb') as file:
+            for section in sections:
+                file.write(section.tobytes())
+                padding = -section.nbytes % 8           # Keep the next section aligned
+                file.write(b'\0' * padding)
+
+    """
+    Reader for the sections after a header, each on an 8 byte boundary.
+    Returns section(dtype, count), mapping (or reading) the next one.
+    """
+    @staticmethod
+    def _sectionReader(path, header_size, mmap):
+        position = [header_size + (-header_size % 8)]
+        def section(dtype, count):
+            offset = position[0]
+            position[0] += count * np.dtype(dtype).itemsize
+            position[0] += -position[0] % 8
+            if count == 0:
+                return np.zeros(0, dtype=dtype)
+            if mmap:
+                return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count,))
+            return np.fromfile(path, dtype=dtype, count=count, offset=offset)
+        return section
+
+    """
+    Open a saved snapshot. With mmap=True (default) the arrays are numpy
+    memmaps of the file, nothing is copied and processes opening the same
+    file share its pages. Searches read the mapped arrays through
+    memoryviews rather than list copies, so the pages stay shared after
+    the first query too. Only the labels are decoded into memory.
+    """
+    @staticmethod
+    def load(path, mmap=True):
+        try:
+            header = np.fromfile(path, dtype=DSACSRGraph.HEADER_DTYPE, count=1)
+        except FileNotFoundError:
+            raise GraphErrorHandle(f"{path} was not found")
+        if header.size != 1 or header['magic'][0] != DSACSRGraph.MAGIC:
+            raise GraphErrorHandle(f"{path} is not a graph snapshot")
+        vertex_count = int(header['vertex_count'][0])
+        entry_count = int(header['entry_count'][0])
+        label_kind = int(header['label_kind'][0])
+        label_bytes = int(header['label_bytes'][0])
+
+        section = DSACSRGraph._sectionReader(path, DSACSRGraph.HEADER_DTYPE.itemsize, mmap)
+        offsets = section('<i4', vertex_count + 1)
+        neighbours = section('<i4', entry_count)
+        weights = section('<f8', entry_count)
+        labels = DSACSRGraph._decodeLabels(label_kind, section, vertex_count, label_bytes)
+        return DSACSRGraph(labels, offsets, neighbours, weights, int(header['version'][0]))
+
+    """True if there is any route between the two hubs, from a union-find built once per snapshot."""
+    def isReachable(self, label1, label2):
+        idx1 = self.getVertexIndex(label1)
+        idx2 = self.getVertexIndex(label2)
+        if self.components is None:
+            components = DSAUnionFind(self.getVertexCount())
+            offsets, neighbours, weights = self._rowViews()
+            for i in range(self.getVertexCount()):
+                for pos in range(offsets[i], offsets[i + 1]):
+                    components.union(i, neighbours[pos])
+            self.components = components
+        return self.components.connected(idx1, idx2)
+
+    """Bytes held by the offset, neighbour and weight arrays."""
+    def getMemoryUsage(self):
+        return self.offsets.nbytes + self.neighbours.nbytes + self.weights.nbytes
+
+    """Ids of every neighbour of a set of frontier vertices, in frontier order."""
+    def _gatherNeighbours(self, frontier):
+        starts = self.offsets[frontier].astype(np.int64)
+        lengths = self.offsets[frontier + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int32)
+        # Index of every edge of every frontier vertex: ranges start[i] .. start[i] + length[i]
+        edge_ids = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths) + np.repeat(starts, lengths)
+        return self.neighbours[edge_ids]
+
+    """Hop levels from the source, -1 where unreachable (level synchronous and vectorised)."""
+    def bfsLevels(self, source_idx):
+        levels = np.full(self.getVertexCount(), -1, dtype=np.int64)
+        levels[source_idx] = 0
+        frontier = np.array([source_idx], dtype=np.int64)
+        level = 0
+        while frontier.size > 0:
+            found = self._gatherNeighbours(frontier)
+            found = np.unique(found[levels[found] == -1])    # Drop visited and repeated vertices
+            level += 1
+            levels[found] = level
+            frontier = found.astype(np.int64)
+        return levels
+
+    """Same result as DSAGraph.BFS: linked list of reachable hubs and their hop level."""
+    def BFS(self, source_label):
+        if not self.hasVertex(source_label):
+            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
+        levels = self.bfsLevels(self.label_index[source_label])
+        result = DSALinkedList()
+        for i in range(self.getVertexCount()):
+            if levels[i] != -1:
+                result.insertLast(VertexLevelPair(self.labels[i], levels[i]))
+        return result
+
+    """
+    memoryviews of offsets, neighbours and weights for the search loops.
+    Indexing one gives plain Python numbers almost as fast as a list, but
+    nothing is copied, so arrays in shared memory or memory mapped from
+    a snapshot file stay shared.
+    """
+    def _rowViews(self):
+        if self.row_views is None:
+            self.row_views = (DSACSRGraph._rowView(self.offsets), DSACSRGraph._rowView(self.neighbours),
+                              DSACSRGraph._rowView(self.weights))
+        return self.row_views
+
+    """memoryview of a 1-d array in native byte order, copied only if the array isn't already like that."""
+    @staticmethod
+    def _rowView(array):
+        if not array.flags.c_contiguous or not array.dtype.isnative:
+            array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('='))
+        return memoryview(array)
+
+    """Heap driven Dijkstra over the CSR arrays, returns distance and predecessor id arrays."""
+    def _dijkstraHeap(self, source_idx):
+        offsets, neighbours, weights = self._rowViews()
+        distances, predecessors = _dijkstraRows(offsets, neighbours, weights, source_idx)
+        return np.array(distances, dtype=np.float64), np.array(predecessors, dtype=np.int64)
+
+    """Distances from the source to every vertex, as an array indexed by vertex id."""
+    def distancesFrom(self, source_label):
+        distances, predecessors = self._dijkstraHeap(self.getVertexIndex(source_label))
+        return distances
+
+    """Same result as DSAGraph.dijkstra, a DijkstraTree with lazily built paths."""
+    def dijkstra(self, source_label):
+        if not self.hasVertex(source_label):
+            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
+        distances, predecessors = self._dijkstraHeap(self.label_index[source_label])
+        return DijkstraTree(source_label, self.labels, self.label_index, distances, predecessors, self.version)
+
+    """
+    Distances from many sources at once, as a (sources x vertices) float
+    matrix with rows in the order of sources and columns by vertex id.
+    With workers > 1 the sources are shared out over a process pool. The
+    CSR arrays and the result matrix live in shared memory, so workers
+    attach to them instead of receiving a pickled copy of the graph,
+    search them through memoryviews (no private copies) and write their
+    rows straight into the result.
+    """
+    def dijkstra_many(self, sources, workers=1):
+        source_ids = []
+        for label in sources:
+            source_ids.append(self.getVertexIndex(label))   # Raises for unknown hubs before any work
+        result = np.empty((len(source_ids), self.getVertexCount()), dtype=np.float64)
+        if workers is None or workers < 1:
+            raise GraphErrorHandle("workers must be at least 1")
+        if workers == 1 or len(source_ids) < 2:
+            for row in range(len(source_ids)):
+                result[row] = self._dijkstraHeap(source_ids[row])[0]
+            return result
+
+        blocks = []
+        try:
+            specs = []
+            for array in (self.offsets, self.neighbours, self.weights, result):
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                specs.append((block.name, array.dtype.str, array.shape))
+
+            chunk = max(1, len(source_ids) // (workers * 4))   # Several chunks per worker to even out the load
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attachWorker, initargs=(specs,)) as pool:
+                jobs = []
+                for start in range(0, len(source_ids), chunk):
+                    jobs.append(pool.submit(_solveRows, start, source_ids[start:start + chunk]))
+                for job in jobs:
+                    job.result()                                # Re-raises any worker error
+            result[...] = np.ndarray(result.shape, dtype=result.dtype, buffer=blocks[3].buf)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        return result
+
+    """Nearest depot for every hub from one multi source run, as DSAGraph.nearestDepots."""
+    def nearestDepots(self, depots):
+        depot_ids = []
+        for label in depots:
+            if not self.hasVertex(label):
+                raise GraphErrorHandle(f"Depot '{label}' not found")
+            depot_ids.append(self.label_index[label])
+        if not depot_ids:
+            raise GraphErrorHandle("At least one depot is needed")
+        offsets, neighbours, weights = self._rowViews()
+        vertex_count = self.getVertexCount()
+        distances = [float('inf')] * vertex_count
+        predecessors = [-1] * vertex_count
+        nearest = [-1] * vertex_count
+        visited = [False] * vertex_count
+
+        heap = DSAMinHeap(vertex_count)
+        for source_idx in depot_ids:
+            if nearest[source_idx] == -1:
+                distances[source_idx] = 0.0
+                nearest[source_idx] = source_idx
+                heap.insert(source_idx, 0.0)
+        while not heap.is_empty():
+            min_idx = heap.extractMin()
+            visited[min_idx] = True
+            min_dist = distances[min_idx]
+            for pos in range(offsets[min_idx], offsets[min_idx + 1]):
+                n_idx = neighbours[pos]
+                if not visited[n_idx]:
+                    new_dist = min_dist + weights[pos]
+                    if new_dist < distances[n_idx]:
+                        distances[n_idx] = new_dist
+                        predecessors[n_idx] = min_idx
+                        nearest[n_idx] = nearest[min_idx]
+                        heap.insertOrDecrease(n_idx, new_dist)
+        return DepotTree(list(depots), self.labels, self.label_index, np.array(distances, dtype=np.float64),
+                         np.array(predecessors, dtype=np.int64), np.array(nearest, dtype=np.int64), self.version)
+
+    """Hubs reachable from source within max_time, as DSAGraph.reachableWithin."""
+    def reachableWithin(self, source_label, max_time):
+        if not self.hasVertex(source_label):
+            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
+        if max_time < 0:
+            raise GraphErrorHandle("Time budget must not be negative")
+        if self.search_heap is None:
+            self.search_heap = DSAMinHeap(self.getVertexCount())
+        heap = self.search_heap
+        offsets, neighbours, weights = self._rowViews()
+
+        source_idx = self.label_index[source_label]
+        dist = {source_idx: 0.0}
+        order = []
+        heap.insert(source_idx, 0.0)
+        while not heap.is_empty():
+            min_idx = heap.extractMin()
+            order.append(min_idx)
+            min_dist = dist[min_idx]
+            for pos in range(offsets[min_idx], offsets[min_idx + 1]):
+                n_idx = neighbours[pos]
+                new_dist = min_dist + weights[pos]
+                if new_dist <= max_time and new_dist < dist.get(n_idx, float('inf')):
+                    dist[n_idx] = new_dist
+                    heap.insertOrDecrease(n_idx, new_dist)
+        order = np.array(order, dtype=np.int64)
+        distances = np.array([dist[idx] for idx in order.tolist()], dtype=np.float64)
+        return IsochroneResult(source_label, max_time, self.labels[order], distances)
+
+    """Snapshots never change, so a plain dijkstra tree stays current."""
+    def shortestPathTree(self, source_label):
+        return self.dijkstra(source_label)
+
+    """
+    Cycle detection with an explicit stack, same (found, cycle_vertices)
+    result as DSAGraph.DFS_cycle_detection. Each stack frame is a vertex
+    and a cursor into its row, so every edge is looked at once.
+    """
+    def DFS_cycle_detection(self):
+        cycle_vertices = DSALinkedList()
+        vertex_count = self.getVertexCount()
+        offsets, neighbours, weights = self._rowViews()
+        states = [0] * vertex_count              # 0=unvisited, 1=on the stack, 2=finished
+        parents = [-1] * vertex_count
+        cursor = [0] * vertex_count              # Next edge to look at for each vertex
+
+        for root in range(vertex_count):
+            if states[root] != 0:
+                continue
+            stack = [root]
+            states[root] = 1
+            cursor[root] = offsets[root]
+            while stack:
+                vertex_idx = stack[-1]
+                if cursor[vertex_idx] == offsets[vertex_idx + 1]:   # Row exhausted
+                    states[vertex_idx] = 2
+                    stack.pop()
+                    continue
+                neighbour_idx = neighbours[cursor[vertex_idx]]
+                cursor[vertex_idx] += 1
+                if neighbour_idx == parents[vertex_idx]:            # Skip edge back to parent
+                    continue
+                if states[neighbour_idx] == 0:
+                    parents[neighbour_idx] = vertex_idx
+                    states[neighbour_idx] = 1
+                    cursor[neighbour_idx] = offsets[neighbour_idx]
+                    stack.append(neighbour_idx)
+                elif states[neighbour_idx] == 1:                    # Back edge closes a cycle
+                    cycle_vertices.insertLast(self.labels[neighbour_idx])
+                    current_idx = vertex_idx
+                    while current_idx != -1 and current_idx != neighbour_idx:
+                        cycle_vertices.insertLast(self.labels[current_idx])
+                        current_idx = parents[current_idx]
+                    cycle_vertices.insertLast(self.labels[neighbour_idx])
+                    return (True, cycle_vertices)
+        return (False, cycle_vertices)
+
+
+"""
+Dijkstra over CSR rows given as indexable sequences (memoryviews),
+returns distance and predecessor lists. Shared by DSACSRGraph and the
+dijkstra_many workers.
+"""
+def _dijkstraRows(offsets, neighbours, weights, source_idx):
+    vertex_count = len(offsets) - 1
+    distances = [float('inf')] * vertex_count
+    predecessors = [-1] * vertex_count
+    visited = [False] * vertex_count
+
+    heap = DSAMinHeap(vertex_count)
+    distances[source_idx] = 0.0
+    heap.insert(source_idx, 0.0)
+    while not heap.is_empty():
+        min_idx = heap.extractMin()
+        visited[min_idx] = True
+        min_dist = distances[min_idx]
+        for pos in range(offsets[min_idx], offsets[min_idx + 1]):   # Walk the row
+            n_idx = neighbours[pos]
+            if not visited[n_idx]:
+                new_dist = min_dist + weights[pos]
+                if new_dist < distances[n_idx]:
+                    distances[n_idx] = new_dist
+                    predecessors[n_idx] = min_idx
+                    heap.insertOrDecrease(n_idx, new_dist)
+    return distances, predecessors
+
+
+# Worker side of DSACSRGraph.dijkstra_many, kept at module level so the pool can pickle them
+_worker_rows = None           # memoryviews of the shared offsets, neighbours and weights
+_worker_result = None         # Shared result matrix
+_worker_blocks = []           # Shared memory handles kept open for the life of the worker
+
+"""Pool initializer, maps the shared CSR arrays and result matrix into this process without copying them."""
+def _attachWorker(specs):
+    global _worker_rows, _worker_result
+    arrays = []
+    for name, dtype, shape in specs:
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        arrays.append(np.ndarray(shape, dtype=dtype, buffer=block.buf))
+    offsets, neighbours, weights, _worker_result = arrays
+    _worker_rows = (DSACSRGraph._rowView(offsets), DSACSRGraph._rowView(neighbours), DSACSRGraph._rowView(weights))
+
+"""Fill result rows first_row onwards with the distances from each source id."""
+def _solveRows(first_row, source_ids):
+    offsets, neighbours, weights = _worker_rows
+    for i in range(len(source_ids)):
+        _worker_result[first_row + i] = _dijkstraRows(offsets, neighbours, weights, source_ids[i])[0]
+    return len(source_ids)
@@ -0,0 +1,343 @@
+import gc
+import numpy as np
+from Module1.Linked_list import DSALinkedList
+from Module1.MinHeap import DSAMinHeap
+from Module1.GraphVertex import GraphErrorHandle, DijkstraResult
+from Module1.CSRGraph import DSACSRGraph
+
+"""
+Contraction hierarchy index for fast hub to hub travel times.
+Preprocessing contracts the hubs one at a time, least important first
+(see _priority, re-checked when a hub comes off the queue and for
+its neighbours after each contraction). When a
+hub is contracted, a shortcut is added between two of its neighbours
+unless a witness search finds a route at least as short that avoids it.
+Each hub's rank is the order it was contracted in.
+
+Only edges towards higher ranked hubs are kept, as an upward CSR
+(offsets, targets, weights and the contracted middle hub of each
+shortcut, -1 for an original road). Roads are undirected, so the
+downward graph a backward search needs is the upward graph read from
+the target side and one set of arrays serves both directions.
+
+A query runs dijkstra upwards from both ends and stops once neither
+side can beat the best meeting point, which settles a few hundred hubs
+even on very large networks. Shortcuts are unpacked for the path.
+"""
+class DSAContractionHierarchy:
+    MAGIC = b'DSACH002'         # File signature and format version of saved indexes
+    HEADER_DTYPE = np.dtype([('magic', 'S8'), ('vertex_count', '<i8'), ('entry_count', '<i8'),
+                             ('label_kind', '<i8'), ('label_bytes', '<i8'), ('version', '<i8'),
+                             ('fingerprint', '<i8')])
+    WITNESS_LIMIT = 64          # Hubs a witness search may settle before giving up (adds the shortcut)
+
+    def __init__(self, labels, rank, up_offsets, up_targets, up_weights, up_middle, version=0, fingerprint=None):
+        if len(rank) != len(labels) or len(up_offsets) != len(labels) + 1:
+            raise GraphErrorHandle("Rank and offsets must have one entry per vertex")
+        if not (len(up_targets) == len(up_weights) == len(up_middle) == up_offsets[-1]):
+            raise GraphErrorHandle("Upward edge arrays don't match the offsets")
+        self.labels = labels                    # Vertex labels indexed by id
+        self.rank = rank                        # int32, contraction order of each vertex
+        self.up_offsets = up_offsets            # int32, row starts into the upward edge arrays
+        self.up_targets = up_targets            # int32, higher ranked end of each upward edge
+        self.up_weights = up_weights            # float64, travel time of each upward edge
+        self.up_middle = up_middle              # int32, hub a shortcut skips over, -1 for a road
+        self.version = version                  # Graph version the index was built from
+        self.fingerprint = fingerprint          # DSACSRGraph.getFingerprint of the graph it was built from
+        self.label_index = {}
+        for i in range(len(labels)):
+            self.label_index[labels[i]] = i
+        self.row_views = None                   # memoryviews for the query loop, see DSACSRGraph._rowViews
+        self.heaps = None                       # Forward and backward heaps, reused by every query
+
+    """Contract every hub of a CSR snapshot, returns the finished index."""
+    @staticmethod
+    def build(csr, witness_limit=WITNESS_LIMIT):
+        if witness_limit < 1:
+            raise GraphErrorHandle("Witness limit must be at least 1")
+        vertex_count = csr.getVertexCount()
+        offsets, neighbours, weights = csr._rowViews()
+        adjacency = [dict() for _ in range(vertex_count)]   # Remaining graph: neighbour -> (weight, middle)
+        for v in range(vertex_count):
+            row = adjacency[v]
+            for pos in range(offsets[v], offsets[v + 1]):
+                u = neighbours[pos]
+                if u not in row or weights[pos] < row[u][0]:
+                    row[u] = (weights[pos], -1)
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()                            # Many small tuples and dicts, no cycles to collect
+        try:
+            witness_heap = DSAMinHeap(max(vertex_count, 1))
+            deleted = [0] * vertex_count        # Neighbours contracted so far, spreads contraction out
+            level = [0] * vertex_count          # Depth in the hierarchy, keeps it shallow
+            queue = DSAMinHeap(max(vertex_count, 1))
+            for v in range(vertex_count):
+                shortcuts = DSAContractionHierarchy._shortcuts(adjacency, v, witness_heap, witness_limit)
+                queue.insert(v, DSAContractionHierarchy._priority(len(shortcuts), len(adjacency[v]), 0, 0))
+
+            rank = [0] * vertex_count
+            upward = [None] * vertex_count      # (target, weight, middle) edges left when each hub went
+            order = 0
+            while not queue.is_empty():
+                v = queue.extractMin()
+                shortcuts = DSAContractionHierarchy._shortcuts(adjacency, v, witness_heap, witness_limit)
+                priority = DSAContractionHierarchy._priority(len(shortcuts), len(adjacency[v]), deleted[v], level[v])
+                if not queue.is_empty() and priority > queue.peekKey():   # Stale key, try again later
+                    queue.insert(v, priority)
+                    continue
+                rank[v] = order
+                order += 1
+                upward[v] = [(u, edge[0], edge[1]) for u, edge in adjacency[v].items()]
+                for u, w, weight in shortcuts:
+                    existing = adjacency[u].get(w)
+                    if existing is None or weight < existing[0]:   # Never replace a shorter road with a shortcut
+                        adjacency[u][w] = (weight, v)
+                        adjacency[w][u] = (weight, v)
+                for u in adjacency[v]:
+                    del adjacency[u][v]
+                    deleted[u] += 1
+                    level[u] = max(level[u], level[v] + 1)
+                for u in adjacency[v]:          # Neighbours' priorities changed, refresh them now
+                    shortcut_count = len(DSAContractionHierarchy._shortcuts(adjacency, u, witness_heap, witness_limit))
+                    queue.changeKey(u, DSAContractionHierarchy._priority(shortcut_count, len(adjacency[u]),
+                                                                          deleted[u], level[u]))
+                adjacency[v] = {}
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        up_offsets = [0] * (vertex_count + 1)
+        up_targets = []
+        up_weights = []
+        up_middle = []
+        for v in range(vertex_count):
+            for u, weight, middle in upward[v]:
+                up_targets.append(u)
+                up_weights.append(weight)
+                up_middle.append(middle)
+            up_offsets[v + 1] = len(up_targets)
+        return DSAContractionHierarchy(csr.getLabelArray(), np.array(rank, dtype=np.int32),
+                                       np.array(up_offsets, dtype=np.int32), np.array(up_targets, dtype=np.int32),
+                                       np.array(up_weights, dtype=np.float64), np.array(up_middle, dtype=np.int32),
+                                       csr.getVersion(), csr.getFingerprint())
+
+    """
+    Contraction order key, smaller goes first: edge difference (shortcuts
+    added minus roads removed) weighted double, plus contracted neighbours
+    and depth so the contraction is spread evenly over the network.
+    """
+    @staticmethod
+    def _priority(shortcut_count, degree, deleted, level):
+        return 2 * (shortcut_count - degree) + deleted + level
+
+    """Shortcuts (u, w, weight) contracting v would need, checked by bounded witness searches."""
+    @staticmethod
+    def _shortcuts(adjacency, v, heap, witness_limit):
+        shortcuts = []
+        around = list(adjacency[v].items())
+        for i in range(len(around) - 1):
+            u, (weight_u, middle) = around[i]
+            targets = {}                        # Other neighbour -> length of the route through v
+            for j in range(i + 1, len(around)):
+                w, (weight_w, middle) = around[j]
+                targets[w] = weight_u + weight_w
+            limit = max(targets.values())
+            remaining = len(targets)            # Targets not settled yet
+            dist = {u: 0.0}
+            heap.insert(u, 0.0)
+            settled = 0
+            while not heap.is_empty():
+                x = heap.extractMin()
+                x_dist = dist[x]
+                settled += 1
+                if x_dist > limit or settled > witness_limit:
+                    break
+                if x in targets:
+                    remaining -= 1
+                    if remaining == 0:          # Every target has its final distance
+                        break
+                for y, (weight, middle) in adjacency[x].items():
+                    if y != v:
+                        new_dist = x_dist + weight
+                        if new_dist < dist.get(y, float('inf')):
+                            dist[y] = new_dist
+                            heap.insertOrDecrease(y, new_dist)
+            while not heap.is_empty():          # Leave the shared heap empty for the next search
+                heap.extractMin()
+            for w, through in targets.items():
+                if dist.get(w, float('inf')) > through:   # No witness, v is on the only short route
+                    shortcuts.append((u, w, through))
+        return shortcuts
+
+    def getVertexCount(self):
+        return len(self.labels)
+
+    def getEdgeCount(self):
+        return len(self.up_targets)
+
+    def getVersion(self):
+        return self.version
+
+    def getFingerprint(self):
+        return self.fingerprint
+
+    """
+    True if the index was built from this graph (a DSAGraph or a
+    DSACSRGraph) as it is now: same version and same fingerprint. The
+    version alone is not enough, a fresh graph also starts at 0.
+    """
+    def isCurrentFor(self, graph):
+        return (self.version == graph.getVersion() and self.fingerprint is not None
+                and self.fingerprint == graph.getFingerprint())
+
+    def getRank(self, label):
+        return int(self.rank[self._index(label)])
+
+    def getMemoryUsage(self):
+        return (self.rank.nbytes + self.up_offsets.nbytes + self.up_targets.nbytes
+                + self.up_weights.nbytes + self.up_middle.nbytes)
+
+    def _index(self, label):
+        idx = self.label_index.get(label)
+        if idx is None:
+            raise GraphErrorHandle(f"Vertex '{label}' not found")
+        return idx
+
+    """Upward dijkstra from both ends, returns (distance, meeting id, forward preds, backward preds)."""
+    def _query(self, source_idx, target_idx):
+        if self.row_views is None:           # Views of the (possibly memory mapped) arrays, nothing is copied
+            self.row_views = (DSACSRGraph._rowView(self.up_offsets), DSACSRGraph._rowView(self.up_targets),
+                              DSACSRGraph._rowView(self.up_weights))
+            self.heaps = (DSAMinHeap(len(self.labels)), DSAMinHeap(len(self.labels)))
+        offsets, targets, weights = self.row_views
+        heaps = self.heaps
+        dist = ({source_idx: 0.0}, {target_idx: 0.0})
+        pred = ({source_idx: -1}, {target_idx: -1})
+        heaps[0].insert(source_idx, 0.0)
+        heaps[1].insert(target_idx, 0.0)
+        best = float('inf')
+        meet = -1
+
+        while True:
+            side = -1                           # Expand the side with the smaller key still under best
+            if not heaps[0].is_empty() and heaps[0].peekKey() < best:
+                side = 0
+            if not heaps[1].is_empty() and heaps[1].peekKey() < best:
+                if side == -1 or heaps[1].peekKey() < heaps[0].peekKey():
+                    side = 1
+            if side == -1:
+                break
+            own_dist = dist[side]
+            other_dist = dist[1 - side]
+            x = heaps[side].extractMin()
+            x_dist = own_dist[x]
+            if x in other_dist and x_dist + other_dist[x] < best:
+                best = x_dist + other_dist[x]
+                meet = x
+            start = offsets[x]
+            end = offsets[x + 1]
+            stalled = False
+            for pos in range(start, end):       # Stall on demand: a higher hub already gives a shorter
+                y = targets[pos]                # route to x, so nothing found from x can be shortest
+                if y in own_dist and own_dist[y] + weights[pos] < x_dist:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+            for pos in range(start, end):
+                y = targets[pos]
+                new_dist = x_dist + weights[pos]
+                if new_dist < own_dist.get(y, float('inf')):
+                    own_dist[y] = new_dist
+                    pred[side][y] = x
+                    heaps[side].insertOrDecrease(y, new_dist)
+
+        for heap in heaps:                      # Empty the heaps for the next query
+            while not heap.is_empty():
+                heap.extractMin()
+        return best, meet, pred[0], pred[1]
+
+    """Travel time between two hubs, inf when there is no route."""
+    def travelTime(self, label1, label2):
+        return self._query(self._index(label1), self._index(label2))[0]
+
+    """Shortest path as a DijkstraResult, shortcuts unpacked back into roads."""
+    def shortestPath(self, source_label, target_label):
+        source_idx = self._index(source_label)
+        target_idx = self._index(target_label)
+        best, meet, forward, backward = self._query(source_idx, target_idx)
+        path_list = DSALinkedList()
+        if meet == -1:
+            return DijkstraResult(target_label, best, path_list)
+
+        hops = []                               # Upward hops source -> meet, then meet -> target
+        current = meet
+        while forward[current] != -1:
+            hops.insert(0, (forward[current], current))
+            current = forward[current]
+        current = meet
+        while backward[current] != -1:
+            hops.append((current, backward[current]))
+            current = backward[current]
+
+        path_list.insertLast(self.labels[source_idx])
+        for a, b in hops:
+            self._unpack(a, b, path_list)
+        return DijkstraResult(target_label, best, path_list)
+
+    """Append the roads of edge a-b (after a) to path_list, expanding shortcuts recursively."""
+    def _unpack(self, a, b, path_list):
+        stack = [(a, b)]
+        while stack:
+            a, b = stack.pop()
+            low, high = (a, b) if self.rank[a] < self.rank[b] else (b, a)
+            middle = -1
+            for pos in range(self.up_offsets[low], self.up_offsets[low + 1]):
+                if self.up_targets[pos] == high:
+                    middle = self.up_middle[pos]
+                    break
+            if middle == -1:
+                path_list.insertLast(self.labels[b])
+            else:
+                stack.append((middle, b))       # Popped second, so a -> middle comes out first
+                stack.append((a, middle))
+
+    """Save the index in the same sectioned layout as DSACSRGraph.save."""
+    def save(self, path):
+        label_kind, label_arrays = DSACSRGraph._encodeLabels(self.labels)
+        header = np.zeros(1, dtype=DSAContractionHierarchy.HEADER_DTYPE)
+        header['magic'] = DSAContractionHierarchy.MAGIC
+        header['vertex_count'] = len(self.labels)
+        header['entry_count'] = len(self.up_targets)
+        header['label_kind'] = label_kind
+        header['label_bytes'] = label_arrays[-1].nbytes
+        header['version'] = self.version
+        header['fingerprint'] = self.fingerprint if self.fingerprint is not None else 0
+        sections = (header, self.rank.astype('<i4'), self.up_offsets.astype('<i4'), self.up_targets.astype('<i4'),
+                    self.up_weights.astype('<f8'), self.up_middle.astype('<i4')) + label_arrays
+        DSACSRGraph._writeSections(path, sections)
+        return True
+
+    """Open a saved index, memory mapped by default like DSACSRGraph.load."""
+    @staticmethod
+    def load(path, mmap=True):
+        try:
+            header = np.fromfile(path, dtype=DSAContractionHierarchy.HEADER_DTYPE, count=1)
+        except FileNotFoundError:
+            raise GraphErrorHandle(f"{path} was not found")
+        if header.size != 1 or header['magic'][0] != DSAContractionHierarchy.MAGIC:
+            raise GraphErrorHandle(f"{path} is not a contraction hierarchy")
+        vertex_count = int(header['vertex_count'][0])
+        entry_count = int(header['entry_count'][0])
+
+        section = DSACSRGraph._sectionReader(path, DSAContractionHierarchy.HEADER_DTYPE.itemsize, mmap)
+        rank = section('<i4', vertex_count)
+        up_offsets = section('<i4', vertex_count + 1)
+        up_targets = section('<i4', entry_count)
+        up_weights = section('<f8', entry_count)
+        up_middle = section('<i4', entry_count)
+        labels = DSACSRGraph._decodeLabels(int(header['label_kind'][0]), section, vertex_count,
+                                           int(header['label_bytes'][0]))
+        return DSAContractionHierarchy(labels, rank, up_offsets, up_targets, up_weights, up_middle,
+                                       int(header['version'][0]), int(header['fingerprint'][0]))
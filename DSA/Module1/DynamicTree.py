@@ -0,0 +1,113 @@
+from Module1.MinHeap import DSAMinHeap
+from Module1.GraphVertex import DijkstraTree
+
+"""
+Shortest path tree that DSAGraph keeps up to date when a road's travel
+time changes (graph.updateEdgeWeight), instead of rerunning dijkstra.
+- Decrease: run dijkstra from the road's far end, only hubs that get
+  closer are touched.
+- Increase of a tree road: only the subtree hanging below it can get
+  further away. Those hubs are reset, seeded from their best neighbour
+  outside the subtree, then settled with dijkstra inside the subtree.
+- Increase of a road not in the tree changes nothing.
+Structural changes (hubs or roads added/removed) still need a rebuild.
+"""
+class DSADynamicTree(DijkstraTree):
+    def __init__(self, graph, source_label):
+        source_idx = graph.getVertexIndex(source_label)
+        distances, predecessors = graph._dijkstraHeap(source_idx)
+        super().__init__(source_label, graph.getLabelArray(), dict(graph.label_index),
+                         distances, predecessors, graph.getVersion())
+        self.graph = graph
+        self.children = [set() for _ in range(len(distances))]   # Tree children of every vertex
+        for v in range(len(predecessors)):
+            if predecessors[v] != -1:
+                self.children[predecessors[v]].add(v)
+        self.last_repair_count = 0      # Vertices settled by the last repair
+        self.heap = DSAMinHeap(max(len(distances), 1))   # Reused by every repair, _settle leaves it empty
+
+    def getLastRepairCount(self):
+        return self.last_repair_count
+
+    def _setParent(self, vertex, parent):       # Move a vertex under a new tree parent
+        old = self.predecessors[vertex]
+        if old != -1:
+            self.children[old].discard(vertex)
+        self.predecessors[vertex] = parent
+        if parent != -1:
+            self.children[parent].add(vertex)
+
+    """Repair the tree after the road idx1-idx2 changed from old_weight to new_weight."""
+    def edgeWeightChanged(self, idx1, idx2, old_weight, new_weight, version):
+        if new_weight < old_weight:
+            self._repairDecrease(idx1, idx2, new_weight)
+        elif new_weight > old_weight:
+            self._repairIncrease(idx1, idx2)
+        else:
+            self.last_repair_count = 0
+        self.version = version
+
+    def _repairDecrease(self, idx1, idx2, weight):
+        distances = self.distances
+        heap = self.heap
+        for u, v in ((idx1, idx2), (idx2, idx1)):   # The cheaper road may help either end
+            if distances[u] + weight < distances[v]:
+                distances[v] = distances[u] + weight
+                self._setParent(v, u)
+                heap.insertOrDecrease(v, distances[v])
+        self.last_repair_count = self._settle(heap, None)
+
+    def _repairIncrease(self, idx1, idx2):
+        if self.predecessors[idx2] == idx1:         # Find which end hangs below the road
+            child = idx2
+        elif self.predecessors[idx1] == idx2:
+            child = idx1
+        else:
+            self.last_repair_count = 0              # Not a tree road, no distance depends on it
+            return
+
+        affected = set()                            # The whole subtree below the road
+        stack = [child]
+        while stack:
+            vertex = stack.pop()
+            affected.add(vertex)
+            stack.extend(self.children[vertex])
+
+        distances = self.distances
+        for vertex in affected:                     # Forget what we knew about the subtree
+            distances[vertex] = float('inf')
+            self._setParent(vertex, -1)
+
+        heap = self.heap
+        for vertex in affected:                     # Best way in from outside the subtree
+            adj_node = self.graph.vertex_array[vertex].adjacent.head
+            while adj_node:
+                edge = adj_node.value
+                n_idx = edge.vertex.index
+                if n_idx not in affected and distances[n_idx] + edge.weight < distances[vertex]:
+                    distances[vertex] = distances[n_idx] + edge.weight
+                    self._setParent(vertex, n_idx)
+                adj_node = adj_node.next
+            if distances[vertex] != float('inf'):
+                heap.insert(vertex, distances[vertex])
+        self._settle(heap, affected)
+        self.last_repair_count = len(affected)
+
+    """Dijkstra from the queued vertices, only improving vertices in region (everywhere if None)."""
+    def _settle(self, heap, region):
+        distances = self.distances
+        settled = 0
+        while not heap.is_empty():
+            min_idx = heap.extractMin()
+            settled += 1
+            min_dist = distances[min_idx]
+            adj_node = self.graph.vertex_array[min_idx].adjacent.head
+            while adj_node:
+                edge = adj_node.value
+                n_idx = edge.vertex.index
+                if (region is None or n_idx in region) and min_dist + edge.weight < distances[n_idx]:
+                    distances[n_idx] = min_dist + edge.weight
+                    self._setParent(n_idx, min_idx)
+                    heap.insertOrDecrease(n_idx, distances[n_idx])
+                adj_node = adj_node.next
+        return settled
@@ -1,280 +1,950 @@
-import numpy as np
-from Module1.Linked_list import DSALinkedList
-from Module1.Queue import DSASqueue
-from Module1.GraphVertex import DSAGraphVertex, VertexLevelPair, DijkstraResult
-
-class GraphErrorHandle(Exception):
-    pass
-
-"""Graph class using adjacency list for route planning."""
-class DSAGraph:
-    def __init__(self):
-        self.vertices = DSALinkedList()  # Create a linked list to store vertices
-
-    def hasVertex(self, label):        # Check if a vertex exists in the graph
-        current = self.vertices.head   # Start at the head of the vertices list
-        while current:
-            if current.getValue().getLabel() == label:  # Check if current vertex label matches
-                return True                             # Return True if vertex is found
-            current = current.getNext()                 # Move to the next node
-        return False
-
-    def getVertex(self, label):               # Retrieve a vertex by its label
-        current = self.vertices.head          # Start at the head of the vertices list
-        while current:                        # Iterate through the linked list
-            vertex = current.getValue()       # Get the vertex object from the current node
-            if vertex.getLabel() == label:    # Check if the vertex label matches
-                return vertex                 # Return the vertex object
-            current = current.getNext()       # Move to the next node
-        raise GraphErrorHandle(f"Vertex '{label}' not found")
-
-    def addVertex(self, label):             # Add a new vertex to the graph
-        if self.hasVertex(label):           # Check if vertex already exists
-            raise GraphErrorHandle(f"Vertex '{label}' already exists")
-        self.vertices.insertLast(DSAGraphVertex(label))  # Create and insert new vertex at t
-        return True                                      # Return True to indicate success
-
-    def addEdge(self, label1, label2, weight=1):  # Add an undirected edge between two vertices
-        if not self.hasVertex(label1) or not self.hasVertex(label2):  # Check if both vertices exist
-            raise GraphErrorHandle("One or both vertices not found")
-        if label1 == label2:                                          # Check if the edge is a self-loop
-            raise GraphErrorHandle("Cannot create edge to self")
-        if self.isAdjacent(label1, label2):                           # Check if edge already exists
-            raise GraphErrorHandle("Edge already exists")
-        vertex1 = self.getVertex(label1)  # Get the first vertex object
-        vertex2 = self.getVertex(label2)  # Get the second vertex object
-        vertex1.addEdge(vertex2, weight)  # Add edge from vertex1 to vertex2
-        vertex2.addEdge(vertex1, weight)  # Add edge from vertex2 to vertex1 (undirected)
-        return True
-
-    def isAdjacent(self, label1, label2):                             # Check if two vertices are adjacent
-        if not self.hasVertex(label1) or not self.hasVertex(label2):  # Check if both vertices exist
-            return False                                              # Return False if either vertex is missing
-        vertex1 = self.getVertex(label1)                              # Get the first vertex object
-        adj = vertex1.getAdjacent()                                   # Get the adjacency list of vertex1
-        current = adj.head                                            # Start at the head of the adjacency list
-        while current:                                                # Iterate through the adjacency list
-            if current.getValue().getVertex().getLabel() == label2:   # Check if neighbor is vertex2
-                return True
-            current = current.getNext()
-        return False
-
-    def getVertexCount(self):                   # Get the total number of vertices in the graph
-        count = 0                               # Initialize vertex counter
-        current = self.vertices.head            # Start at the head of the vertices list
-        while current:                          # Iterate through the linked list
-            count += 1
-            current = current.getNext()     # Move to the next node
-        return count                        # Return the total count
-
-    def displayAsList(self):                    # Display the graph as an adjacency list
-        if self.getVertexCount() == 0:
-            print("Graph is empty")
-            return
-
-        print("\nAdjacency List:")
-        current = self.vertices.head          # Start at the head of the vertices list
-        while current:                        # Iterate through all vertices
-            vertex = current.getValue()       # Get the current vertex
-            print(f"{vertex.getLabel()}: ", end="")  # Print the vertex label
-            adj = vertex.getAdjacent()               # Get the adjacency list of the vertex
-            adj_node = adj.head                      # Start at the head of the adjacency list
-            while adj_node:                          # Iterate through neighbors
-                edge = adj_node.getValue()           # Get the edge object
-                print(f"{edge.getVertex().getLabel()}({edge.getWeight()}) ", end="")  # Print neighbor and weight
-                adj_node = adj_node.getNext()                                         # Move to the next neighbor
-            print()
-            current = current.getNext()                                               # Move to the next vertex
-
-    """Perform Breadth-First Search to find reachable nodes and their levels."""
-    def BFS(self, source_label):               # Perform Breadth-First Search from a source vertex
-        if not self.hasVertex(source_label):   # Check if source vertex exists
-            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
-
-        vertex_count = self.getVertexCount()                  # Get the total number of vertices
-        vertex_labels = np.empty(vertex_count, dtype=object)  # Create array for vertex labels
-        vertex_levels = np.full(vertex_count, -1, dtype=int)  # Create array for vertex levels, init to -1
-
-        current = self.vertices.head  # Start at the head of the vertices list
-        idx = 0                       # Initialize index for vertex_labels array
-        while current:                # Iterate through vertices
-            vertex_labels[idx] = current.getValue().getLabel()  # Store vertex label in array
-            current.getValue().clearVisited()                   # Clear visited flag for the vertex
-            current = current.getNext()                         # Move to the next vertex
-            idx += 1
-
-        def find_index(labels, target):   # Helper function to find index of a label
-            for i in range(len(labels)):  # Iterate through labels array
-                if labels[i] == target:   # Check if label matches
-                    return i              # Return index if found
-            return -1
-
-        queue = DSASqueue()                    # Create a queue for BFS
-        source = self.getVertex(source_label)  # Get the source vertex object
-        source_idx = find_index(vertex_labels, source_label)  # Find index of source vertex
-        source.setVisited()                                   # Mark source as visited
-        vertex_levels[source_idx] = 0                         # Set source level to 0
-        queue.enqueue(source)                                 # Enqueue the source vertex
-
-        while not queue.is_empty():        # Continue until queue is empty
-            vertex = queue.dequeue()       # Dequeue the next vertex
-            v_label = vertex.getLabel()    # Get the vertex label
-            v_idx = find_index(vertex_labels, v_label)  # Find index of current vertex
-            v_level = vertex_levels[v_idx]              # Get the level of the current vertex
-
-            adj = vertex.getAdjacent()          # Get adjacency list of current vertex
-            adj_node = adj.head                 # Start at head of adjacency list
-            while adj_node:                     # Iterate through neighbors
-                neighbor = adj_node.getValue().getVertex()  # Get neighbor vertex
-                n_label = neighbor.getLabel()               # Get neighbor label
-                n_idx = find_index(vertex_labels, n_label)  # Find index of neighbor
-                if not neighbor.getVisited():               # Check if neighbor is unvisited
-                    neighbor.setVisited()                   # Mark neighbor as visited
-                    vertex_levels[n_idx] = v_level + 1      # Set neighbor level
-                    queue.enqueue(neighbor)                 # Enqueue neighbor
-                adj_node = adj_node.getNext()               # Move to next neighbor
-
-        result = DSALinkedList()         # Create linked list for results
-        for i in range(vertex_count):    # Iterate through all vertices
-            if vertex_levels[i] != -1:   # Check if vertex is reachable
-                result.insertLast(VertexLevelPair(vertex_labels[i], vertex_levels[i]))  # Add vertex and level
-        return result
-
-    """Detect cycles in the graph using Depth-First Search."""
-    def DFS_cycle_detection(self):          # Detect cycles in the graph using DFS
-        cycle_vertices = DSALinkedList()    # Create list to store vertices in a cycle
-        cycle_found = [False]               # Use list to allow modification in nested function
-
-        vertex_count = self.getVertexCount()                  # Get the total number of vertices
-        vertex_labels = np.empty(vertex_count, dtype=object)  # Create array for vertex labels
-
-        current = self.vertices.head  # Start at head of vertices list
-        idx = 0                       # Initialize index for vertex_labels
-        while current:                # Iterate through vertices
-            vertex_labels[idx] = current.getValue().getLabel()  # Store vertex label
-            current = current.getNext()                         # Move to next vertex
-            idx += 1
-
-        vertex_states = np.zeros(vertex_count, dtype=int)       # Create array for vertex states (0=unvisited, 1=visiting, 2=visited)
-        parent_indices = np.full(vertex_count, -1, dtype=int)   # Create array for parent indices, init to -1
-
-        def getLabelIndex(label):              # Helper function to find index of a label
-            for i in range(vertex_count):      # Iterate through labels
-                if vertex_labels[i] == label:  # Check if label matches
-                    return i                   # Return index if found
-            return -1
-
-        def DFSVisit(vertex_idx, parent_idx):  # Recursive DFS function for cycle detection
-            if cycle_found[0]:                 # Check if cycle has already been found
-                return                         # Exit if cycle found
-
-            vertex_states[vertex_idx] = 1             # Mark vertex as visiting
-            vertex_label = vertex_labels[vertex_idx]  # Get vertex label
-
-            vertex = self.getVertex(vertex_label)  # Get vertex object
-            adj = vertex.getAdjacent()             # Get adjacency list
-            adj_node = adj.head                    # Start at head of adjacency list
-
-            while adj_node and not cycle_found[0]:            # Iterate through neighbors
-                edge = adj_node.getValue()  # Get edge object
-                neighbor_label = edge.getVertex().getLabel()  # Get neighbor label
-                neighbor_idx = getLabelIndex(neighbor_label)  # Find neighbor index
-
-                if parent_idx != -1 and neighbor_idx == parent_idx:  # Skip edge back to parent
-                    adj_node = adj_node.getNext()                    # Move to next neighbor
-                    continue
-
-                if vertex_states[neighbor_idx] == 0:           # If neighbor is unvisited
-                    parent_indices[neighbor_idx] = vertex_idx  # Set parent of neighbor
-                    DFSVisit(neighbor_idx, vertex_idx)         # Recursively visit neighbor
-                elif vertex_states[neighbor_idx] == 1:         # If neighbor is visiting (back edge)
-                    cycle_found[0] = True                      # Mark cycle as found
-                    cycle_vertices.insertLast(neighbor_label)  # Add neighbor to cycle
-                    current_idx = vertex_idx                   # Start tracing back from current vertex
-
-                    while current_idx != -1 and current_idx != neighbor_idx:   # Trace parent chain
-                        cycle_vertices.insertLast(vertex_labels[current_idx])  # Add vertex to cycle
-                        current_idx = parent_indices[current_idx]              # Move to parent
-                    cycle_vertices.insertLast(neighbor_label)                  # Close the cycle
-                    return
-                adj_node = adj_node.getNext()                                  # Move to next neighbor
-
-            vertex_states[vertex_idx] = 2  # Mark vertex as visited
-
-        for i in range(vertex_count):                         # Iterate through all vertices
-            if vertex_states[i] == 0 and not cycle_found[0]:  # If vertex is unvisited
-                DFSVisit(i, -1)                               # Start DFS from this vertex
-
-        return (cycle_found[0], cycle_vertices)  # Return cycle status and vertices
-
-    """
-    Dijkstra's algorithm for shortest paths.
-    https://www.geeksforgeeks.org/dijkstras-shortest-path-algorithm-greedy-algo-7/
-    """
-    def dijkstra(self, source_label):         # Implement Dijkstra's algorithm for shortest paths
-        if not self.hasVertex(source_label):
-            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
-
-        vertex_count = self.getVertexCount()                  # Get total number of vertices
-        vertex_labels = np.empty(vertex_count, dtype=object)  # Create array for vertex labels
-        distances = np.full(vertex_count, float('inf'))       # Initialize distances to infinity
-        predecessors = np.empty(vertex_count, dtype=object)   # Create array for predecessors
-        visited = np.zeros(vertex_count, dtype=bool)          # Initialize visited flags
-
-        current = self.vertices.head      # Start at head of vertices list
-        idx = 0                           # Initialize index for vertex_labels
-        while current:                    # Iterate through vertices
-            vertex = current.getValue()   # Get vertex object
-            vertex_labels[idx] = vertex.getLabel()  # Store vertex label
-            current = current.getNext()             # Move to next vertex
-            idx += 1
-
-        def find_index(labels, target):    # Helper function to find index of a label
-            for i in range(len(labels)):   # Iterate through labels
-                if labels[i] == target:    # Check if label matches
-                    return i               # Return index if found
-            return -1
-
-        source_idx = find_index(vertex_labels, source_label)  # Find index of source vertex
-        distances[source_idx] = 0                             # Set source distance to 0
-
-        for _ in range(vertex_count):       # Iterate through all vertices
-            min_dist = float('inf')         # Initialize minimum distance
-            min_idx = -1                    # Initialize index of minimum distance vertex
-            for i in range(vertex_count):   # Find unvisited vertex with minimum distance
-                if not visited[i] and distances[i] < min_dist:  # Check if unvisited and smaller distance
-                    min_dist = distances[i]                     # Update minimum distance
-                    min_idx = i                                 # Update index
-            if min_idx == -1:                                   # If no unvisited vertex found
-                continue                                        # Skip to next iteration
-
-            visited[min_idx] = True                          # Mark vertex as visited
-            vertex = self.getVertex(vertex_labels[min_idx])  # Get vertex object
-            adj = vertex.getAdjacent()                       # Get adjacency list
-            adj_node = adj.head                              # Start at head of adjacency list
-            while adj_node:                                  # Iterate through neighbors
-                edge = adj_node.getValue()                   # Get edge object
-                neighbor = edge.getVertex()                  # Get neighbor vertex
-                n_label = neighbor.getLabel()                # Get neighbor label
-                n_idx = find_index(vertex_labels, n_label)   # Find neighbor index
-                if not visited[n_idx]:                       # If neighbor is unvisited
-                    weight = edge.getWeight()                # Get edge weight
-                    new_dist = distances[min_idx] + weight   # Calculate new distance
-                    if new_dist < distances[n_idx]:          # If new distance is shorter
-                        distances[n_idx] = new_dist          # Update distance
-                        predecessors[n_idx] = vertex_labels[min_idx]  # Update predecessor
-                adj_node = adj_node.getNext()                         # Move to next neighbor
-
-        result = DSALinkedList()         # Create linked list for results
-        for i in range(vertex_count):    # Iterate through all vertices
-            label = vertex_labels[i]     # Get vertex label
-            distance = distances[i]      # Get distance to vertex
-            path_list = DSALinkedList()  # Create list for path
-            if distance != float('inf'):  # If vertex is reachable
-                current_label = label     # Start with current vertex
-                while current_label:      # Trace back predecessors
-                    path_list.insertFirst(current_label)                    # Add vertex to path
-                    current_idx = find_index(vertex_labels, current_label)  # Find index
-                    current_label = predecessors[current_idx]               # Move to predecessor
-            result.insertLast(DijkstraResult(label, distance, path_list))   # Add result
-        return result                                                       # Return list of shortest paths
\ No newline at end of file
+import gc
+import numpy as np
+from Module1.Linked_list import DSALinkedList
+from Module1.Queue import DSACircularQueue
+from Module1.MinHeap import DSAMinHeap
+from Module1.GraphVertex import (DSAGraphVertex, VertexLevelPair, DijkstraResult, DijkstraTree, DepotTree,
+                                 IsochroneResult, GraphErrorHandle)
+from Module1.CSRGraph import DSACSRGraph
+from Module1.UnionFind import DSAUnionFind
+from Module1.DynamicTree import DSADynamicTree
+from Module1.TravelProfile import DSATravelProfile
+from Module1.Landmarks import DSALandmarks
+from Module1.ContractionHierarchy import DSAContractionHierarchy
+from Module1.KShortestPaths import DSAKShortestPaths
+
+"""Graph class using adjacency list for route planning."""
+class DSAGraph:
+    INITIAL_CAPACITY = 16   # Starting size of the vertex array, doubled as the graph grows
+    MATRIX_MAX_BYTES = 256 * 1024 * 1024   # Default memory bound for the all pairs distance matrix
+    FLOYD_WARSHALL_LIMIT = 500             # Up to this many hubs use Floyd-Warshall, above it one dijkstra per hub
+
+    def __init__(self):
+        self.vertices = DSALinkedList()  # Create a linked list to store vertices
+        self.label_index = {}            # Map each vertex label to its dense integer id
+        self.vertex_array = np.empty(DSAGraph.INITIAL_CAPACITY, dtype=object)  # Vertex objects indexed by id
+        self.vertex_count = 0            # Number of vertices, also the next free id
+        self.version = 0                 # Mutation counter, bumped whenever vertices or edges change
+        self.frozen = None               # Last CSR snapshot taken by freeze()
+        self.distance_matrix = None      # Optional hub x hub travel times, see precomputeDistanceMatrix
+        self.matrix_version = -1         # Graph version the matrix was built at
+        self.matrix_max_bytes = DSAGraph.MATRIX_MAX_BYTES
+        self.components = DSAUnionFind()  # Connected components, joined as edges are added
+        self.components_dirty = False     # Set when removals may have split a component
+        self.path_trees = {}              # source label -> DSADynamicTree repaired by updateEdgeWeight
+        self.landmarks = None             # DSALandmarks for astar, see buildLandmarks
+        self.search_heap = None           # Reused by small searches, so they cost no O(V) setup
+        self.search_heap_pair = None      # Forward and backward heaps reused by shortestPath
+        self.profile_period = None        # Shared period of the road profiles, see getProfilePeriod
+        self.period_version = -1          # Graph version profile_period was found at
+
+    def hasVertex(self, label):             # Check if a vertex exists in the graph
+        return label in self.label_index    # O(1) check against the label index
+
+    def getVertex(self, label):             # Retrieve a vertex by its label
+        idx = self.label_index.get(label)   # Look up the dense id of the label
+        if idx is None:
+            raise GraphErrorHandle(f"Vertex '{label}' not found")
+        return self.vertex_array[idx]       # Return the vertex object stored at that id
+
+    def getVertexIndex(self, label):        # Retrieve the dense integer id of a vertex
+        idx = self.label_index.get(label)
+        if idx is None:
+            raise GraphErrorHandle(f"Vertex '{label}' not found")
+        return idx
+
+    def addVertex(self, label):             # Add a new vertex to the graph
+        if self.hasVertex(label):           # Check if vertex already exists
+            raise GraphErrorHandle(f"Vertex '{label}' already exists")
+        if self.vertex_count == len(self.vertex_array):                  # Grow the vertex array when full
+            new_array = np.empty(len(self.vertex_array) * 2, dtype=object)
+            new_array[:self.vertex_count] = self.vertex_array[:self.vertex_count]
+            self.vertex_array = new_array
+        vertex = DSAGraphVertex(label)                # Create the new vertex
+        vertex.setIndex(self.vertex_count)            # Give it the next dense id
+        self.vertices.insertLast(vertex)              # Insert new vertex at the tail of the list
+        self.vertex_array[self.vertex_count] = vertex # Store vertex at its id
+        self.label_index[label] = self.vertex_count   # Record label -> id
+        self.vertex_count += 1
+        self.components.add()                         # New hub is a component of its own
+        self.version += 1                             # Cached results are now stale
+        return True                                   # Return True to indicate success
+
+    """Remove a vertex and every edge touching it, ids after it shift down by one."""
+    def removeVertex(self, label):
+        vertex = self.getVertex(label)      # Raises if the vertex is missing
+        adj_node = vertex.getAdjacent().head
+        while adj_node:                     # Drop the reverse edge held by every neighbour
+            adj_node.getValue().getVertex().removeEdge(label)
+            adj_node = adj_node.getNext()
+
+        node = self.vertices.head           # Find the list node holding the vertex
+        while node.getValue() is not vertex:
+            node = node.getNext()
+        if node.getPrev() is None:          # Unlink it from the doubly linked list
+            self.vertices.head = node.getNext()
+        else:
+            node.getPrev().setNext(node.getNext())
+        if node.getNext() is None:
+            self.vertices.tail = node.getPrev()
+        else:
+            node.getNext().setPrev(node.getPrev())
+
+        idx = vertex.getIndex()
+        del self.label_index[label]
+        for i in range(idx + 1, self.vertex_count):   # Keep ids dense and in list order
+            moved = self.vertex_array[i]
+            moved.setIndex(i - 1)
+            self.vertex_array[i - 1] = moved
+            self.label_index[moved.getLabel()] = i - 1
+        self.vertex_count -= 1
+        self.vertex_array[self.vertex_count] = None
+        self.components_dirty = True                  # Ids shifted and components may have split
+        self.version += 1
+        return True
+
+    def addEdge(self, label1, label2, weight=1):  # Add an undirected edge between two vertices
+        if not self.hasVertex(label1) or not self.hasVertex(label2):  # Check if both vertices exist
+            raise GraphErrorHandle("One or both vertices not found")
+        if label1 == label2:                                          # Check if the edge is a self-loop
+            raise GraphErrorHandle("Cannot create edge to self")
+        if self.isAdjacent(label1, label2):                           # Check if edge already exists
+            raise GraphErrorHandle("Edge already exists")
+        vertex1 = self.getVertex(label1)  # Get the first vertex object
+        vertex2 = self.getVertex(label2)  # Get the second vertex object
+        vertex1.addEdge(vertex2, weight)  # Add edge from vertex1 to vertex2
+        vertex2.addEdge(vertex1, weight)  # Add edge from vertex2 to vertex1 (undirected)
+        if not self.components_dirty:
+            self.components.union(vertex1.getIndex(), vertex2.getIndex())  # Join the two components
+        self.version += 1                 # Cached results are now stale
+        return True
+
+    def removeEdge(self, label1, label2):     # Remove the undirected edge between two vertices
+        if not self.isAdjacent(label1, label2):
+            raise GraphErrorHandle("Edge does not exist")
+        self.getVertex(label1).removeEdge(label2)  # Remove both directions
+        self.getVertex(label2).removeEdge(label1)
+        self.components_dirty = True       # The road may have been the only link, rebuild when asked
+        self.version += 1
+        return True
+
+    """
+    Change the travel time of an existing road. Shortest path trees handed
+    out by shortestPathTree are repaired in place (only the affected part
+    is recomputed) and stay current, anything else sees a new version.
+    """
+    def updateEdgeWeight(self, label1, label2, weight):
+        if weight <= 0:
+            raise GraphErrorHandle("Edge weight must be positive")
+        if not self.isAdjacent(label1, label2):
+            raise GraphErrorHandle("Edge does not exist")
+        vertex1 = self.getVertex(label1)
+        vertex2 = self.getVertex(label2)
+        edge = vertex1.getEdge(label2)
+        old_weight = edge.getWeight()
+        edge.setWeight(weight)                          # Both directions of the undirected road
+        vertex2.getEdge(label1).setWeight(weight)
+
+        old_version = self.version
+        self.version += 1
+        for source in list(self.path_trees):
+            tree = self.path_trees[source]
+            if tree.getVersion() == old_version:        # Tree was current, repair it
+                tree.edgeWeightChanged(vertex1.getIndex(), vertex2.getIndex(), old_weight, weight, self.version)
+            else:
+                del self.path_trees[source]             # Already stale after a structural change
+        return True
+
+    """
+    Give a road a time of day travel time profile (a DSATravelProfile,
+    or None to go back to the static weight). Only dijkstraAt uses it,
+    the static weight still drives every other algorithm.
+    """
+    def setEdgeProfile(self, label1, label2, profile):
+        if profile is not None and not isinstance(profile, DSATravelProfile):
+            raise GraphErrorHandle("Profile must be a DSATravelProfile")
+        if not self.isAdjacent(label1, label2):
+            raise GraphErrorHandle("Edge does not exist")
+        self.getVertex(label1).getEdge(label2).setProfile(profile)   # One shared profile per road
+        self.getVertex(label2).getEdge(label1).setProfile(profile)
+        self.version += 1
+        return True
+
+    def getEdgeProfile(self, label1, label2):
+        if not self.isAdjacent(label1, label2):
+            raise GraphErrorHandle("Edge does not exist")
+        return self.getVertex(label1).getEdge(label2).getProfile()
+
+    """
+    Period every road profile repeats over, so leaving at t and at
+    t + period gives the same travel times. None when no road has a
+    profile, a profile never repeats or two periods differ. One pass
+    over the roads per graph version.
+    """
+    def getProfilePeriod(self):
+        if self.period_version == self.version:
+            return self.profile_period
+        periods = set()
+        for idx in range(self.vertex_count):
+            adj_node = self.vertex_array[idx].adjacent.head
+            while adj_node:
+                profile = adj_node.value.profile
+                if profile is not None:
+                    periods.add(profile.getPeriod())
+                adj_node = adj_node.next
+        self.profile_period = periods.pop() if len(periods) == 1 else None   # A None period stays None
+        self.period_version = self.version
+        return self.profile_period
+
+    """Shortest path tree from a source, kept current across updateEdgeWeight calls."""
+    def shortestPathTree(self, source_label):
+        tree = self.path_trees.get(source_label)
+        if tree is None or tree.getVersion() != self.version:
+            tree = DSADynamicTree(self, source_label)   # Full dijkstra once, repaired after that
+            self.path_trees[source_label] = tree
+        return tree
+
+    def isAdjacent(self, label1, label2):                             # Check if two vertices are adjacent
+        if not self.hasVertex(label1) or not self.hasVertex(label2):  # Check if both vertices exist
+            return False                                              # Return False if either vertex is missing
+        vertex1 = self.getVertex(label1)                              # Get the first vertex object
+        adj = vertex1.getAdjacent()                                   # Get the adjacency list of vertex1
+        current = adj.head                                            # Start at the head of the adjacency list
+        while current:                                                # Iterate through the adjacency list
+            if current.getValue().getVertex().getLabel() == label2:   # Check if neighbor is vertex2
+                return True
+            current = current.getNext()
+        return False
+
+    """
+    Build a graph in one pass from an edge list.
+    source is either a CSV path (source,dest,weight per line, optional
+    header, # comments skipped) or a (sources, dests, weights) tuple of
+    arrays. Self loops, duplicate roads and non-positive weights are
+    checked for the whole list at once with numpy before anything is
+    built. vertices optionally lists hubs first (in order), so hubs
+    without roads can be included. Labels must be all ints or all
+    strings, numpy would otherwise turn 1 into '1' and merge the hubs.
+    """
+    @classmethod
+    def from_edge_list(cls, source, vertices=None):
+        if isinstance(source, str):
+            sources, dests, weights = cls._readEdgeCSV(source)
+        else:
+            if len(source) != 3:
+                raise GraphErrorHandle("Expected (sources, dests, weights) arrays")
+            sources, dests, weights = source
+        listed = [] if vertices is None else list(vertices)   # A string of one letter hubs works too
+        kinds = DSACSRGraph._labelKinds(sources) | DSACSRGraph._labelKinds(dests) | DSACSRGraph._labelKinds(listed)
+        if len(kinds) > 1:
+            raise GraphErrorHandle("Labels mix ints and strings, use one type for every hub")
+        label_type = np.int64 if kinds == {'int'} else str
+        sources = np.asarray(sources, dtype=label_type)
+        dests = np.asarray(dests, dtype=label_type)
+        listed = np.asarray(listed, dtype=label_type)
+        weight_values = np.asarray(weights, dtype=np.float64)
+        if not (len(sources) == len(dests) == len(weight_values)):
+            raise GraphErrorHandle("Source, dest and weight arrays must be the same length")
+
+        bad = np.flatnonzero(~(weight_values > 0))        # Also catches NaN
+        if bad.size > 0:
+            raise GraphErrorHandle(f"{bad.size} edges with non-positive weight, first at row {bad[0]}")
+        loops = np.flatnonzero(sources == dests)
+        if loops.size > 0:
+            raise GraphErrorHandle(f"{loops.size} self loops, first at row {loops[0]} ({sources[loops[0]]})")
+
+        # Dense ids: listed vertices first, then new labels as first seen in the sources, then the dests
+        all_labels = np.concatenate((listed, sources, dests))
+        unique_labels, first_seen, inverse = np.unique(all_labels, return_index=True, return_inverse=True)
+        if len(listed) > 0 and np.unique(listed).size != len(listed):
+            raise GraphErrorHandle("Duplicate labels in the vertex list")
+        order = np.argsort(first_seen, kind='stable')     # Unique labels in first appearance order
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        ids = rank[inverse.ravel()]
+        src_ids = ids[len(listed):len(listed) + len(sources)]
+        dst_ids = ids[len(listed) + len(sources):]
+
+        low = np.minimum(src_ids, dst_ids)                # The same road either way round
+        high = np.maximum(src_ids, dst_ids)
+        keys, counts = np.unique(low * len(order) + high, return_counts=True)
+        if np.any(counts > 1):
+            dup = keys[np.argmax(counts > 1)]
+            raise GraphErrorHandle(f"Duplicate edge {unique_labels[order[dup // len(order)]]}-"
+                                   f"{unique_labels[order[dup % len(order)]]}")
+
+        graph = cls()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()            # Millions of new linked list nodes would trigger the cycle collector over and over
+        try:
+            for label in unique_labels[order].tolist():   # No existence checks needed, labels are unique
+                graph.addVertex(label)
+            vertex_array = graph.vertex_array
+            weight_list = weights.tolist() if isinstance(weights, np.ndarray) else list(weights)  # Python numbers
+            for a, b, weight in zip(src_ids.tolist(), dst_ids.tolist(), weight_list):
+                vertex1 = vertex_array[a]
+                vertex2 = vertex_array[b]
+                vertex1.addEdge(vertex2, weight)          # Same adjacency order as calling addEdge per row
+                vertex2.addEdge(vertex1, weight)
+                graph.components.union(a, b)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        graph.version += 1
+        return graph
+
+    """Parse an edge list CSV into label and weight lists."""
+    @staticmethod
+    def _readEdgeCSV(path):
+        sources = []
+        dests = []
+        weights = []
+        try:
+            with open(path, 'r') as file:
+                first = True
+                for line in file:
+                    line = line.strip()
+                    if not line or line.startswith('#'):
+                        continue
+                    fields = line.split(',')
+                    if len(fields) != 3:
+                        raise GraphErrorHandle(f"Expected source,dest,weight: {line}")
+                    try:
+                        weight = int(fields[2])         # Keep whole number weights as ints
+                    except ValueError:
+                        try:
+                            weight = float(fields[2])
+                        except ValueError:
+                            if first:                   # Header row
+                                first = False
+                                continue
+                            raise GraphErrorHandle(f"Invalid weight: {line}")
+                    first = False
+                    sources.append(fields[0].strip())
+                    dests.append(fields[1].strip())
+                    weights.append(weight)
+        except FileNotFoundError:
+            raise GraphErrorHandle(f"{path} was not found")
+        return sources, dests, weights
+
+    """Rebuild the component index from scratch after removals."""
+    def _rebuildComponents(self):
+        self.components = DSAUnionFind(self.vertex_count)
+        for i in range(self.vertex_count):
+            adj_node = self.vertex_array[i].adjacent.head
+            while adj_node:
+                self.components.union(i, adj_node.value.vertex.index)
+                adj_node = adj_node.next
+        self.components_dirty = False
+
+    """True if there is any route between the two hubs, answered from the component index."""
+    def isReachable(self, label1, label2):
+        idx1 = self.getVertexIndex(label1)
+        idx2 = self.getVertexIndex(label2)
+        if self.components_dirty:
+            self._rebuildComponents()
+        return self.components.connected(idx1, idx2)
+
+    def getComponentCount(self):
+        if self.components_dirty:
+            self._rebuildComponents()
+        return self.components.getComponentCount()
+
+    def getVersion(self):           # Mutation counter, lets callers tell if cached results are stale
+        return self.version
+
+    """Build a new compressed sparse row snapshot of the graph."""
+    def to_csr(self):
+        return DSACSRGraph.fromGraph(self)
+
+    """Distance matrix from many sources, run on the frozen snapshot (see DSACSRGraph.dijkstra_many)."""
+    def dijkstra_many(self, sources, workers=1):
+        return self.freeze().dijkstra_many(sources, workers)
+
+    """CSR snapshot of the current graph, rebuilt only when the version has moved on."""
+    def freeze(self):
+        if self.frozen is None or self.frozen.getVersion() != self.version:
+            self.frozen = self.to_csr()
+        return self.frozen
+
+    """
+    Precompute travel times between every pair of hubs.
+    Small graphs use a vectorised Floyd-Warshall, larger ones run the CSR
+    dijkstra from every hub. Raises if the V x V float64 matrix would need
+    more than max_bytes. The matrix is not updated automatically, call
+    rebuildDistanceMatrix after adding or removing roads.
+    """
+    def precomputeDistanceMatrix(self, max_bytes=MATRIX_MAX_BYTES):
+        vertex_count = self.vertex_count
+        needed = vertex_count * vertex_count * 8
+        if needed > max_bytes:
+            raise GraphErrorHandle(f"Distance matrix needs {needed} bytes, over the {max_bytes} byte limit")
+        self.matrix_max_bytes = max_bytes
+        csr = self.freeze()
+
+        if vertex_count <= DSAGraph.FLOYD_WARSHALL_LIMIT:
+            matrix = np.full((vertex_count, vertex_count), np.inf)
+            rows = np.repeat(np.arange(vertex_count), np.diff(csr.offsets))   # Source id of every CSR entry
+            matrix[rows, csr.neighbours] = csr.weights
+            np.fill_diagonal(matrix, 0.0)
+            for k in range(vertex_count):         # Allow paths through hub k, one whole matrix at a time
+                np.minimum(matrix, matrix[:, k, np.newaxis] + matrix[np.newaxis, k, :], out=matrix)
+        else:
+            matrix = np.empty((vertex_count, vertex_count))
+            for i in range(vertex_count):         # One dijkstra per hub over the CSR snapshot
+                matrix[i], predecessors = csr._dijkstraHeap(i)
+
+        self.distance_matrix = matrix
+        self.matrix_version = self.version
+        return True
+
+    """Recompute the distance matrix after the roads have changed."""
+    def rebuildDistanceMatrix(self):
+        return self.precomputeDistanceMatrix(self.matrix_max_bytes)
+
+    def hasDistanceMatrix(self):
+        return self.distance_matrix is not None
+
+    def isDistanceMatrixStale(self):
+        return self.matrix_version != self.version
+
+    """Travel time between two hubs read from the precomputed matrix."""
+    def getTravelTime(self, label1, label2):
+        if self.distance_matrix is None:
+            raise GraphErrorHandle("No distance matrix, call precomputeDistanceMatrix first")
+        if self.isDistanceMatrixStale():
+            raise GraphErrorHandle("Distance matrix is stale, call rebuildDistanceMatrix")
+        return float(self.distance_matrix[self.getVertexIndex(label1), self.getVertexIndex(label2)])
+
+    """Preprocess count landmarks for astar, count dijkstra runs over the CSR snapshot."""
+    def buildLandmarks(self, count=8):
+        self.landmarks = DSALandmarks.build(self.freeze(), count)
+        return True
+
+    def hasLandmarks(self):
+        return self.landmarks is not None
+
+    def isLandmarksStale(self):
+        return self.landmarks.getVersion() != self.version
+
+    """
+    Point to point shortest path with A* guided by the landmark lower
+    bounds (ALT). Same DijkstraResult as shortestPath, but only the
+    hubs that can be on a short route to the target get settled.
+    """
+    def astar(self, source_label, target_label):
+        if not self.hasVertex(source_label):
+            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
+        if not self.hasVertex(target_label):
+            raise GraphErrorHandle(f"Target vertex '{target_label}' not found")
+        if self.landmarks is None:
+            raise GraphErrorHandle("No landmarks, call buildLandmarks first")
+        if self.isLandmarksStale():
+            raise GraphErrorHandle("Landmarks are stale, call buildLandmarks again")
+
+        target_idx = self.label_index[target_label]
+        bound = self.landmarks.boundTo(target_idx)
+        distance, pred, settled = self._astar(self.label_index[source_label], target_idx, bound)
+        path_list = DSALinkedList()
+        if distance != float('inf'):
+            current_idx = target_idx
+            while current_idx != -1:
+                path_list.insertFirst(self.vertex_array[current_idx].getLabel())
+                current_idx = pred[current_idx]
+        return DijkstraResult(target_label, distance, path_list)
+
+    """
+    A* from source to target, returns (distance, predecessor dict, settled
+    vertex count). bound gives the lower bound to the target of a vertex
+    id, asked once when the vertex is first reached, None gives plain
+    dijkstra stopped at the target. Runs on the shared search heap.
+    """
+    def _astar(self, source_idx, target_idx, bound):
+        dist = {source_idx: 0.0}           # Only touched vertices are stored
+        pred = {source_idx: -1}
+        bounds = {source_idx: bound(source_idx) if bound else 0.0}
+        settled = set()
+        heap = self._searchHeap()          # Keyed on distance so far plus lower bound
+        heap.insert(source_idx, bounds[source_idx])
+
+        while not heap.is_empty():
+            min_idx = heap.extractMin()
+            settled.add(min_idx)
+            if min_idx == target_idx:
+                heap.clear()
+                return dist[target_idx], pred, len(settled)
+            min_dist = dist[min_idx]
+            adj_node = self.vertex_array[min_idx].adjacent.head
+            while adj_node:
+                edge = adj_node.value
+                n_idx = edge.vertex.index
+                if n_idx not in settled:
+                    new_dist = min_dist + edge.weight
+                    if new_dist < dist.get(n_idx, float('inf')):
+                        dist[n_idx] = new_dist
+                        pred[n_idx] = min_idx
+                        n_bound = bounds.get(n_idx)
+                        if n_bound is None:
+                            n_bound = bounds[n_idx] = bound(n_idx) if bound else 0.0
+                        heap.insertOrDecrease(n_idx, new_dist + n_bound)
+                adj_node = adj_node.next
+        return float('inf'), pred, len(settled)
+
+    """
+    Contraction hierarchy index of the current graph for fast hub to hub
+    travel times (see DSAContractionHierarchy). The index is returned, not
+    kept, it can be saved and reloaded and is valid while isCurrentFor(graph)
+    holds (same version and fingerprint).
+    """
+    def buildContractionHierarchy(self, witness_limit=DSAContractionHierarchy.WITNESS_LIMIT):
+        return DSAContractionHierarchy.build(self.freeze(), witness_limit)
+
+    """Hash of the graph's current snapshot, see DSACSRGraph.getFingerprint."""
+    def getFingerprint(self):
+        return self.freeze().getFingerprint()
+
+    """Save a binary CSR snapshot of the graph, see DSACSRGraph.save."""
+    def saveSnapshot(self, path):
+        return self.freeze().save(path)
+
+    """Open a saved snapshot as a read only DSACSRGraph backed by numpy memmaps."""
+    @staticmethod
+    def loadSnapshot(path, mmap=True):
+        return DSACSRGraph.load(path, mmap)
+
+    def getVertexCount(self):       # Get the total number of vertices in the graph
+        return self.vertex_count    # Kept up to date by addVertex/removeVertex
+
+    def displayAsList(self):                    # Display the graph as an adjacency list
+        if self.getVertexCount() == 0:
+            print("Graph is empty")
+            return
+
+        print("\nAdjacency List:")
+        current = self.vertices.head          # Start at the head of the vertices list
+        while current:                        # Iterate through all vertices
+            vertex = current.getValue()       # Get the current vertex
+            print(f"{vertex.getLabel()}: ", end="")  # Print the vertex label
+            adj = vertex.getAdjacent()               # Get the adjacency list of the vertex
+            adj_node = adj.head                      # Start at the head of the adjacency list
+            while adj_node:                          # Iterate through neighbors
+                edge = adj_node.getValue()           # Get the edge object
+                print(f"{edge.getVertex().getLabel()}({edge.getWeight()}) ", end="")  # Print neighbor and weight
+                adj_node = adj_node.getNext()                                         # Move to the next neighbor
+            print()
+            current = current.getNext()                                               # Move to the next vertex
+
+    """Perform Breadth-First Search to find reachable nodes and their levels."""
+    def BFS(self, source_label):               # Perform Breadth-First Search from a source vertex
+        if not self.hasVertex(source_label):   # Check if source vertex exists
+            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
+
+        vertex_count = self.getVertexCount()                  # Get the total number of vertices
+        vertex_labels = np.empty(vertex_count, dtype=object)  # Create array for vertex labels
+        vertex_levels = np.full(vertex_count, -1, dtype=int)  # Create array for vertex levels, init to -1
+
+        current = self.vertices.head  # Start at the head of the vertices list
+        idx = 0                       # Initialize index for vertex_labels array
+        while current:                # Iterate through vertices
+            vertex_labels[idx] = current.getValue().getLabel()  # Store vertex label in array
+            current.getValue().clearVisited()                   # Clear visited flag for the vertex
+            current = current.getNext()                         # Move to the next vertex
+            idx += 1
+
+        queue = DSACircularQueue()             # Create a growable circular queue for BFS
+        source = self.getVertex(source_label)  # Get the source vertex object
+        source_idx = source.getIndex()                        # Index of source vertex, ids follow list order
+        source.setVisited()                                   # Mark source as visited
+        vertex_levels[source_idx] = 0                         # Set source level to 0
+        queue.enqueue(source)                                 # Enqueue the source vertex
+
+        while not queue.is_empty():        # Continue until queue is empty
+            vertex = queue.dequeue()       # Dequeue the next vertex
+            v_idx = vertex.getIndex()      # Get the index of the current vertex
+            v_level = vertex_levels[v_idx]              # Get the level of the current vertex
+
+            adj = vertex.getAdjacent()          # Get adjacency list of current vertex
+            adj_node = adj.head                 # Start at head of adjacency list
+            while adj_node:                     # Iterate through neighbors
+                neighbor = adj_node.getValue().getVertex()  # Get neighbor vertex
+                n_idx = neighbor.getIndex()                 # Get index of neighbor
+                if not neighbor.getVisited():               # Check if neighbor is unvisited
+                    neighbor.setVisited()                   # Mark neighbor as visited
+                    vertex_levels[n_idx] = v_level + 1      # Set neighbor level
+                    queue.enqueue(neighbor)                 # Enqueue neighbor
+                adj_node = adj_node.getNext()               # Move to next neighbor
+
+        result = DSALinkedList()         # Create linked list for results
+        for i in range(vertex_count):    # Iterate through all vertices
+            if vertex_levels[i] != -1:   # Check if vertex is reachable
+                result.insertLast(VertexLevelPair(vertex_labels[i], vertex_levels[i]))  # Add vertex and level
+        return result
+
+    """
+    Detect cycles in the graph using Depth-First Search.
+    Uses an explicit stack instead of recursion so long road chains can't hit
+    the recursion limit. Each stack frame is a vertex id plus a cursor into
+    its adjacency list, so every edge is looked at once, O(V + E).
+    """
+    def DFS_cycle_detection(self):          # Detect cycles in the graph using DFS
+        cycle_vertices = DSALinkedList()    # Create list to store vertices in a cycle
+        vertex_count = self.vertex_count
+        vertex_states = [0] * vertex_count  # 0=unvisited, 1=visiting (on the stack), 2=visited
+        parent_indices = [-1] * vertex_count  # Parent id of each vertex in the DFS tree
+        cursor = [None] * vertex_count        # Next adjacency node to look at for each vertex
+
+        for root in range(vertex_count):      # Start a DFS from every unvisited vertex
+            if vertex_states[root] != 0:
+                continue
+            vertex_states[root] = 1
+            cursor[root] = self.vertex_array[root].adjacent.head
+            stack = [root]
+            while stack:
+                vertex_idx = stack[-1]              # Vertex on top of the stack
+                adj_node = cursor[vertex_idx]
+                if adj_node is None:                # All neighbours done
+                    vertex_states[vertex_idx] = 2   # Mark vertex as visited
+                    stack.pop()
+                    continue
+                cursor[vertex_idx] = adj_node.next  # Advance the cursor before descending
+                neighbor_idx = adj_node.value.vertex.index
+
+                if neighbor_idx == parent_indices[vertex_idx]:  # Skip edge back to parent
+                    continue
+                if vertex_states[neighbor_idx] == 0:            # If neighbor is unvisited
+                    parent_indices[neighbor_idx] = vertex_idx   # Set parent of neighbor
+                    vertex_states[neighbor_idx] = 1             # Mark it visiting and descend
+                    cursor[neighbor_idx] = self.vertex_array[neighbor_idx].adjacent.head
+                    stack.append(neighbor_idx)
+                elif vertex_states[neighbor_idx] == 1:          # If neighbor is visiting (back edge)
+                    neighbor_label = self.vertex_array[neighbor_idx].getLabel()
+                    cycle_vertices.insertLast(neighbor_label)   # Add neighbor to cycle
+                    current_idx = vertex_idx                    # Start tracing back from current vertex
+                    while current_idx != -1 and current_idx != neighbor_idx:             # Trace parent chain
+                        cycle_vertices.insertLast(self.vertex_array[current_idx].getLabel())  # Add vertex to cycle
+                        current_idx = parent_indices[current_idx]                        # Move to parent
+                    cycle_vertices.insertLast(neighbor_label)   # Close the cycle
+                    return (True, cycle_vertices)
+
+        return (False, cycle_vertices)  # Return cycle status and vertices
+
+    """Fill an array with the vertex labels, indexed by vertex id."""
+    def getLabelArray(self):
+        vertex_labels = np.empty(self.vertex_count, dtype=object)  # Create array for vertex labels
+        for i in range(self.vertex_count):                         # Ids are dense, 0 to count - 1
+            vertex_labels[i] = self.vertex_array[i].getLabel()
+        return vertex_labels
+
+    """
+    Dijkstra's algorithm for shortest paths.
+    https://www.geeksforgeeks.org/dijkstras-shortest-path-algorithm-greedy-algo-7/
+    engine="heap" (default) uses an indexed min heap, O((V + E) log V).
+    engine="scan" is the original O(V^2) minimum scan.
+    Returns a DijkstraTree, paths are only built for the hubs asked for.
+    """
+    def dijkstra(self, source_label, engine="heap"):   # Implement Dijkstra's algorithm for shortest paths
+        if not self.hasVertex(source_label):
+            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
+
+        source_idx = self.getVertexIndex(source_label)  # Find index of source vertex
+        if engine == "heap":
+            distances, predecessors = self._dijkstraHeap(source_idx)
+        elif engine == "scan":
+            distances, predecessors = self._dijkstraScan(source_idx)
+        else:
+            raise GraphErrorHandle(f"Unknown dijkstra engine '{engine}'")
+
+        # Copy of the label index so the tree stays valid if vertices are removed later
+        return DijkstraTree(source_label, self.getLabelArray(), dict(self.label_index), distances, predecessors, self.version)
+
+    """Distances from the source to every vertex, as an array indexed by vertex id."""
+    def distancesFrom(self, source_label):
+        if not self.hasVertex(source_label):
+            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
+        distances, predecessors = self._dijkstraHeap(self.label_index[source_label])
+        return distances
+
+    """
+    Time dependent dijkstra leaving the source at departure_time. Roads
+    with a profile cost whatever they take at the time the van reaches
+    them, other roads their static weight. Distances in the returned tree
+    are travel times from the departure, not clock times.
+    """
+    def dijkstraAt(self, source_label, departure_time):
+        if not self.hasVertex(source_label):
+            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
+        if departure_time < 0:
+            raise GraphErrorHandle("Departure time must not be negative")
+        distances, predecessors = self._dijkstraTimeDependent(self.label_index[source_label], departure_time)
+        return DijkstraTree(source_label, self.getLabelArray(), dict(self.label_index), distances, predecessors, self.version)
+
+    """Same loop as _dijkstraHeap on arrival times, one profile lookup per relaxed road."""
+    def _dijkstraTimeDependent(self, source_idx, departure_time):
+        vertex_count = self.vertex_count
+        arrivals = [float('inf')] * vertex_count
+        predecessors = [-1] * vertex_count
+        visited = [False] * vertex_count
+
+        heap = DSAMinHeap(vertex_count)    # Keyed on earliest arrival time
+        arrivals[source_idx] = float(departure_time)
+        heap.insert(source_idx, arrivals[source_idx])
+
+        while not heap.is_empty():
+            min_idx = heap.extractMin()
+            visited[min_idx] = True
+            now = arrivals[min_idx]
+            adj_node = self.vertex_array[min_idx].adjacent.head
+            while adj_node:
+                edge = adj_node.value
+                n_idx = edge.vertex.index
+                if not visited[n_idx]:
+                    if edge.profile is None:
+                        arrival = now + edge.weight
+                    else:
+                        arrival = edge.profile.arrivalTime(now)   # Binary search of the road's profile
+                    if arrival < arrivals[n_idx]:
+                        arrivals[n_idx] = arrival
+                        predecessors[n_idx] = min_idx
+                        heap.insertOrDecrease(n_idx, arrival)
+                adj_node = adj_node.next
+        distances = np.array(arrivals, dtype=float) - departure_time   # inf stays inf
+        return distances, np.array(predecessors, dtype=np.int64)
+
+    """Heap driven Dijkstra, returns distance and predecessor id arrays."""
+    def _dijkstraHeap(self, source_idx):
+        vertex_count = self.vertex_count
+        distances = [float('inf')] * vertex_count   # Lists in the hot loop, converted to arrays at the end
+        predecessors = [-1] * vertex_count          # Predecessor id, -1 for none
+        visited = [False] * vertex_count            # Settled flags
+
+        heap = DSAMinHeap(vertex_count)    # Priority queue keyed on tentative distance
+        distances[source_idx] = 0.0
+        heap.insert(source_idx, 0.0)
+
+        while not heap.is_empty():
+            min_idx = heap.extractMin()    # Closest unsettled vertex
+            visited[min_idx] = True
+            min_dist = distances[min_idx]
+            adj_node = self.vertex_array[min_idx].adjacent.head
+            while adj_node:                                  # Relax every edge out of it
+                edge = adj_node.value
+                n_idx = edge.vertex.index
+                if not visited[n_idx]:
+                    new_dist = min_dist + edge.weight
+                    if new_dist < distances[n_idx]:          # Shorter path found
+                        distances[n_idx] = new_dist
+                        predecessors[n_idx] = min_idx
+                        heap.insertOrDecrease(n_idx, new_dist)
+                adj_node = adj_node.next
+        return np.array(distances, dtype=float), np.array(predecessors, dtype=np.int64)
+
+    """
+    Nearest depot and distance to it for every hub, from one dijkstra run
+    seeded with all depots at distance 0 instead of one run per depot.
+    Returns a DepotTree, hubs tied between depots go to either of them.
+    """
+    def nearestDepots(self, depots):
+        depot_ids = []
+        for label in depots:
+            if not self.hasVertex(label):
+                raise GraphErrorHandle(f"Depot '{label}' not found")
+            depot_ids.append(self.label_index[label])
+        if not depot_ids:
+            raise GraphErrorHandle("At least one depot is needed")
+        distances, predecessors, nearest = self._dijkstraMultiSource(depot_ids)
+        return DepotTree(list(depots), self.getLabelArray(), dict(self.label_index),
+                         distances, predecessors, nearest, self.version)
+
+    """_dijkstraHeap with several sources, also tracking which source each vertex was reached from."""
+    def _dijkstraMultiSource(self, source_ids):
+        vertex_count = self.vertex_count
+        distances = [float('inf')] * vertex_count
+        predecessors = [-1] * vertex_count
+        nearest = [-1] * vertex_count               # Source id each vertex hangs off
+        visited = [False] * vertex_count
+
+        heap = DSAMinHeap(vertex_count)
+        for source_idx in source_ids:
+            if nearest[source_idx] == -1:           # Ignore a depot listed twice
+                distances[source_idx] = 0.0
+                nearest[source_idx] = source_idx
+                heap.insert(source_idx, 0.0)
+
+        while not heap.is_empty():
+            min_idx = heap.extractMin()
+            visited[min_idx] = True
+            min_dist = distances[min_idx]
+            owner = nearest[min_idx]
+            adj_node = self.vertex_array[min_idx].adjacent.head
+            while adj_node:
+                edge = adj_node.value
+                n_idx = edge.vertex.index
+                if not visited[n_idx]:
+                    new_dist = min_dist + edge.weight
+                    if new_dist < distances[n_idx]:
+                        distances[n_idx] = new_dist
+                        predecessors[n_idx] = min_idx
+                        nearest[n_idx] = owner      # Same depot as the vertex it was reached from
+                        heap.insertOrDecrease(n_idx, new_dist)
+                adj_node = adj_node.next
+        return (np.array(distances, dtype=float), np.array(predecessors, dtype=np.int64),
+                np.array(nearest, dtype=np.int64))
+
+    """Shared empty heap for local searches, which must leave it empty again."""
+    def _searchHeap(self):
+        if self.search_heap is None or self.search_heap.capacity < self.vertex_count:
+            self.search_heap = DSAMinHeap(max(self.vertex_count, 1))
+        return self.search_heap
+
+    """Shared pair of empty heaps for bidirectional searches, left empty again like _searchHeap."""
+    def _searchHeapPair(self):
+        if self.search_heap_pair is None or self.search_heap_pair[0].capacity < self.vertex_count:
+            self.search_heap_pair = (DSAMinHeap(max(self.vertex_count, 1)), DSAMinHeap(max(self.vertex_count, 1)))
+        return self.search_heap_pair
+
+    """
+    The k shortest loopless routes between two hubs, best first, as a
+    linked list of DijkstraResult (see DSAKShortestPaths). Fewer than k
+    come back when there are no more routes.
+    """
+    def kShortestPaths(self, source_label, target_label, k):
+        if k < 1:
+            raise GraphErrorHandle("k must be at least 1")
+        return DSAKShortestPaths(self, source_label, target_label).getPaths(k)
+
+    """
+    Hubs a courier can reach from source within max_time, with their
+    travel times. Dijkstra stops as soon as the next hub is over budget
+    and never queues roads that would go over it, and distances are kept
+    in a dict, so the cost grows with the number of hubs reached rather
+    than the size of the network.
+    """
+    def reachableWithin(self, source_label, max_time):
+        if not self.hasVertex(source_label):
+            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
+        if max_time < 0:
+            raise GraphErrorHandle("Time budget must not be negative")
+        heap = self._searchHeap()
+        source_idx = self.label_index[source_label]
+        dist = {source_idx: 0.0}
+        order = []                          # Settled vertex ids, closest first
+        heap.insert(source_idx, 0.0)
+        while not heap.is_empty():
+            min_idx = heap.extractMin()
+            order.append(min_idx)
+            min_dist = dist[min_idx]
+            adj_node = self.vertex_array[min_idx].adjacent.head
+            while adj_node:
+                edge = adj_node.value
+                n_idx = edge.vertex.index
+                new_dist = min_dist + edge.weight
+                if new_dist <= max_time and new_dist < dist.get(n_idx, float('inf')):
+                    dist[n_idx] = new_dist  # Settled vertices never improve, so they are never requeued
+                    heap.insertOrDecrease(n_idx, new_dist)
+                adj_node = adj_node.next
+
+        labels = np.empty(len(order), dtype=object)
+        distances = np.empty(len(order), dtype=float)
+        for i in range(len(order)):
+            labels[i] = self.vertex_array[order[i]].getLabel()
+            distances[i] = dist[order[i]]
+        return IsochroneResult(source_label, max_time, labels, distances)
+
+    """
+    Point to point shortest path using bidirectional Dijkstra.
+    A forward search from the source and a backward search from the target
+    run in turn and stop once the best meeting distance can't be improved,
+    so only the neighbourhood between the two hubs is settled.
+    Returns a DijkstraResult for the target (distance inf and an empty path
+    when it can't be reached).
+    """
+    def shortestPath(self, source_label, target_label):
+        if not self.hasVertex(source_label):
+            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
+        if not self.hasVertex(target_label):
+            raise GraphErrorHandle(f"Target vertex '{target_label}' not found")
+
+        source_idx = self.label_index[source_label]
+        target_idx = self.label_index[target_label]
+        path_list = DSALinkedList()
+        if source_idx == target_idx:
+            path_list.insertFirst(source_label)
+            return DijkstraResult(target_label, 0.0, path_list)
+
+        dist = ({source_idx: 0.0}, {target_idx: 0.0})   # Tentative distances, forward and backward
+        pred = ({source_idx: -1}, {target_idx: -1})     # Predecessors towards each end
+        heaps = self._searchHeapPair()
+        heaps[0].insert(source_idx, 0.0)
+        heaps[1].insert(target_idx, 0.0)
+        best = float('inf')     # Length of the best source -> target path seen so far
+        meet = -1               # Vertex where that path joins the two searches
+
+        while not heaps[0].is_empty() and not heaps[1].is_empty():
+            if heaps[0].peekKey() + heaps[1].peekKey() >= best:   # Neither side can improve on best
+                break
+            side = 0 if heaps[0].peekKey() <= heaps[1].peekKey() else 1  # Expand the closer frontier
+            own_dist = dist[side]
+            other_dist = dist[1 - side]
+            min_idx = heaps[side].extractMin()
+            min_dist = own_dist[min_idx]
+            adj_node = self.vertex_array[min_idx].adjacent.head
+            while adj_node:
+                edge = adj_node.value
+                n_idx = edge.vertex.index
+                new_dist = min_dist + edge.weight
+                if new_dist < own_dist.get(n_idx, float('inf')):   # Shorter path found
+                    own_dist[n_idx] = new_dist
+                    pred[side][n_idx] = min_idx
+                    heaps[side].insertOrDecrease(n_idx, new_dist)
+                if n_idx in other_dist and own_dist[n_idx] + other_dist[n_idx] < best:
+                    best = own_dist[n_idx] + other_dist[n_idx]     # The searches touch at n_idx
+                    meet = n_idx
+                adj_node = adj_node.next
+        heaps[0].clear()                        # Leave the shared heaps empty
+        heaps[1].clear()
+
+        if meet != -1:
+            current_idx = meet                  # Walk back to the source
+            while current_idx != -1:
+                path_list.insertFirst(self.vertex_array[current_idx].getLabel())
+                current_idx = pred[0][current_idx]
+            current_idx = pred[1][meet]         # Then forward to the target
+            while current_idx != -1:
+                path_list.insertLast(self.vertex_array[current_idx].getLabel())
+                current_idx = pred[1][current_idx]
+        return DijkstraResult(target_label, best, path_list)
+
+    """Original O(V^2) Dijkstra, scans every distance to pick the next vertex."""
+    def _dijkstraScan(self, source_idx):
+        vertex_count = self.getVertexCount()                  # Get total number of vertices
+        distances = np.full(vertex_count, float('inf'))       # Initialize distances to infinity
+        predecessors = np.full(vertex_count, -1, dtype=np.int64)  # Create array for predecessor ids
+        visited = np.zeros(vertex_count, dtype=bool)          # Initialize visited flags
+        distances[source_idx] = 0                             # Set source distance to 0
+
+        for _ in range(vertex_count):       # Iterate through all vertices
+            min_dist = float('inf')         # Initialize minimum distance
+            min_idx = -1                    # Initialize index of minimum distance vertex
+            for i in range(vertex_count):   # Find unvisited vertex with minimum distance
+                if not visited[i] and distances[i] < min_dist:  # Check if unvisited and smaller distance
+                    min_dist = distances[i]                     # Update minimum distance
+                    min_idx = i                                 # Update index
+            if min_idx == -1:                                   # If no unvisited vertex found
+                continue                                        # Skip to next iteration
+
+            visited[min_idx] = True                          # Mark vertex as visited
+            vertex = self.vertex_array[min_idx]              # Get vertex object by id
+            adj = vertex.getAdjacent()                       # Get adjacency list
+            adj_node = adj.head                              # Start at head of adjacency list
+            while adj_node:                                  # Iterate through neighbors
+                edge = adj_node.getValue()                   # Get edge object
+                neighbor = edge.getVertex()                  # Get neighbor vertex
+                n_idx = neighbor.getIndex()                  # Get neighbor index
+                if not visited[n_idx]:                       # If neighbor is unvisited
+                    weight = edge.getWeight()                # Get edge weight
+                    new_dist = distances[min_idx] + weight   # Calculate new distance
+                    if new_dist < distances[n_idx]:          # If new distance is shorter
+                        distances[n_idx] = new_dist          # Update distance
+                        predecessors[n_idx] = min_idx        # Update predecessor
+                adj_node = adj_node.getNext()                # Move to next neighbor
+        return distances, predecessors
@@ -1,124 +1,258 @@
-from Module1.Linked_list import DSALinkedList
-
-class GraphErrorHandle(Exception):
-    pass
-
-class Edge:
-    def __init__(self, source, dest, weight):
-        self.source = source
-        self.dest = dest
-        self.weight = weight
-
-    def getSource(self):
-        return self.source
-
-    def getDest(self):
-        return self.dest
-
-    def getWeight(self):
-        return self.weight
-
-class DSAEdge:
-    def __init__(self, vertex, weight):
-        self.vertex = vertex
-        self.weight = weight
-
-    def getVertex(self):
-        return self.vertex
-
-    def getWeight(self):
-        return self.weight
-
-# used in BFS
-class VertexLevelPair:
-    def __init__(self, label, level):
-        self.label = label
-        self.level = level
-
-    def getLabel(self):
-        return self.label
-
-    def getLevel(self):
-        return self.level
-
-class VertexParentPair:
-    def __init__(self, label, parent):
-        self.label = label
-        self.parent = parent
-
-    def getLabel(self):
-        return self.label
-
-    def getParent(self):
-        return self.parent
-
-class DijkstraResult:
-    def __init__(self, label, dist, pathList):
-        self.label = label
-        self.dist = dist
-        self.pathList = pathList
-
-    def getLabel(self):
-        return self.label
-
-    def getDistance(self):
-        return self.dist
-
-    def getPath(self):
-        return self.pathList
-
-class DSAGraphVertex:
-    def __init__(self, label):
-        self.label = label
-        self.adjacent = DSALinkedList()
-        self.visited = False
-        self.distance = float('inf')
-        self.predecessor = None
-
-    def getLabel(self):
-        return self.label
-
-    def getAdjacent(self):
-        return self.adjacent
-
-    def addEdge(self, vertex, weight):
-        if weight <= 0:
-            raise GraphErrorHandle("Edge weight must be positive")
-        self.adjacent.insertLast(DSAEdge(vertex, weight))
-
-    def removeEdge(self, vertex_label):
-        prev = None
-        current = self.adjacent.head
-        while current:
-            if current.getValue().getVertex().getLabel() == vertex_label:
-                if prev is None:
-                    self.adjacent.head = current.getNext()
-                else:
-                    prev.setNext(current.getNext())
-                if current.getNext() is None:
-                    self.adjacent.tail = prev
-                return True
-            prev = current
-            current = current.getNext()
-        return False
-
-    def setVisited(self):
-        self.visited = True
-
-    def clearVisited(self):
-        self.visited = False
-
-    def getVisited(self):
-        return self.visited
-
-    def setDistance(self, distance):
-        self.distance = distance
-
-    def getDistance(self):
-        return self.distance
-
-    def setPredecessor(self, vertex):
-        self.predecessor = vertex
-
-    def getPredecessor(self):
+from Module1.Linked_list import DSALinkedList
+
+class GraphErrorHandle(Exception):
+    pass
+
+class Edge:
+    def __init__(self, source, dest, weight):
+        self.source = source
+        self.dest = dest
+        self.weight = weight
+
+    def getSource(self):
+        return self.source
+
+    def getDest(self):
+        return self.dest
+
+    def getWeight(self):
+        return self.weight
+
+class DSAEdge:
+    def __init__(self, vertex, weight):
+        self.vertex = vertex
+        self.weight = weight
+        self.profile = None          # Optional DSATravelProfile, used by time dependent dijkstra
+
+    def getVertex(self):
+        return self.vertex
+
+    def getWeight(self):
+        return self.weight
+
+    def setWeight(self, weight):
+        if weight <= 0:
+            raise GraphErrorHandle("Edge weight must be positive")
+        self.weight = weight
+
+    def getProfile(self):
+        return self.profile
+
+    def setProfile(self, profile):
+        self.profile = profile
+
+# used in BFS
+class VertexLevelPair:
+    def __init__(self, label, level):
+        self.label = label
+        self.level = level
+
+    def getLabel(self):
+        return self.label
+
+    def getLevel(self):
+        return self.level
+
+class VertexParentPair:
+    def __init__(self, label, parent):
+        self.label = label
+        self.parent = parent
+
+    def getLabel(self):
+        return self.label
+
+    def getParent(self):
+        return self.parent
+
+"""Hubs reachable within a time budget, closest first, as parallel label and distance arrays."""
+class IsochroneResult:
+    def __init__(self, source, max_time, labels, distances):
+        self.source = source
+        self.max_time = max_time
+        self.labels = labels                # object array of hub labels
+        self.distances = distances          # float array, non decreasing
+
+    def getSource(self):
+        return self.source
+
+    def getMaxTime(self):
+        return self.max_time
+
+    def getLabels(self):
+        return self.labels
+
+    def getDistances(self):
+        return self.distances
+
+    def getCount(self):
+        return len(self.labels)
+
+class DijkstraResult:
+    def __init__(self, label, dist, pathList, tree=None):
+        self.label = label
+        self.dist = dist
+        self.pathList = pathList
+        self.tree = tree            # When pathList is None the path is built from this DijkstraTree
+
+    def getLabel(self):
+        return self.label
+
+    def getDistance(self):
+        return self.dist
+
+    def getPath(self):
+        if self.pathList is None:
+            self.pathList = self.tree.getPath(self.label)
+        return self.pathList
+
+"""
+Compact shortest path tree returned by dijkstra.
+Holds the distance and predecessor id arrays, paths are only walked
+and turned into linked lists when getPath is called for a hub.
+"""
+class DijkstraTree:
+    def __init__(self, source, labels, label_index, distances, predecessors, version=0):
+        self.source = source
+        self.version = version              # Graph version the tree was computed for
+        self.labels = labels                # Vertex labels indexed by id
+        self.label_index = label_index      # label -> id
+        self.distances = distances          # float array, inf where unreachable
+        self.predecessors = predecessors    # int array, -1 for the source and unreachable hubs
+
+    def getSource(self):
+        return self.source
+
+    def getVersion(self):
+        return self.version
+
+    def getVertexCount(self):
+        return len(self.labels)
+
+    def getDistances(self):
+        return self.distances
+
+    def getPredecessors(self):
+        return self.predecessors
+
+    def _index(self, label):
+        idx = self.label_index.get(label)
+        if idx is None:
+            raise GraphErrorHandle(f"Vertex '{label}' not found")
+        return idx
+
+    def getDistance(self, label):
+        return self.distances[self._index(label)]
+
+    def getPath(self, label):               # Walk predecessors back to the source
+        path_list = DSALinkedList()
+        current_idx = self._index(label)
+        if self.distances[current_idx] != float('inf'):
+            while current_idx != -1:
+                path_list.insertFirst(self.labels[current_idx])
+                current_idx = self.predecessors[current_idx]
+        return path_list
+
+    def getResult(self, label):
+        return DijkstraResult(label, self.getDistance(label), None, self)
+
+    """Linked list of DijkstraResult in vertex order, paths are built lazily."""
+    def getResults(self):
+        result = DSALinkedList()
+        for i in range(len(self.labels)):
+            result.insertLast(DijkstraResult(self.labels[i], self.distances[i], None, self))
+        return result
+
+"""
+Result of one multi source dijkstra seeded with every depot. Distances
+are to the nearest depot, paths start at that depot and nearest holds
+its vertex id (-1 where no depot can reach the hub).
+"""
+class DepotTree(DijkstraTree):
+    def __init__(self, depots, labels, label_index, distances, predecessors, nearest, version=0):
+        super().__init__(depots, labels, label_index, distances, predecessors, version)
+        self.nearest = nearest              # int array, vertex id of the closest depot
+
+    def getDepots(self):
+        return self.source
+
+    def getNearestDepots(self):
+        return self.nearest
+
+    def getNearestDepot(self, label):       # Label of the closest depot, None if unreachable
+        depot_idx = self.nearest[self._index(label)]
+        if depot_idx == -1:
+            return None
+        return self.labels[depot_idx]
+
+class DSAGraphVertex:
+    def __init__(self, label):
+        self.label = label
+        self.index = -1             # Dense id assigned by DSAGraph
+        self.adjacent = DSALinkedList()
+        self.visited = False
+        self.distance = float('inf')
+        self.predecessor = None
+
+    def getLabel(self):
+        return self.label
+
+    def getIndex(self):
+        return self.index
+
+    def setIndex(self, index):
+        self.index = index
+
+    def getAdjacent(self):
+        return self.adjacent
+
+    def addEdge(self, vertex, weight):
+        if weight <= 0:
+            raise GraphErrorHandle("Edge weight must be positive")
+        self.adjacent.insertLast(DSAEdge(vertex, weight))
+
+    def getEdge(self, vertex_label):        # Edge to the neighbour with this label, None if not adjacent
+        current = self.adjacent.head
+        while current:
+            if current.getValue().getVertex().getLabel() == vertex_label:
+                return current.getValue()
+            current = current.getNext()
+        return None
+
+    def removeEdge(self, vertex_label):
+        prev = None
+        current = self.adjacent.head
+        while current:
+            if current.getValue().getVertex().getLabel() == vertex_label:
+                if prev is None:
+                    self.adjacent.head = current.getNext()
+                else:
+                    prev.setNext(current.getNext())
+                if current.getNext() is None:
+                    self.adjacent.tail = prev
+                else:
+                    current.getNext().setPrev(prev)
+                return True
+            prev = current
+            current = current.getNext()
+        return False
+
+    def setVisited(self):
+        self.visited = True
+
+    def clearVisited(self):
+        self.visited = False
+
+    def getVisited(self):
+        return self.visited
+
+    def setDistance(self, distance):
+        self.distance = distance
+
+    def getDistance(self):
+        return self.distance
+
+    def setPredecessor(self, vertex):
+        self.predecessor = vertex
+
+    def getPredecessor(self):
         return self.predecessor
\ No newline at end of file
@@ -0,0 +1,169 @@
+import heapq
+from Module1.Linked_list import DSALinkedList
+from Module1.GraphVertex import GraphErrorHandle, DijkstraResult
+
+"""
+Yen's k shortest loopless paths between two hubs of a DSAGraph, best
+first. Each new path comes from the previous one: for every hub on it
+(the spur) keep the route up to there (the root), block the roads that
+earlier paths with the same root took next, and find the best way on
+to the target avoiding the root. The cheapest of those candidates is
+the next path.
+
+Work shared between spur searches:
+- One dijkstra from the target gives the exact distance from every hub
+  to it. When the tree route from a spur avoids everything blocked, it
+  is already the best spur path and no search runs; otherwise it is the
+  A* lower bound for the spur search (blocking only makes routes longer).
+- Root costs are prefix sums kept with each accepted path.
+- Spur results are cached on (root, blocked roads), and spurs before
+  the point where a path left its parent are skipped (Lawler), as
+  those candidates were already generated from the parent.
+Paths stay valid for the graph version they were found on.
+"""
+class DSAKShortestPaths:
+    def __init__(self, graph, source_label, target_label):
+        if not graph.hasVertex(source_label):
+            raise GraphErrorHandle(f"Source vertex '{source_label}' not found")
+        if not graph.hasVertex(target_label):
+            raise GraphErrorHandle(f"Target vertex '{target_label}' not found")
+        self.graph = graph
+        self.version = graph.getVersion()
+        self.source = graph.getVertexIndex(source_label)
+        self.target = graph.getVertexIndex(target_label)
+        to_target, towards = graph._dijkstraHeap(self.target)   # Undirected, so this is every hub -> target
+        self.to_target = to_target.tolist()
+        self.towards = towards.tolist()         # Next hub on the tree route to the target
+        self.accepted = []                      # (vertex ids, prefix costs, deviation index), best first
+        self.candidates = []                    # heapq of (cost, counter, ids, prefix costs, deviation index)
+        self.seen = set()                       # Id tuples of every path accepted or queued
+        self.spur_cache = {}                    # (root ids, blocked roads) -> spur ids or None
+        self.counter = 0                        # Tie breaker, keeps equal cost candidates in found order
+        self.expanded = 0                       # Accepted paths whose spurs have been queued
+
+    def getVersion(self):
+        return self.version
+
+    """Cost of every edge along a path of ids, as running totals starting at 0."""
+    def _prefixCosts(self, path):
+        prefix = [0.0]
+        for i in range(len(path) - 1):
+            prefix.append(prefix[-1] + self.graph.vertex_array[path[i]].getEdge(
+                self.graph.vertex_array[path[i + 1]].getLabel()).getWeight())
+        return prefix
+
+    """Tree route from spur to the target if it avoids the blocked hubs and roads, else None."""
+    def _treeRoute(self, spur, blocked_vertices, blocked_next):
+        route = [spur]
+        current = spur
+        while current != self.target:
+            next_idx = self.towards[current]
+            if next_idx in blocked_vertices or (current == spur and next_idx in blocked_next):
+                return None
+            route.append(next_idx)
+            current = next_idx
+        return route
+
+    """A* from spur to the target avoiding blocked hubs and the blocked first roads, ids or None."""
+    def _spurSearch(self, spur, blocked_vertices, blocked_next):
+        graph = self.graph
+        to_target = self.to_target
+        heap = graph._searchHeap()
+        dist = {spur: 0.0}
+        pred = {spur: -1}
+        settled = set()
+        heap.insert(spur, to_target[spur])
+        found = False
+        while not heap.is_empty():
+            min_idx = heap.extractMin()
+            if min_idx == self.target:
+                found = True
+                break
+            settled.add(min_idx)
+            min_dist = dist[min_idx]
+            adj_node = graph.vertex_array[min_idx].adjacent.head
+            while adj_node:
+                edge = adj_node.value
+                n_idx = edge.vertex.index
+                if (n_idx not in settled and n_idx not in blocked_vertices and to_target[n_idx] != float('inf')
+                        and not (min_idx == spur and n_idx in blocked_next)):
+                    new_dist = min_dist + edge.weight
+                    if new_dist < dist.get(n_idx, float('inf')):
+                        dist[n_idx] = new_dist
+                        pred[n_idx] = min_idx
+                        heap.insertOrDecrease(n_idx, new_dist + to_target[n_idx])
+                adj_node = adj_node.next
+        while not heap.is_empty():              # Leave the shared heap empty
+            heap.extractMin()
+        if not found:
+            return None
+        route = []
+        current = self.target
+        while current != -1:
+            route.append(current)
+            current = pred[current]
+        route.reverse()
+        return route
+
+    """Queue the spur candidates of the most recently accepted path."""
+    def _expand(self):
+        path, prefix, deviation = self.accepted[-1]
+        for i in range(deviation, len(path) - 1):
+            root = tuple(path[:i + 1])
+            spur = path[i]
+            blocked_next = set()                # Roads out of the spur already used after this root
+            for other, other_prefix, other_deviation in self.accepted:
+                if len(other) > i + 1 and tuple(other[:i + 1]) == root:
+                    blocked_next.add(other[i + 1])
+            key = (root, frozenset(blocked_next))
+            if key in self.spur_cache:
+                spur_route = self.spur_cache[key]
+            else:
+                blocked_vertices = set(root[:-1])
+                spur_route = self._treeRoute(spur, blocked_vertices, blocked_next)
+                if spur_route is None:
+                    spur_route = self._spurSearch(spur, blocked_vertices, blocked_next)
+                self.spur_cache[key] = spur_route
+            if spur_route is None:
+                continue
+            candidate = path[:i] + spur_route
+            if tuple(candidate) in self.seen:
+                continue
+            self.seen.add(tuple(candidate))
+            candidate_prefix = prefix[:i + 1] + self._prefixCosts(spur_route)[1:]   # Reuse the root's costs
+            for j in range(i + 1, len(candidate_prefix)):
+                candidate_prefix[j] += prefix[i]
+            self.counter += 1
+            heapq.heappush(self.candidates, (candidate_prefix[-1], self.counter, candidate, candidate_prefix, i))
+
+    """Find the next best path, returns False when there are no more."""
+    def _advance(self):
+        if self.graph.getVersion() != self.version:
+            raise GraphErrorHandle("Graph changed since the paths were ranked")
+        if not self.accepted:
+            if self.to_target[self.source] == float('inf'):
+                return False
+            path = self._treeRoute(self.source, set(), set())
+            self.seen.add(tuple(path))
+            self.accepted.append((path, self._prefixCosts(path), 0))
+            return True
+        if self.expanded < len(self.accepted):
+            self._expand()
+            self.expanded = len(self.accepted)
+        if not self.candidates:
+            return False
+        cost, counter, path, prefix, deviation = heapq.heappop(self.candidates)
+        self.accepted.append((path, prefix, deviation))
+        return True
+
+    """The k best loopless paths as a linked list of DijkstraResult, fewer if the graph has fewer."""
+    def getPaths(self, k):
+        while len(self.accepted) < k and self._advance():
+            pass
+        result = DSALinkedList()
+        for path, prefix, deviation in self.accepted[:k]:
+            path_list = DSALinkedList()
+            for idx in path:
+                path_list.insertLast(self.graph.vertex_array[idx].getLabel())
+            result.insertLast(DijkstraResult(self.graph.vertex_array[self.target].getLabel(), prefix[-1], path_list))
+        return result
@@ -0,0 +1,76 @@
+import numpy as np
+from Module1.GraphVertex import GraphErrorHandle
+
+"""
+Landmark distances for A* (ALT). For a landmark L the triangle
+inequality gives d(v, t) >= |d(L, t) - d(L, v)| on an undirected graph,
+so the largest of these over all landmarks is a lower bound on the
+distance still to go. Landmarks are picked far apart (each new one is
+the hub furthest from those already chosen), which tightens the bounds
+for most queries. Memory is k * V floats.
+"""
+class DSALandmarks:
+    def __init__(self, landmark_ids, distances, version=0):
+        self.landmark_ids = landmark_ids        # int64, vertex id of each landmark
+        self.distances = distances              # float64 (k x V), row i from landmark i
+        self.version = version                  # Graph version the distances belong to
+        self.rows = None                        # memoryview per landmark row, see boundTo
+
+    """Pick count landmarks by farthest point selection over a CSR snapshot, one dijkstra each."""
+    @staticmethod
+    def build(csr, count):
+        vertex_count = csr.getVertexCount()
+        if vertex_count == 0:
+            raise GraphErrorHandle("Graph is empty")
+        if count < 1:
+            raise GraphErrorHandle("Need at least one landmark")
+        count = min(count, vertex_count)
+        landmark_ids = np.empty(count, dtype=np.int64)
+        distances = np.empty((count, vertex_count), dtype=np.float64)
+
+        start, predecessors = csr._dijkstraHeap(0)
+        closest = np.full(vertex_count, np.inf)  # Distance to the nearest landmark chosen so far
+        candidate = start                        # First landmark is the hub furthest from hub 0
+        for i in range(count):
+            far = np.where(np.isinf(candidate), np.finfo(np.float64).max, candidate)  # Unreached hubs first
+            far[landmark_ids[:i]] = -1.0
+            landmark_ids[i] = int(np.argmax(far))
+            distances[i], predecessors = csr._dijkstraHeap(int(landmark_ids[i]))
+            np.minimum(closest, distances[i], out=closest)
+            candidate = closest
+        return DSALandmarks(landmark_ids, distances, csr.getVersion())
+
+    def getVersion(self):
+        return self.version
+
+    def getCount(self):
+        return len(self.landmark_ids)
+
+    def getLandmarkIds(self):
+        return self.landmark_ids
+
+    def getMemoryUsage(self):
+        return self.distances.nbytes + self.landmark_ids.nbytes
+
+    """
+    Lower bound to target_idx as a function of one vertex id, so A* only
+    pays O(k) for each hub it reaches. Landmarks
+    that cannot reach the target are left out, one that cannot reach the
+    vertex gives no bound for it.
+    """
+    def boundTo(self, target_idx):
+        if self.rows is None:
+            self.rows = [memoryview(row) for row in self.distances]   # Plain floats out, no numpy scalars
+        inf = float('inf')
+        pairs = [(row, row[target_idx]) for row in self.rows if row[target_idx] != inf]
+
+        def bound(vertex_idx):
+            best = 0.0
+            for row, to_target in pairs:
+                from_landmark = row[vertex_idx]
+                if from_landmark != inf:
+                    gap = abs(to_target - from_landmark)
+                    if gap > best:
+                        best = gap
+            return best
+        return bound
@@ -0,0 +1,129 @@
+"""
+Indexed min heap used as the priority queue for Dijkstra.
+Items are vertex ids (0 to capacity - 1), each with a float key.
+A position array maps every id to its slot in the heap, so
+decreaseKey can find an item in O(1) and fix it in O(log n).
+The arrays are plain lists, numpy scalar indexing is several times
+slower inside the trickle loops.
+"""
+class DSAMinHeap:
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.heap = [0] * capacity                 # Vertex ids in heap order
+        self.keys = [float('inf')] * capacity      # Key of each vertex id
+        self.position = [-1] * capacity            # Slot of each id in the heap, -1 if absent
+        self.count = 0
+        self.capacity = capacity
+
+    def is_empty(self):
+        return self.count == 0
+
+    def get_count(self):
+        return self.count
+
+    def contains(self, item):
+        return self.position[item] != -1      # Check if the id is currently in the heap
+
+    def getKey(self, item):
+        return self.keys[item]
+
+    def peekKey(self):
+        if self.count == 0:
+            raise Exception("Heap is empty")
+        return self.keys[self.heap[0]]      # Smallest key without removing it
+
+    """Empty the heap in O(count), so one heap can be reused by many small searches."""
+    def clear(self):
+        for i in range(self.count):
+            self.position[self.heap[i]] = -1
+        self.count = 0
+
+    """Insert an id with the given key."""
+    def insert(self, item, key):
+        if self.position[item] != -1:
+            raise Exception("Item already in heap")
+        self.keys[item] = key               # Record the key of the id
+        self.heap[self.count] = item        # Place id at the end of the heap
+        self.position[item] = self.count
+        self.count += 1
+        self.trickleUp(self.count - 1)      # Restore min heap property by bubbling up
+
+    """Lower the key of an id already in the heap."""
+    def decreaseKey(self, item, key):
+        if key > self.keys[item]:
+            raise Exception("New key is larger than current key")
+        self.keys[item] = key
+        self.trickleUp(self.position[item])
+
+    """Insert the id, or lower its key if it is already queued with a larger one."""
+    def insertOrDecrease(self, item, key):
+        if self.position[item] == -1:
+            self.insert(item, key)
+        elif key < self.keys[item]:
+            self.decreaseKey(item, key)
+
+    """Set the key of an id already in the heap, up or down."""
+    def changeKey(self, item, key):
+        old = self.keys[item]
+        self.keys[item] = key
+        if key < old:
+            self.trickleUp(self.position[item])
+        else:
+            self.trickleDown(self.position[item])
+
+    """Remove and return the id with the smallest key."""
+    def extractMin(self):
+        if self.count == 0:
+            raise Exception("Heap is empty")
+        root = self.heap[0]                      # Store the root (smallest key) id
+        self.count -= 1
+        last = self.heap[self.count]             # Move last id to the root
+        self.heap[0] = last
+        self.position[last] = 0
+        self.position[root] = -1                 # Root is no longer queued
+        if self.count > 0:
+            self.trickleDown(0)                  # Restore min heap property by bubbling down
+        return root
+
+    """Bubble up a slot to restore the min heap property."""
+    def trickleUp(self, index):
+        heap = self.heap
+        keys = self.keys
+        position = self.position
+        item = heap[index]                       # Id being moved up
+        key = keys[item]
+        while index > 0:
+            parentIdx = (index - 1) // 2
+            parent = heap[parentIdx]
+            if keys[parent] <= key:              # Stop once the parent is not larger
+                break
+            heap[index] = parent                 # Shift parent down one level
+            position[parent] = index
+            index = parentIdx
+        heap[index] = item
+        position[item] = index
+
+    """Bubble down a slot to restore the min heap property."""
+    def trickleDown(self, index):
+        heap = self.heap
+        keys = self.keys
+        position = self.position
+        count = self.count
+        item = heap[index]                       # Id being moved down
+        key = keys[item]
+        lChildIdx = 2 * index + 1
+        while lChildIdx < count:
+            smallIdx = lChildIdx                 # Assume left child is smaller
+            rChildIdx = lChildIdx + 1
+            if rChildIdx < count and keys[heap[rChildIdx]] < keys[heap[lChildIdx]]:
+                smallIdx = rChildIdx
+            child = heap[smallIdx]
+            if keys[child] >= key:               # Stop once the smaller child is not smaller
+                break
+            heap[index] = child                  # Shift child up one level
+            position[child] = index
+            index = smallIdx
+            lChildIdx = 2 * index + 1
+        heap[index] = item
+        position[item] = index
@@ -1,156 +1,830 @@
-import numpy as np
-from Module1.Graph import DSAGraph, GraphErrorHandle
-from Module1.Linked_list import DSALinkedList
-from Module1.GraphVertex import Edge
-
-def testModule():
-    testGraph = DSAGraph()
-
-    nodes = DSALinkedList()
-    edges = DSALinkedList()
-
-    # Node population
-    nodes.insertLast('A')
-    nodes.insertLast('B')
-    nodes.insertLast('C')
-    nodes.insertLast('D')
-    nodes.insertLast('E')
-    nodes.insertLast('F')
-    nodes.insertLast('G')
-    nodes.insertLast('H')
-
-    # populate edges as edge objects
-    edges.insertLast(Edge('A', 'B', 5))
-    edges.insertLast(Edge('A', 'C', 3))
-    edges.insertLast(Edge('B', 'D', 4))
-    edges.insertLast(Edge('B', 'E', 6))
-    edges.insertLast(Edge('C', 'F', 2))
-    edges.insertLast(Edge('C', 'G', 7))
-    edges.insertLast(Edge('D', 'E', 3))
-    edges.insertLast(Edge('E', 'F', 4))
-    edges.insertLast(Edge('F', 'G', 5))
-    edges.insertLast(Edge('D', 'F', 2))
-    edges.insertLast(Edge('B', 'G', 8))
-
-    # add nodes and edges to the graph
-    try:
-        current = nodes.head
-        while current:
-            testGraph.addVertex(current.getValue())
-            current = current.getNext()
-
-        current = edges.head
-        while current:
-            edge = current.getValue()
-            testGraph.addEdge(edge.getSource(), edge.getDest(), edge.getWeight())
-            current = current.getNext()
-    except GraphErrorHandle as e:
-        print(f"Error setting up the test graph {e}")
-        return
-
-    # display graph
-    print("CityDrop logistics network")
-    print("===============================")
-    testGraph.displayAsList()
-
-    #BFS: reachable zones from node A
-    print("\n1) reachable delivery zones from warehouse A")
-    print("==============================================")
-    try:
-        bfsResult = testGraph.BFS('A')
-        print("Hub\tLevel (Number of hops)")
-        print("-----------------------")
-        reachable = np.empty(testGraph.getVertexCount(), dtype=object)
-        idx = 0
-        current = bfsResult.head
-        while current:
-            pair = current.getValue()
-            reachable[idx] = pair.getLabel()
-            print(f"{pair.getLabel()}\t{pair.getLevel()}")
-            current = current.getNext()
-            idx += 1
-        reachable = reachable[:idx]
-
-        allHubs = np.empty(testGraph.getVertexCount(), dtype=object)
-        idx = 0
-        current = testGraph.vertices.head
-        while current:
-            allHubs[idx] = current.getValue().getLabel()
-            current = current.getNext()
-            idx += 1
-
-        unreachable = np.empty(allHubs.size, dtype=object)
-        unreach_count = 0
-
-        for i in range(allHubs.size):
-            hub = allHubs[i]
-            is_reachable = False
-
-            j = 0
-            while j < reachable.size and not is_reachable:
-                if hub == reachable[j]:
-                    is_reachable = True
-                j += 1
-
-            if not is_reachable:
-                unreachable[unreach_count] = hub
-                unreach_count += 1
-
-        unreachable = unreachable[:unreach_count]
-
-        if unreachable.size > 0:
-            print("\nUnreachable hubs:", ", ".join(unreachable))
-    except GraphErrorHandle as e:
-        print(f"BFS error: {e}")
-
-    # DFS: cycle detection
-    print("\n2) Cycle detection in the delivery network")
-    print("==============================================")
-    try:
-        hasCycle, cycleNodes = testGraph.DFS_cycle_detection()
-        if hasCycle:
-            print("Inefficient loops have been found in the delivery network")
-            cycleArray = np.empty(cycleNodes.get_count(), dtype=object)
-            idx = 0
-            current = cycleNodes.head
-            while current:
-                cycleArray[idx] = str(current.getValue())
-                current = current.getNext()
-                idx += 1
-            print(f"Cycle involves hubs: {' -> '.join(cycleArray)}")
-        else:
-            print("No cycles were detected within the network")
-    except GraphErrorHandle as e:
-        print(f"DFS error: {e}")
-
-    # shortest paths from A
-    print("\n3) Shortest delivery routes from warehouse A")
-    print("=================================================")
-    try:
-        shortestPath = testGraph.dijkstra('A')
-        print("Hub\tTravel time\tRoute")
-        print("-----------------------------")
-        current = shortestPath.head
-        while current:
-            hubInfo = current.getValue()
-            hub = hubInfo.getLabel()
-            distance = hubInfo.getDistance()
-            pathList = hubInfo.getPath()
-            pathArray = np.empty(pathList.get_count(), dtype=object)
-            idx = 0
-            pathCurrent = pathList.head
-            while pathCurrent:
-                pathArray[idx] = str(pathCurrent.getValue())
-                pathCurrent = pathCurrent.getNext()
-                idx += 1
-            route = " -> ".join(pathArray) if pathArray.size > 0 else "NA"
-            time_str = f"{distance} mins" if distance != float('inf') else "Unreachable"
-            print(f"{hub}\t{time_str}\t{route}")
-            current = current.getNext()
-    except GraphErrorHandle as e:
-        print(f"Shortest path error {e}")
-
-
-if __name__ == "__main__":
-    testModule()
-
+import numpy as np
+import os
+import sys
+import tempfile
+import time
+from Module1.Graph import DSAGraph, GraphErrorHandle
+from Module1.Linked_list import DSALinkedList
+from Module1.GraphVertex import Edge
+from Module1.CSRGraph import DSACSRGraph
+from Module1.TravelProfile import DSATravelProfile
+from Module1.ContractionHierarchy import DSAContractionHierarchy
+from Module1.Queue import DSACircularQueue
+
+def testModule():
+    testGraph = DSAGraph()
+
+    nodes = DSALinkedList()
+    edges = DSALinkedList()
+
+    # Node population
+    nodes.insertLast('A')
+    nodes.insertLast('B')
+    nodes.insertLast('C')
+    nodes.insertLast('D')
+    nodes.insertLast('E')
+    nodes.insertLast('F')
+    nodes.insertLast('G')
+    nodes.insertLast('H')
+
+    # populate edges as edge objects
+    edges.insertLast(Edge('A', 'B', 5))
+    edges.insertLast(Edge('A', 'C', 3))
+    edges.insertLast(Edge('B', 'D', 4))
+    edges.insertLast(Edge('B', 'E', 6))
+    edges.insertLast(Edge('C', 'F', 2))
+    edges.insertLast(Edge('C', 'G', 7))
+    edges.insertLast(Edge('D', 'E', 3))
+    edges.insertLast(Edge('E', 'F', 4))
+    edges.insertLast(Edge('F', 'G', 5))
+    edges.insertLast(Edge('D', 'F', 2))
+    edges.insertLast(Edge('B', 'G', 8))
+
+    # add nodes and edges to the graph
+    try:
+        current = nodes.head
+        while current:
+            testGraph.addVertex(current.getValue())
+            current = current.getNext()
+
+        current = edges.head
+        while current:
+            edge = current.getValue()
+            testGraph.addEdge(edge.getSource(), edge.getDest(), edge.getWeight())
+            current = current.getNext()
+    except GraphErrorHandle as e:
+        print(f"Error setting up the test graph {e}")
+        return
+
+    # display graph
+    print("CityDrop logistics network")
+    print("===============================")
+    testGraph.displayAsList()
+
+    #BFS: reachable zones from node A
+    print("\n1) reachable delivery zones from warehouse A")
+    print("==============================================")
+    try:
+        bfsResult = testGraph.BFS('A')
+        print("Hub\tLevel (Number of hops)")
+        print("-----------------------")
+        reachable = np.empty(testGraph.getVertexCount(), dtype=object)
+        idx = 0
+        current = bfsResult.head
+        while current:
+            pair = current.getValue()
+            reachable[idx] = pair.getLabel()
+            print(f"{pair.getLabel()}\t{pair.getLevel()}")
+            current = current.getNext()
+            idx += 1
+        reachable = reachable[:idx]
+
+        allHubs = np.empty(testGraph.getVertexCount(), dtype=object)
+        idx = 0
+        current = testGraph.vertices.head
+        while current:
+            allHubs[idx] = current.getValue().getLabel()
+            current = current.getNext()
+            idx += 1
+
+        unreachable = np.empty(allHubs.size, dtype=object)
+        unreach_count = 0
+
+        for i in range(allHubs.size):
+            hub = allHubs[i]
+            is_reachable = False
+
+            j = 0
+            while j < reachable.size and not is_reachable:
+                if hub == reachable[j]:
+                    is_reachable = True
+                j += 1
+
+            if not is_reachable:
+                unreachable[unreach_count] = hub
+                unreach_count += 1
+
+        unreachable = unreachable[:unreach_count]
+
+        if unreachable.size > 0:
+            print("\nUnreachable hubs:", ", ".join(unreachable))
+    except GraphErrorHandle as e:
+        print(f"BFS error: {e}")
+
+    # DFS: cycle detection
+    print("\n2) Cycle detection in the delivery network")
+    print("==============================================")
+    try:
+        hasCycle, cycleNodes = testGraph.DFS_cycle_detection()
+        if hasCycle:
+            print("Inefficient loops have been found in the delivery network")
+            cycleArray = np.empty(cycleNodes.get_count(), dtype=object)
+            idx = 0
+            current = cycleNodes.head
+            while current:
+                cycleArray[idx] = str(current.getValue())
+                current = current.getNext()
+                idx += 1
+            print(f"Cycle involves hubs: {' -> '.join(cycleArray)}")
+        else:
+            print("No cycles were detected within the network")
+    except GraphErrorHandle as e:
+        print(f"DFS error: {e}")
+
+    # shortest paths from A
+    print("\n3) Shortest delivery routes from warehouse A")
+    print("=================================================")
+    try:
+        shortestPath = testGraph.dijkstra('A')
+        print("Hub\tTravel time\tRoute")
+        print("-----------------------------")
+        current = shortestPath.getResults().head
+        while current:
+            hubInfo = current.getValue()
+            hub = hubInfo.getLabel()
+            distance = hubInfo.getDistance()
+            pathList = hubInfo.getPath()
+            pathArray = np.empty(pathList.get_count(), dtype=object)
+            idx = 0
+            pathCurrent = pathList.head
+            while pathCurrent:
+                pathArray[idx] = str(pathCurrent.getValue())
+                pathCurrent = pathCurrent.getNext()
+                idx += 1
+            route = " -> ".join(pathArray) if pathArray.size > 0 else "NA"
+            time_str = f"{distance} mins" if distance != float('inf') else "Unreachable"
+            print(f"{hub}\t{time_str}\t{route}")
+            current = current.getNext()
+    except GraphErrorHandle as e:
+        print(f"Shortest path error {e}")
+
+
+"""Check the label index stays in sync with the vertex list after removals"""
+def testVertexIndex():
+    print("\n4) Label index after adding and removing hubs")
+    print("=================================================")
+    graph = DSAGraph()
+    for label in "PQRST":
+        graph.addVertex(label)
+    graph.addEdge('P', 'Q', 2)
+    graph.addEdge('Q', 'R', 3)
+    graph.addEdge('R', 'S', 1)
+    graph.addEdge('S', 'T', 4)
+
+    try:
+        graph.removeVertex('R')
+        graph.removeEdge('S', 'T')
+    except GraphErrorHandle as e:
+        print(f"Removal error: {e}")
+        return
+
+    in_sync = graph.getVertexCount() == 4 and not graph.hasVertex('R')
+    idx = 0
+    current = graph.vertices.head
+    while current:
+        vertex = current.getValue()
+        if vertex.getIndex() != idx or graph.getVertexIndex(vertex.getLabel()) != idx:
+            in_sync = False
+        current = current.getNext()
+        idx += 1
+    if graph.isAdjacent('Q', 'R') or graph.isAdjacent('S', 'T'):
+        in_sync = False
+
+    if in_sync:
+        print("PASS - ids follow list order and removed edges are gone")
+    else:
+        print("FAIL - label index out of sync with the vertex list")
+
+
+"""Build the sample CityDrop network used by the extra tests"""
+def buildSampleGraph():
+    graph = DSAGraph()
+    for label in "ABCDEFGH":
+        graph.addVertex(label)
+    graph.addEdge('A', 'B', 5)
+    graph.addEdge('A', 'C', 3)
+    graph.addEdge('B', 'D', 4)
+    graph.addEdge('B', 'E', 6)
+    graph.addEdge('C', 'F', 2)
+    graph.addEdge('C', 'G', 7)
+    graph.addEdge('D', 'E', 3)
+    graph.addEdge('E', 'F', 4)
+    graph.addEdge('F', 'G', 5)
+    graph.addEdge('D', 'F', 2)
+    graph.addEdge('B', 'G', 8)
+    return graph
+
+"""Heap and scan engines of dijkstra must give the same distances"""
+def testDijkstraEngines():
+    print("\n5) Heap dijkstra against the original scan")
+    print("=================================================")
+    graph = buildSampleGraph()
+    heapNode = graph.dijkstra('A').getResults().head
+    scanNode = graph.dijkstra('A', engine="scan").getResults().head
+    matches = True
+    while heapNode and scanNode:
+        if heapNode.getValue().getDistance() != scanNode.getValue().getDistance():
+            matches = False
+        heapNode = heapNode.getNext()
+        scanNode = scanNode.getNext()
+    if matches and heapNode is None and scanNode is None:
+        print("PASS - both engines agree on every hub")
+    else:
+        print("FAIL - engines disagree")
+
+
+"""Point to point shortest path must agree with the full dijkstra tree"""
+def testShortestPath():
+    print("\n6) Point to point shortest paths from warehouse A")
+    print("=================================================")
+    graph = buildSampleGraph()
+    matches = True
+    current = graph.dijkstra('A').getResults().head
+    while current:
+        full = current.getValue()
+        single = graph.shortestPath('A', full.getLabel())
+        pathArray = np.empty(single.getPath().get_count(), dtype=object)
+        idx = 0
+        pathCurrent = single.getPath().head
+        while pathCurrent:
+            pathArray[idx] = str(pathCurrent.getValue())
+            pathCurrent = pathCurrent.getNext()
+            idx += 1
+        route = " -> ".join(pathArray) if pathArray.size > 0 else "NA"
+        print(f"A to {full.getLabel()}: {single.getDistance()} via {route}")
+        if single.getDistance() != full.getDistance():
+            matches = False
+        current = current.getNext()
+    if matches:
+        print("PASS - distances match the full dijkstra run")
+    else:
+        print("FAIL - point to point distance differs from dijkstra")
+
+
+"""The frozen CSR snapshot must give the same BFS, cycle and dijkstra results"""
+def testCSRSnapshot():
+    print("\n7) Frozen CSR snapshot of the network")
+    print("=================================================")
+    graph = buildSampleGraph()
+    csr = graph.freeze()
+    print(f"{csr.getVertexCount()} hubs, {csr.getEdgeCount()} roads, {csr.getMemoryUsage()} bytes of arrays")
+
+    matches = True
+    listNode = graph.BFS('A').head
+    csrNode = csr.BFS('A').head
+    while listNode and csrNode:
+        if listNode.getValue().getLevel() != csrNode.getValue().getLevel():
+            matches = False
+        listNode = listNode.getNext()
+        csrNode = csrNode.getNext()
+    if listNode or csrNode:
+        matches = False
+
+    listNode = graph.dijkstra('A').getResults().head
+    csrNode = csr.dijkstra('A').getResults().head
+    while listNode and csrNode:
+        if listNode.getValue().getDistance() != csrNode.getValue().getDistance():
+            matches = False
+        listNode = listNode.getNext()
+        csrNode = csrNode.getNext()
+
+    hasCycle, cycleNodes = csr.DFS_cycle_detection()
+    if hasCycle != graph.DFS_cycle_detection()[0]:
+        matches = False
+    if graph.freeze() is not csr:
+        matches = False
+
+    if matches:
+        print("PASS - CSR results match the linked list graph")
+    else:
+        print("FAIL - CSR snapshot disagrees with the graph")
+
+
+"""Circular queue must grow past its capacity and keep FIFO order, BFS must handle big frontiers"""
+def testCircularQueue():
+    print("\n8) Growable circular queue and BFS on a wide network")
+    print("=================================================")
+    queue = DSACircularQueue(capacity=4)
+    passed = True
+    queue.enqueue('A')
+    queue.enqueue('B')
+    if queue.dequeue() != 'A':
+        passed = False
+    queue.enqueue_many(['C', 'D', 'E', 'F', 'G'])    # Wraps around and grows
+    batch = queue.dequeue_many(3)
+    print(f"Batch dequeued: {', '.join(batch)}, remaining: {queue}")
+    if list(batch) != ['B', 'C', 'D'] or queue.peek() != 'E' or queue.get_count() != 3:
+        passed = False
+    try:
+        queue.dequeue_many(-1)
+        passed = False
+    except Exception as e:
+        print(f"Negative batch rejected: {e}")
+    if queue.peek() != 'E' or queue.get_count() != 3:
+        passed = False
+
+    star = DSAGraph()                 # One depot linked to 500 hubs, frontier of 500
+    star.addVertex('depot')
+    for i in range(500):
+        star.addVertex(i)
+        star.addEdge('depot', i, 1)
+    if star.BFS('depot').get_count() != 501:
+        passed = False
+
+    if passed:
+        print("PASS - FIFO order kept across growth, BFS reached all 501 hubs")
+    else:
+        print("FAIL - circular queue or BFS gave the wrong result")
+
+
+"""Bulk loading from arrays must match addEdge and reject bad edge lists"""
+def testEdgeListLoader():
+    print("\n9) Bulk loading the network from an edge list")
+    print("=================================================")
+    sources = np.array(['A', 'A', 'B', 'B', 'C', 'C', 'D', 'E', 'F', 'D', 'B'])
+    dests = np.array(['B', 'C', 'D', 'E', 'F', 'G', 'E', 'F', 'G', 'F', 'G'])
+    weights = np.array([5, 3, 4, 6, 2, 7, 3, 4, 5, 2, 8])
+    passed = True
+    try:
+        loaded = DSAGraph.from_edge_list((sources, dests, weights), vertices="ABCDEFGH")
+    except GraphErrorHandle as e:
+        print(f"Loader error: {e}")
+        return
+    manual = buildSampleGraph()
+    loadedNode = loaded.dijkstra('A').getResults().head
+    manualNode = manual.dijkstra('A').getResults().head
+    while loadedNode and manualNode:
+        if loadedNode.getValue().getDistance() != manualNode.getValue().getDistance():
+            passed = False
+        loadedNode = loadedNode.getNext()
+        manualNode = manualNode.getNext()
+    print(f"Loaded {loaded.getVertexCount()} hubs and {loaded.freeze().getEdgeCount()} roads")
+
+    badLists = np.empty(4, dtype=object)
+    badLists[0] = (['A', 'B'], ['B', 'B'], [1, 2])      # Self loop
+    badLists[1] = (['A', 'B'], ['B', 'A'], [1, 2])      # Same road twice
+    badLists[2] = (['A', 'B'], ['B', 'C'], [1, -2])     # Negative travel time
+    badLists[3] = ([1, 'B'], ['1', 'C'], [1, 2])        # Hub 1 and hub '1' mixed
+    for i in range(badLists.size):
+        try:
+            DSAGraph.from_edge_list(badLists[i])
+            print("Error, bad edge list was accepted")
+            passed = False
+        except GraphErrorHandle as e:
+            print(f"Correctly rejected: {e}")
+
+    if passed:
+        print("PASS - bulk loader matches addEdge and validates input")
+    else:
+        print("FAIL - bulk loader gave the wrong graph")
+
+
+"""A saved binary snapshot must reopen (memory mapped) with the same arrays and routes"""
+def testSnapshotFile():
+    print("\n10) Binary snapshot save and memory mapped load")
+    print("=================================================")
+    graph = buildSampleGraph()
+    path = os.path.join(tempfile.mkdtemp(), "network.bin")
+    graph.saveSnapshot(path)
+    loaded = DSAGraph.loadSnapshot(path)
+    frozen = graph.freeze()
+    print(f"Snapshot is {os.path.getsize(path)} bytes, offsets mapped as {type(loaded.offsets).__name__}")
+
+    passed = (np.array_equal(loaded.offsets, frozen.offsets) and np.array_equal(loaded.neighbours, frozen.neighbours)
+              and np.array_equal(loaded.weights, frozen.weights) and loaded.getVertexIndex('H') == 7)
+    if not np.array_equal(loaded.distancesFrom('A'), graph.distancesFrom('A')):
+        passed = False
+    if not isinstance(loaded._rowViews()[1].obj, np.memmap):    # Searched in place, not copied
+        print("Error, the search copied the mapped arrays")
+        passed = False
+    if loaded.getLabelArray().tolist() != graph.getLabelArray().tolist():
+        passed = False
+    del loaded                                    # Release the memory map before removing the file
+    os.remove(path)
+
+    numbered = DSAGraph.from_edge_list(([1, 2, 3], [2, 3, 1], [4, 5, 6]))   # Int labels must stay ints
+    numbered.saveSnapshot(path)
+    loaded = DSAGraph.loadSnapshot(path)
+    print(f"Int labels reload as {loaded.getLabelArray().tolist()}")
+    if (loaded.getLabelArray().tolist() != numbered.getLabelArray().tolist()
+            or loaded.distancesFrom(1)[loaded.getVertexIndex(2)] != 4
+            or loaded.getFingerprint() != numbered.getFingerprint()):
+        passed = False
+    del loaded
+    os.remove(path)
+
+    for labels in ([1, 'B'], [(3, 4)]):
+        only = DSAGraph()
+        for label in labels:
+            only.addVertex(label)
+        try:
+            only.saveSnapshot(path)
+            print(f"Error, saved labels {labels} that can't be read back")
+            passed = False
+        except GraphErrorHandle as e:
+            print(f"Labels {labels} rejected: {e}")
+    if os.path.exists(path):
+        passed = False
+
+    if passed:
+        print("PASS - snapshot reloads with identical arrays and distances")
+    else:
+        print("FAIL - snapshot differs from the graph")
+
+
+"""A repaired shortest path tree must match a fresh dijkstra after every travel time change"""
+def testEdgeWeightUpdate():
+    print("\n11) Shortest path tree repair after travel time changes")
+    print("=================================================")
+    graph = buildSampleGraph()
+    tree = graph.shortestPathTree('A')
+    passed = True
+    for road in (('C', 'F', 10), ('A', 'B', 1), ('E', 'F', 9), ('C', 'F', 2)):
+        graph.updateEdgeWeight(*road)
+        fresh, _ = graph._dijkstraHeap(graph.getVertexIndex('A'))
+        print(f"{road[0]}-{road[1]} now {road[2]}: A to E = {tree.getDistance('E')}, "
+              f"{tree.getLastRepairCount()} hubs repaired")
+        if graph.shortestPathTree('A') is not tree or not np.array_equal(tree.getDistances(), fresh):
+            passed = False
+
+    grid = buildGridGraph(30, 30)                 # Random changes on a bigger network
+    rng = np.random.default_rng(3)
+    trees = [grid.shortestPathTree(s) for s in (0, 450, 899)]
+    for _ in range(200):
+        idx = int(rng.integers(0, 899))
+        other = idx + 1 if idx % 30 != 29 else idx + 30
+        grid.updateEdgeWeight(idx, other, int(rng.integers(1, 30)))
+    for tree in trees:
+        fresh, _ = grid._dijkstraHeap(grid.getVertexIndex(tree.getSource()))
+        if not np.array_equal(tree.getDistances(), fresh):
+            passed = False
+
+    try:
+        graph.updateEdgeWeight('A', 'H', 3)
+        passed = False
+    except GraphErrorHandle as e:
+        print(f"Updating a missing road rejected: {e}")
+
+    if passed:
+        print("PASS - repaired trees match a fresh dijkstra")
+    else:
+        print("FAIL - repaired tree differs from dijkstra")
+
+
+"""Rush hour profile on C-F: routes from A must follow the time of day"""
+def testTimeDependent():
+    print("\n12) Time of day travel times")
+    print("=================================================")
+    graph = buildSampleGraph()
+    profile = DSATravelProfile([0, 420, 600], [2, 12, 2], period=1440)   # 7am to 10am rush on C-F
+    graph.setEdgeProfile('C', 'F', profile)
+    passed = np.array_equal(profile.travelTimes([0, 419, 420, 599, 600, 1440 + 500]), [2, 2, 12, 12, 2, 12])
+
+    expected = {0: 5.0, 420: 11.0, 595: 7.0}      # 9:55 waits at C for the rush to end
+    for departure, distance in expected.items():
+        tree = graph.dijkstraAt('A', departure)
+        print(f"Leave A at {departure}: F in {tree.getDistance('F')} via {tree.getResult('F').getPath().get_count()} hubs")
+        if tree.getDistance('F') != distance:
+            passed = False
+    if not np.array_equal(graph.dijkstraAt('A', 0).getDistances(), graph.distancesFrom('A')):
+        passed = False                            # Off peak equals the static weights
+
+    try:
+        DSATravelProfile([0, 60], [5, -1])
+        passed = False
+    except GraphErrorHandle as e:
+        print(f"Bad profile rejected: {e}")
+
+    if passed:
+        print("PASS - time dependent dijkstra follows the profiles")
+    else:
+        print("FAIL - wrong time dependent travel times")
+
+
+"""Parallel distance matrix must equal one dijkstra per source"""
+def testDijkstraMany():
+    print("\n13) Distance matrix from many sources over a process pool")
+    print("=================================================")
+    graph = buildGridGraph(20, 20)
+    sources = [0, 57, 199, 250, 399]
+    serial = graph.dijkstra_many(sources)
+    parallel = graph.dijkstra_many(sources, workers=2)
+    expected = np.array([graph.distancesFrom(source) for source in sources])
+    print(f"Matrix shape {parallel.shape}, 0 to 399 = {parallel[0, 399]}")
+    if np.array_equal(serial, expected) and np.array_equal(parallel, expected):
+        print("PASS - serial and parallel matrices match dijkstra")
+    else:
+        print("FAIL - distance matrix differs from dijkstra")
+
+
+"""A* with landmarks must give dijkstra's distances while settling fewer hubs"""
+def testLandmarks():
+    print("\n14) A* with landmark lower bounds (ALT)")
+    print("=================================================")
+    graph = buildGridGraph(30, 30)
+    graph.buildLandmarks(4)
+    print(f"Landmarks at hubs {graph.landmarks.getLandmarkIds().tolist()}")
+    rng = np.random.default_rng(5)
+    passed = True
+    astar_settled = 0
+    dijkstra_settled = 0
+    for _ in range(20):
+        source, target = (int(x) for x in rng.integers(0, 900, 2))
+        result = graph.astar(source, target)
+        if result.getDistance() != graph.distancesFrom(source)[target]:
+            passed = False
+        astar_settled += graph._astar(source, target, graph.landmarks.boundTo(target))[2]
+        dijkstra_settled += graph._astar(source, target, None)[2]
+    print(f"Settled hubs over 20 queries: A* {astar_settled}, dijkstra {dijkstra_settled}")
+
+    graph.addVertex(900)                          # Any change makes the landmarks stale
+    try:
+        graph.astar(0, 899)
+        passed = False
+    except GraphErrorHandle as e:
+        print(f"Stale landmarks rejected: {e}")
+
+    if passed and astar_settled < dijkstra_settled:
+        print("PASS - A* matches dijkstra and settles fewer hubs")
+    else:
+        print("FAIL - A* distance wrong or no fewer hubs settled")
+
+
+"""Contraction hierarchy queries must match dijkstra, also after a save and reload"""
+def testContractionHierarchy():
+    print("\n15) Contraction hierarchy")
+    print("=================================================")
+    graph = buildSampleGraph()
+    hierarchy = graph.buildContractionHierarchy()
+    result = hierarchy.shortestPath('A', 'E')
+    route = []
+    current = result.getPath().head
+    while current:
+        route.append(str(current.getValue()))
+        current = current.getNext()
+    print(f"A to E: {result.getDistance()} via {' -> '.join(route)}, {hierarchy.getEdgeCount()} upward edges")
+    passed = result.getDistance() == graph.distancesFrom('A')[graph.getVertexIndex('E')]
+    if hierarchy.travelTime('A', 'H') != float('inf'):
+        passed = False
+
+    grid = buildGridGraph(20, 20)
+    path = os.path.join(tempfile.mkdtemp(), "network.ch")
+    grid.buildContractionHierarchy().save(path)
+    loaded = DSAContractionHierarchy.load(path)
+    if not loaded.isCurrentFor(grid) or loaded.isCurrentFor(buildGridGraph(20, 20, seed=8)):   # Same version, other weights
+        passed = False
+    rng = np.random.default_rng(9)
+    for _ in range(30):
+        source, target = (int(x) for x in rng.integers(0, 400, 2))
+        if loaded.travelTime(source, target) != grid.distancesFrom(source)[target]:
+            passed = False
+    print(f"Saved index is {os.path.getsize(path)} bytes, version {loaded.getVersion()}")
+    del loaded                                    # Release the memory map before removing the file
+    os.remove(path)
+
+    tight = grid.buildContractionHierarchy(witness_limit=1)   # Weakest witness search still exact
+    for _ in range(30):
+        source, target = (int(x) for x in rng.integers(0, 400, 2))
+        if tight.travelTime(source, target) != grid.distancesFrom(source)[target]:
+            passed = False
+    try:
+        grid.buildContractionHierarchy(witness_limit=0)
+        passed = False
+    except GraphErrorHandle as e:
+        print(f"Witness limit 0 rejected: {e}")
+
+    if passed:
+        print("PASS - hierarchy queries match dijkstra")
+    else:
+        print("FAIL - hierarchy query differs from dijkstra")
+
+
+"""Hubs within a time budget, from the linked list graph and the CSR snapshot"""
+def testReachableWithin():
+    print("\n16) Hubs reachable within a time budget")
+    print("=================================================")
+    graph = buildSampleGraph()
+    result = graph.reachableWithin('A', 7)
+    pairs = [f"{result.getLabels()[i]}({result.getDistances()[i]})" for i in range(result.getCount())]
+    print(f"Within 7 of A: {', '.join(pairs)}")
+    passed = result.getLabels().tolist() in (['A', 'C', 'B', 'F', 'D'], ['A', 'C', 'F', 'B', 'D'])   # B and F tie at 5
+    passed = passed and result.getDistances().tolist()[-1] == 7.0
+
+    grid = buildGridGraph(30, 30)
+    distances = grid.distancesFrom(435)
+    expected = sorted(distances[distances <= 40].tolist())
+    for found in (grid.reachableWithin(435, 40), grid.freeze().reachableWithin(435, 40)):
+        if found.getDistances().tolist() != expected:
+            passed = False
+    print(f"Grid: {len(expected)} of 900 hubs within 40 of hub 435")
+
+    if passed:
+        print("PASS - budgeted search matches the full dijkstra")
+    else:
+        print("FAIL - wrong hubs or times within the budget")
+
+
+"""k shortest loopless routes, best first, each one different"""
+def testKShortestPaths():
+    print("\n17) Alternative routes (k shortest loopless paths)")
+    print("=================================================")
+    graph = buildSampleGraph()
+    costs = []
+    routes = set()
+    current = graph.kShortestPaths('A', 'E', 5).head
+    while current:
+        result = current.getValue()
+        route = []
+        pathNode = result.getPath().head
+        while pathNode:
+            route.append(str(pathNode.getValue()))
+            pathNode = pathNode.getNext()
+        print(f"{result.getDistance()}: {' -> '.join(route)}")
+        costs.append(result.getDistance())
+        routes.add(tuple(route))
+        current = current.getNext()
+    passed = costs == [9.0, 10.0, 11.0, 12.0, 15.0] and len(routes) == 5
+    if graph.kShortestPaths('A', 'H', 3).get_count() != 0:    # H has no roads
+        passed = False
+
+    if passed:
+        print("PASS - routes come back best first without repeats")
+    else:
+        print("FAIL - wrong alternative routes")
+
+
+"""Build a rows x cols grid road network with random travel times, for the benchmarks"""
+def buildGridGraph(rows, cols, seed=7):
+    rng = np.random.default_rng(seed)
+    graph = DSAGraph()
+    for i in range(rows * cols):
+        graph.addVertex(i)
+    for r in range(rows):
+        for c in range(cols):
+            idx = r * cols + c
+            if c + 1 < cols:
+                graph.addEdge(idx, idx + 1, int(rng.integers(1, 20)))
+            if r + 1 < rows:
+                graph.addEdge(idx, idx + cols, int(rng.integers(1, 20)))
+    return graph
+
+"""Time a function, best of repeats runs, as a printable string"""
+def timeBest(func, repeats=3):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        try:
+            func()
+        except (Exception, RecursionError) as e:
+            return f"failed ({type(e).__name__}: {e})"
+        best = min(best, time.perf_counter() - start)
+    return f"{best:.3f}s"
+
+"""Approximate bytes used by the linked list adjacency (list nodes, edge objects and weights)"""
+def linkedListBytes(graph):
+    total = 0
+    for i in range(graph.getVertexCount()):
+        adj_node = graph.vertex_array[i].getAdjacent().head
+        while adj_node:
+            edge = adj_node.getValue()
+            total += sys.getsizeof(adj_node) + sys.getsizeof(adj_node.__dict__)
+            total += sys.getsizeof(edge) + sys.getsizeof(edge.__dict__) + sys.getsizeof(edge.getWeight())
+            adj_node = adj_node.getNext()
+    return total
+
+"""Compare the linked list graph against its frozen CSR snapshot"""
+def benchmarkCSR(rows=150, cols=150):
+    print(f"\nCSR benchmark on a {rows} x {cols} grid")
+    print("=================================================")
+    graph = buildGridGraph(rows, cols)
+    csr = graph.freeze()
+    edges = csr.getEdgeCount()
+    print(f"{graph.getVertexCount()} hubs, {edges} roads")
+    print(f"Memory per road: linked list {linkedListBytes(graph) / edges:.1f} bytes, "
+          f"CSR {csr.getMemoryUsage() / edges:.1f} bytes")
+    print(f"freeze():      {timeBest(lambda: graph.to_csr())}")
+    print(f"BFS:           linked list {timeBest(lambda: graph.BFS(0))}, CSR {timeBest(lambda: csr.BFS(0))}")
+    print(f"dijkstra:      linked list {timeBest(lambda: graph._dijkstraHeap(0))}, "
+          f"CSR {timeBest(lambda: csr._dijkstraHeap(0))}")
+    print(f"cycle check:   linked list {timeBest(lambda: graph.DFS_cycle_detection())}, "
+          f"CSR {timeBest(lambda: csr.DFS_cycle_detection())}")
+
+
+"""dijkstra_many wall time as the worker count grows"""
+def benchmarkDijkstraMany(rows=100, cols=100, source_count=64):
+    print(f"\ndijkstra_many on a {rows} x {cols} grid, {source_count} sources")
+    print("=================================================")
+    graph = buildGridGraph(rows, cols)
+    graph.freeze()
+    sources = list(range(0, rows * cols, (rows * cols) // source_count))[:source_count]
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        print(f"{workers:2d} workers: {timeBest(lambda: graph.dijkstra_many(sources, workers), repeats=1)}")
+        workers *= 2
+
+
+"""Settled hubs and query time of A* (ALT) against dijkstra stopped at the target"""
+def benchmarkLandmarks(rows=200, cols=200, queries=50):
+    print(f"\nALT benchmark on a {rows} x {cols} grid, {queries} random queries")
+    print("=================================================")
+    graph = buildGridGraph(rows, cols)
+    for count in (4, 8, 16):
+        print(f"{count} landmarks: preprocessing {timeBest(lambda: graph.buildLandmarks(count), repeats=1)}, "
+              f"{graph.landmarks.getMemoryUsage() / 2**20:.1f} MiB")
+        rng = np.random.default_rng(11)
+        astar_settled = 0
+        dijkstra_settled = 0
+        astar_time = 0.0
+        dijkstra_time = 0.0
+        for _ in range(queries):
+            source, target = (int(x) for x in rng.integers(0, rows * cols, 2))
+            start = time.perf_counter()
+            astar_settled += graph._astar(source, target, graph.landmarks.boundTo(target))[2]
+            astar_time += time.perf_counter() - start
+            start = time.perf_counter()
+            dijkstra_settled += graph._astar(source, target, None)[2]
+            dijkstra_time += time.perf_counter() - start
+        print(f"  settled per query: A* {astar_settled / queries:.0f}, dijkstra {dijkstra_settled / queries:.0f}; "
+              f"time per query: A* {astar_time / queries * 1000:.1f}ms, dijkstra {dijkstra_time / queries * 1000:.1f}ms")
+
+
+"""Contraction hierarchy preprocessing and query time against dijkstra and A*"""
+def benchmarkContractionHierarchy(rows=100, cols=100, queries=200):
+    print(f"\nContraction hierarchy benchmark on a {rows} x {cols} grid, {queries} random queries")
+    print("=================================================")
+    graph = buildGridGraph(rows, cols)
+    start = time.perf_counter()
+    hierarchy = graph.buildContractionHierarchy()
+    print(f"Preprocessing {time.perf_counter() - start:.1f}s, {hierarchy.getEdgeCount()} upward edges "
+          f"for {graph.freeze().getEdgeCount()} roads, {hierarchy.getMemoryUsage() / 2**20:.1f} MiB")
+    rng = np.random.default_rng(13)
+    pairs = [(int(a), int(b)) for a, b in rng.integers(0, rows * cols, (queries, 2))]
+    start = time.perf_counter()
+    for source, target in pairs:
+        hierarchy.travelTime(source, target)
+    hierarchy_time = (time.perf_counter() - start) / queries
+    start = time.perf_counter()
+    for source, target in pairs:                  # Same pairs, dijkstra stopped at the target
+        graph._astar(source, target, None)
+    dijkstra_time = (time.perf_counter() - start) / queries
+    print(f"Average query over the same {queries} pairs: hierarchy {hierarchy_time * 1e6:.0f}us, "
+          f"dijkstra to target {dijkstra_time * 1e6:.0f}us")
+
+
+"""Cycle detection on long acyclic road chains (the worst case: every edge is visited)"""
+def benchmarkCycleDetection(csr_edges=10**6, list_edges=10**5):
+    print("\nCycle detection benchmark on road chains")
+    print("=================================================")
+    # CSR chain built straight from arrays: hub i joins i - 1 and i + 1
+    vertex_count = csr_edges + 1
+    degrees = np.full(vertex_count, 2, dtype=np.int32)
+    degrees[0] = 1
+    degrees[-1] = 1
+    offsets = np.zeros(vertex_count + 1, dtype=np.int32)
+    np.cumsum(degrees, out=offsets[1:])
+    neighbours = np.empty(offsets[-1], dtype=np.int32)
+    neighbours[offsets[1:-1]] = np.arange(0, vertex_count - 1)          # Left neighbour of hubs 1..n-1
+    neighbours[offsets[:-2] + degrees[:-1] - 1] = np.arange(1, vertex_count)  # Right neighbour of hubs 0..n-2
+    csr = DSACSRGraph(np.arange(vertex_count).astype(object), offsets, neighbours,
+                      np.ones(offsets[-1], dtype=np.float64))
+    found, cycleNodes = csr.DFS_cycle_detection()
+    print(f"CSR, {csr.getEdgeCount()} roads: cycle found = {found}, "
+          f"time {timeBest(lambda: csr.DFS_cycle_detection(), repeats=1)}")
+
+    graph = DSAGraph()
+    for i in range(list_edges + 1):
+        graph.addVertex(i)
+    for i in range(list_edges):
+        graph.addEdge(i, i + 1, 1)
+    found, cycleNodes = graph.DFS_cycle_detection()
+    print(f"Linked list, {list_edges} roads: cycle found = {found}, "
+          f"time {timeBest(lambda: graph.DFS_cycle_detection(), repeats=1)}")
+    graph.addEdge(0, list_edges, 1)       # Close the chain into one big loop
+    found, cycleNodes = graph.DFS_cycle_detection()
+    print(f"Linked list ring, {list_edges + 1} roads: cycle of {cycleNodes.get_count() - 1} hubs found, "
+          f"time {timeBest(lambda: graph.DFS_cycle_detection(), repeats=1)}")
+
+
+if __name__ == "__main__":
+    testModule()
+    testVertexIndex()
+    testDijkstraEngines()
+    testShortestPath()
+    testCSRSnapshot()
+    testCircularQueue()
+    testEdgeListLoader()
+    testSnapshotFile()
+    testEdgeWeightUpdate()
+    testTimeDependent()
+    testDijkstraMany()
+    testLandmarks()
+    testContractionHierarchy()
+    testReachableWithin()
+    testKShortestPaths()
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        benchmarkCSR()
+        benchmarkCycleDetection()
+        benchmarkDijkstraMany()
+        benchmarkLandmarks()
+        benchmarkContractionHierarchy()
+
@@ -1,63 +1,151 @@
-import numpy as np
-
-"""
-Abstract parent class for Queue implementations.
-Provides common methods and structure for queue-based ADTs.
-"""
-class DSAQueue:
-    DEFAULT_CAPACITY = 100                                  # Default queue capacity
-
-    def __init__(self, capacity=DEFAULT_CAPACITY):
-        if capacity <= 0:
-            raise ValueError("Capacity must be positive")   # Ensure capacity is valid
-        self.capacity = capacity                            # Set queue capacity
-        self.queue = np.empty(capacity, dtype=object)       # General-purpose object array
-        self.count = 0                                      # Tracks the number of elements
-
-    def get_count(self):
-        return self.count                   # Return the current number of elements in the queue
-
-    def is_empty(self):
-        return self.count == 0              # Check if queue is empty
-
-    def is_full(self):
-        return self.count == self.capacity  # Check if queue is full
-
-    def enqueue(self, value):
-        raise NotImplementedError("enqueue() must be implemented in subclass")  # Placeholder for subclass implementation
-
-    def dequeue(self):
-        raise NotImplementedError("dequeue() must be implemented in subclass")  # Placeholder for subclass implementation
-
-    def peek(self):
-        if self.is_empty():
-            raise Exception("Queue is empty")     # Prevent peeking if queue is empty
-        return self.queue[0]                      # Default behavior, overridden in circular queue
-
-    def __str__(self):
-        return str(self.queue[:self.count])      # Default string representation
-
-"""
-Shuffling Queue implementation (First-In-First-Out)
-Shuffling Queue shifts all elements left when dequeuing, 
-making it O(n) and inefficient for large queues.
-https://www.geeksforgeeks.org/array-implementation-of-queue-simple/
-"""
-class DSASqueue(DSAQueue):
-    def enqueue(self, value):
-        if self.is_full():
-            raise Exception("Queue is full")     # Prevent adding if queue is full
-        self.queue[self.count] = value           # Add value to the end of the queue
-        self.count += 1                          # Increase count to reflect new item
-
-    def dequeue(self):
-        if self.is_empty():
-            raise Exception("Queue is empty")     # Prevent removing if queue is empty
-        front_val = self.queue[0]                 # Get the front value
-        for i in range(1, self.count):
-            self.queue[i - 1] = self.queue[i]     # Shift elements left to maintain order
-        self.count -= 1                           # Reduce count to remove item
-        return front_val                          # Return removed value
-
-    def __str__(self):
-        return str(self.queue[:self.count])       # String representation of active elements
\ No newline at end of file
+import numpy as np
+
+"""
+Abstract parent class for Queue implementations.
+Provides common methods and structure for queue-based ADTs.
+"""
+class DSAQueue:
+    DEFAULT_CAPACITY = 100                                  # Default queue capacity
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")   # Ensure capacity is valid
+        self.capacity = capacity                            # Set queue capacity
+        self.queue = np.empty(capacity, dtype=object)       # General-purpose object array
+        self.count = 0                                      # Tracks the number of elements
+
+    def get_count(self):
+        return self.count                   # Return the current number of elements in the queue
+
+    def is_empty(self):
+        return self.count == 0              # Check if queue is empty
+
+    def is_full(self):
+        return self.count == self.capacity  # Check if queue is full
+
+    def enqueue(self, value):
+        raise NotImplementedError("enqueue() must be implemented in subclass")  # Placeholder for subclass implementation
+
+    def dequeue(self):
+        raise NotImplementedError("dequeue() must be implemented in subclass")  # Placeholder for subclass implementation
+
+    def peek(self):
+        if self.is_empty():
+            raise Exception("Queue is empty")     # Prevent peeking if queue is empty
+        return self.queue[0]                      # Default behavior, overridden in circular queue
+
+    def __str__(self):
+        return str(self.queue[:self.count])      # Default string representation
+
+"""
+Shuffling Queue implementation (First-In-First-Out)
+Shuffling Queue shifts all elements left when dequeuing, 
+making it O(n) and inefficient for large queues.
+https://www.geeksforgeeks.org/array-implementation-of-queue-simple/
+"""
+class DSASqueue(DSAQueue):
+    def enqueue(self, value):
+        if self.is_full():
+            raise Exception("Queue is full")     # Prevent adding if queue is full
+        self.queue[self.count] = value           # Add value to the end of the queue
+        self.count += 1                          # Increase count to reflect new item
+
+    def dequeue(self):
+        if self.is_empty():
+            raise Exception("Queue is empty")     # Prevent removing if queue is empty
+        front_val = self.queue[0]                 # Get the front value
+        for i in range(1, self.count):
+            self.queue[i - 1] = self.queue[i]     # Shift elements left to maintain order
+        self.count -= 1                           # Reduce count to remove item
+        return front_val                          # Return removed value
+
+    def __str__(self):
+        return str(self.queue[:self.count])       # String representation of active elements
+
+"""
+Circular Queue implementation (First-In-First-Out)
+Keeps a front index and wraps around the array, so enqueue and
+dequeue are O(1). When the array is full it doubles in size
+(amortised O(1)), so it never raises "Queue is full".
+https://www.geeksforgeeks.org/introduction-to-circular-queue/
+"""
+class DSACircularQueue(DSAQueue):
+    def __init__(self, capacity=DSAQueue.DEFAULT_CAPACITY):
+        super().__init__(capacity)
+        self.front = 0                            # Index of the front element
+
+    def is_full(self):
+        return False                              # Grows instead of filling up
+
+    def _grow(self, min_capacity):
+        new_capacity = self.capacity
+        while new_capacity < min_capacity:
+            new_capacity *= 2                     # Double until the new items fit
+        new_queue = np.empty(new_capacity, dtype=object)
+        new_queue[:self.count] = self._ordered()  # Unwrap so the front is at index 0
+        self.queue = new_queue
+        self.capacity = new_capacity
+        self.front = 0
+
+    def _ordered(self):
+        end = self.front + self.count
+        if end <= self.capacity:                  # Elements don't wrap
+            return self.queue[self.front:end]
+        return np.concatenate((self.queue[self.front:], self.queue[:end - self.capacity]))
+
+    def enqueue(self, value):
+        if self.count == self.capacity:
+            self._grow(self.count + 1)
+        self.queue[(self.front + self.count) % self.capacity] = value   # Add value behind the last element
+        self.count += 1
+
+    def dequeue(self):
+        if self.is_empty():
+            raise Exception("Queue is empty")     # Prevent removing if queue is empty
+        front_val = self.queue[self.front]
+        self.queue[self.front] = None             # Drop the reference
+        self.front = (self.front + 1) % self.capacity
+        self.count -= 1
+        return front_val
+
+    """Enqueue every value of an array or list, copying in at most two slices."""
+    def enqueue_many(self, values):
+        n = len(values)
+        if n == 0:
+            return
+        if self.count + n > self.capacity:
+            self._grow(self.count + n)
+        start = (self.front + self.count) % self.capacity
+        first = min(n, self.capacity - start)     # Part that fits before the end of the array
+        items = np.empty(n, dtype=object)
+        for i in range(n):                        # Element by element so tuples stay single items
+            items[i] = values[i]
+        self.queue[start:start + first] = items[:first]
+        self.queue[:n - first] = items[first:]    # Wrapped part, empty when nothing wraps
+        self.count += n
+
+    """Dequeue up to n values (all of them when n is None) as an array, front first."""
+    def dequeue_many(self, n=None):
+        if n is not None and n < 0:
+            raise Exception("Can't dequeue a negative number of values")   # Would move front backwards
+        if n is None or n > self.count:
+            n = self.count
+        end = self.front + n
+        if end <= self.capacity:
+            values = self.queue[self.front:end].copy()
+            self.queue[self.front:end] = None
+        else:
+            values = np.concatenate((self.queue[self.front:], self.queue[:end - self.capacity]))
+            self.queue[self.front:] = None
+            self.queue[:end - self.capacity] = None
+        self.front = end % self.capacity
+        self.count -= n
+        return values
+
+    def peek(self):
+        if self.is_empty():
+            raise Exception("Queue is empty")
+        return self.queue[self.front]
+
+    def __str__(self):
+        return str(self._ordered())               # Active elements, front first
@@ -0,0 +1,93 @@
+from bisect import bisect_right
+import numpy as np
+from Module1.GraphVertex import GraphErrorHandle
+
+"""
+Piecewise constant travel time of one road over the day.
+start_times[i] is when period i begins (the first must be 0) and
+travel_times[i] is the time to drive the road when leaving during it.
+With a period (e.g. 1440 minutes) the profile repeats every day.
+Both are stored as float arrays, lookups are a binary search over the
+start times. bisect is used for single lookups, np.searchsorted has
+too much call overhead for one value, travelTimes does whole arrays.
+
+A van may wait at a hub for a quicker period to start, so arrivalTime
+is the earliest arrival for a given departure. That keeps arrival times
+non decreasing in the departure time, which time dependent dijkstra
+needs to be exact.
+"""
+class DSATravelProfile:
+    def __init__(self, start_times, travel_times, period=None):
+        start_times = np.asarray(start_times, dtype=float)
+        travel_times = np.asarray(travel_times, dtype=float)
+        if start_times.ndim != 1 or start_times.size == 0 or start_times.shape != travel_times.shape:
+            raise GraphErrorHandle("Profile needs one travel time per start time")
+        if start_times[0] != 0:
+            raise GraphErrorHandle("Profile must start at time 0")
+        if np.any(np.diff(start_times) <= 0):
+            raise GraphErrorHandle("Profile start times must be increasing")
+        if np.any(travel_times <= 0):
+            raise GraphErrorHandle("Edge weight must be positive")
+        if period is not None and period <= start_times[-1]:
+            raise GraphErrorHandle("Profile period must be after the last start time")
+        self.start_times = start_times
+        self.travel_times = travel_times
+        self.period = period
+
+        # best_after[i]: earliest arrival leaving at the start of period i or later (waiting allowed)
+        best = start_times + travel_times
+        best_after = np.empty(best.size + 1)
+        if period is None:
+            best_after[-1] = float('inf')
+        else:
+            best_after[-1] = period + best.min()     # Wait for tomorrow's quickest period
+        best_after[:-1] = np.minimum.accumulate(best[::-1])[::-1]
+        best_after[:-1] = np.minimum(best_after[:-1], best_after[-1])
+        self.best_after = best_after
+
+    def getStartTimes(self):
+        return self.start_times
+
+    def getTravelTimes(self):
+        return self.travel_times
+
+    def getPeriod(self):
+        return self.period
+
+    def getSegmentCount(self):
+        return self.start_times.size
+
+    def getMinTravelTime(self):
+        return float(self.travel_times.min())
+
+    def _split(self, time):          # Whole days already passed and the time within the day
+        if time < 0:
+            raise GraphErrorHandle("Time must not be negative")
+        if self.period is None:
+            return 0.0, time
+        days = time // self.period
+        return days * self.period, time - days * self.period
+
+    """Travel time when leaving at the given time, O(log k) for k periods."""
+    def travelTime(self, time):
+        day, time = self._split(time)
+        return float(self.travel_times[bisect_right(self.start_times, time) - 1])
+
+    """Travel times for an array of departure times in one searchsorted call."""
+    def travelTimes(self, times):
+        times = np.asarray(times, dtype=float)
+        if np.any(times < 0):
+            raise GraphErrorHandle("Time must not be negative")
+        if self.period is not None:
+            times = np.mod(times, self.period)
+        return self.travel_times[np.searchsorted(self.start_times, times, side='right') - 1]
+
+    """Earliest arrival at the far end when ready to leave at the given time."""
+    def arrivalTime(self, time):
+        day, time = self._split(time)
+        segment = bisect_right(self.start_times, time) - 1
+        arrival = time + float(self.travel_times[segment])
+        wait = float(self.best_after[segment + 1])          # Leave in a later, quicker period instead
+        if wait < arrival:
+            arrival = wait
+        return day + arrival
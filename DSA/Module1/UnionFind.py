@@ -0,0 +1,52 @@
+"""
+Disjoint set (union-find) over dense vertex ids.
+Union by rank and path compression make find and union
+effectively O(1) (inverse Ackermann). Used by DSAGraph to
+answer "are these two hubs connected" without routing.
+https://www.geeksforgeeks.org/union-find-algorithm-set-2-union-by-rank/
+"""
+class DSAUnionFind:
+    def __init__(self, size=0):
+        self.parent = list(range(size))     # Parent id of each element, roots point to themselves
+        self.rank = [0] * size              # Upper bound on the height of each root's tree
+        self.components = size              # Number of disjoint sets
+
+    def get_count(self):
+        return len(self.parent)
+
+    def getComponentCount(self):
+        return self.components
+
+    """Add a new element in a set of its own and return its id."""
+    def add(self):
+        self.parent.append(len(self.parent))
+        self.rank.append(0)
+        self.components += 1
+        return len(self.parent) - 1
+
+    """Root of the set holding x, compressing the path on the way."""
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:         # Walk up to the root
+            root = parent[root]
+        while parent[x] != root:            # Point every node on the path straight at the root
+            parent[x], x = root, parent[x]
+        return root
+
+    """Merge the sets holding a and b, returns False if they were already joined."""
+    def union(self, a, b):
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        if self.rank[root_a] < self.rank[root_b]:   # Hang the shorter tree under the taller one
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        self.components -= 1
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
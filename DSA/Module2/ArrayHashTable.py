@@ -0,0 +1,304 @@
+import numpy as np
+from Module2.HashEntry import CustomerEntry, hashError
+from Module2.HashTable import CustomerTableBase
+
+"""
+Customer hash table stored as parallel arrays (struct of arrays)
+instead of one CustomerEntry object per slot:
+- keys:  int64 customer ID in each slot
+- states: int8 slot state (CustomerEntry EMPTY/USED/DELETED)
+- slots: int32 index of the customer in the records list
+Probing only reads the keys and states arrays, never a Customer, and
+an empty slot costs 13 bytes. Resizing moves integers only, the
+customers stay where they are in records. Same interface
+(CustomerTableBase) and linear probing (or Robin Hood) as
+CustomerHashTable, with the same tombstone rehashing, customer IDs
+must be integers. Resizes are a vectorised pass over the integer
+columns, so there is no incremental mode.
+search_many / has_customers probe a whole batch of IDs at once.
+"""
+class CustomerArrayTable(CustomerTableBase):
+    def __init__(self, size=53, hashing=CustomerTableBase.MODULO_HASH, robin_hood=False, incremental=False):
+        if incremental:
+            raise hashError("Array table resizes in one vectorised pass, incremental resizing is not supported")
+        super().__init__(size, hashing, robin_hood)
+        self.keys = np.zeros(self.size, dtype=np.int64)
+        self.states = np.zeros(self.size, dtype=np.int8)      # All EMPTY_STATE
+        self.slots = np.full(self.size, -1, dtype=np.int32)
+        self.records = []                                # Customer objects, indexed by slots
+        self.free_records = []                           # Record indexes freed by delete, reused first
+
+    """Resize to the next prime at or above new_capacity, only the integer columns are rebuilt."""
+    def resize(self, new_capacity):
+        used = self.states == CustomerEntry.USED_STATE
+        keys = self.keys[used]
+        slots = self.slots[used]
+        self.size = self._get_next_prime(new_capacity)
+        self.keys = np.zeros(self.size, dtype=np.int64)
+        self.states = np.zeros(self.size, dtype=np.int8)
+        self.slots = np.full(self.size, -1, dtype=np.int32)
+        self.count = 0
+        self.tombstones = 0
+        self._place_all(keys, slots)
+
+    """Rehash at the same size in the same arrays, clearing every tombstone."""
+    def rehash(self):
+        used = self.states == CustomerEntry.USED_STATE
+        keys = self.keys[used]
+        slots = self.slots[used]
+        self.states[:] = CustomerEntry.EMPTY_STATE
+        self.slots[:] = -1
+        self.count = 0
+        self.tombstones = 0
+        self._place_all(keys, slots)
+
+    """Home slot of every ID in an array, same hashing as _hash (uint64 products wrap mod 2^64)."""
+    def _hash_many(self, customer_ids):
+        if self.hashing == CustomerTableBase.FIBONACCI_HASH:
+            mixed = customer_ids.astype(np.uint64) * np.uint64(CustomerTableBase.FIBONACCI_MULTIPLIER)
+            return ((mixed >> np.uint64(32)) * np.uint64(self.size) >> np.uint64(32)).astype(np.int64)
+        return customer_ids % self.size
+
+    def _displacements(self):
+        used = np.flatnonzero(self.states == CustomerEntry.USED_STATE)
+        return (used - self._hash_many(self.keys[used])) % self.size
+
+    """
+    Put distinct keys (not already in the table) into a table with no
+    deleted slots, all at once. Each round every pending key tries its
+    current slot, one key wins each free slot and the rest move on one
+    slot, so it takes as many rounds as the longest probe sequence.
+    """
+    def _place_all(self, keys, slots):
+        position = self._hash_many(keys)
+        pending = np.arange(len(keys))
+        placed = np.zeros(len(keys), dtype=bool)
+        while pending.size > 0:
+            current = position[pending]
+            free = self.states[current] == CustomerEntry.EMPTY_STATE
+            taken, first = np.unique(current[free], return_index=True)   # First claimant of each free slot wins
+            winners = pending[free][first]
+            self.keys[taken] = keys[winners]
+            self.states[taken] = CustomerEntry.USED_STATE
+            self.slots[taken] = slots[winners]
+            placed[winners] = True
+            pending = pending[~placed[pending]]
+            position[pending] = (position[pending] + 1) % self.size        # Their slot is now used
+        self.count += len(keys)
+        if self.robin_hood:
+            self._order_clusters()
+
+    """
+    Turn a linear probing layout (no tombstones) into the Robin Hood one.
+    Which slots are used does not depend on insert order, Robin Hood only
+    orders each cluster by home slot. Counting from just after an empty
+    slot no cluster wraps round the end, and every customer's home lies
+    in its own cluster, so sorting all used slots by position and all
+    customers by home pairs them up cluster by cluster.
+    """
+    def _order_clusters(self):
+        used = np.flatnonzero(self.states == CustomerEntry.USED_STATE)
+        if used.size == 0:
+            return
+        start = int(np.flatnonzero(self.states != CustomerEntry.USED_STATE)[0]) + 1
+        keys = self.keys[used]
+        slots = self.slots[used]
+        by_position = used[np.argsort((used - start) % self.size, kind='stable')]
+        by_home = np.argsort((self._hash_many(keys) - start) % self.size, kind='stable')
+        self.keys[by_position] = keys[by_home]
+        self.slots[by_position] = slots[by_home]
+
+    """
+    Insert many customers. Into an empty table the IDs are checked,
+    duplicates keep the last customer (as repeated inserts would) and
+    everything is placed in one vectorised pass, otherwise one insert
+    each. Call reserve first so nothing resizes on the way.
+    """
+    def insert_many(self, customers):
+        if self.count > 0 or self.records or np.any(self.states != CustomerEntry.EMPTY_STATE):
+            return super().insert_many(customers)
+        customers = list(customers)
+        ids = []
+        for customer in customers:
+            customer_id = customer.getID()
+            if not isinstance(customer_id, (int, np.integer)):
+                raise hashError(f"Customer ID {customer_id} must be an integer")
+            ids.append(customer_id)
+        ids = np.array(ids, dtype=np.int64)
+        unique_ids, last = np.unique(ids[::-1], return_index=True)   # First in reverse = last inserted
+        keep = np.sort(len(ids) - 1 - last)
+        if keep.size / self.size > CustomerTableBase.MAX_LOAD_FACTOR:
+            self.resize(self._capacity_for(keep.size))
+        self.records = [customers[i] for i in keep.tolist()]
+        self._place_all(ids[keep], np.arange(keep.size, dtype=np.int32))
+
+    """Find the slot for a customer ID using linear probing."""
+    def _find_slot(self, customer_id, for_insert=False):
+        key_at = self.keys.item                # item() gives plain ints, much cheaper than numpy scalars
+        state_at = self.states.item
+        idx = self._hash(customer_id)
+        first_deleted = -1                     # Insert reuses the first deleted slot on the way
+        for distance in range(self.size):
+            state = state_at(idx)
+            if state == CustomerEntry.EMPTY_STATE:
+                if for_insert:
+                    return first_deleted if first_deleted != -1 else idx
+                return -1
+            if state == CustomerEntry.USED_STATE:
+                key = key_at(idx)
+                if key == customer_id:
+                    return idx
+                if self.robin_hood and (idx - self._hash(key)) % self.size < distance:
+                    return -1                  # The ID would have taken this slot
+            elif first_deleted == -1:
+                first_deleted = idx
+            idx += 1
+            if idx == self.size:
+                idx = 0
+        return first_deleted if for_insert else -1
+
+    """Insert or update a customer in the hash table."""
+    def insert(self, customer):
+        customer_id = customer.getID()
+        if not isinstance(customer_id, (int, np.integer)):
+            raise hashError(f"Customer ID {customer_id} must be an integer")
+        if self.count >= self.size:
+            raise Exception("Hash table is full")
+        idx = self._find_slot(customer_id, for_insert=not self.robin_hood)
+        if idx == -1 and not self.robin_hood:
+            raise Exception("Unable to insert customer")
+
+        if idx != -1 and self.states[idx] == CustomerEntry.USED_STATE:     # Same ID, replace the record
+            self.records[self.slots[idx]] = customer
+        else:
+            if self.free_records:
+                record = self.free_records.pop()
+                self.records[record] = customer
+            else:
+                record = len(self.records)
+                self.records.append(customer)
+            if self.robin_hood:
+                self._insert_robin_hood(customer_id, record)
+            else:
+                if self.states[idx] == CustomerEntry.DELETED_STATE:
+                    self.tombstones -= 1
+                self.keys[idx] = customer_id
+                self.states[idx] = CustomerEntry.USED_STATE
+                self.slots[idx] = record
+            self.count += 1
+
+        if self.count / self.size > CustomerTableBase.MAX_LOAD_FACTOR:
+            self.resize(self.size * 2)
+        elif (self.count + self.tombstones) / self.size > CustomerTableBase.MAX_LOAD_FACTOR:
+            if self.count / self.size > CustomerTableBase.MAX_REHASH_LOAD:
+                self.resize(self.size * 2)
+            else:
+                self.rehash()
+        return True
+
+    """Robin Hood placement of a new ID, swapping with any resident closer to its home."""
+    def _insert_robin_hood(self, customer_id, record):
+        idx = self._hash(customer_id)
+        distance = 0
+        while True:
+            if self.states.item(idx) != CustomerEntry.USED_STATE:
+                self.keys[idx] = customer_id
+                self.states[idx] = CustomerEntry.USED_STATE
+                self.slots[idx] = record
+                return
+            resident_id = self.keys.item(idx)
+            resident_distance = (idx - self._hash(resident_id)) % self.size
+            if resident_distance < distance:
+                resident_record = self.slots.item(idx)
+                self.keys[idx] = customer_id
+                self.slots[idx] = record
+                customer_id, record, distance = resident_id, resident_record, resident_distance
+            idx += 1
+            if idx == self.size:
+                idx = 0
+            distance += 1
+
+    """Backward shift delete, the rest of the cluster moves back a slot."""
+    def _shift_back(self, idx):
+        next_idx = (idx + 1) % self.size
+        while (self.states.item(next_idx) == CustomerEntry.USED_STATE
+               and self._hash(self.keys.item(next_idx)) != next_idx):
+            self.keys[idx] = self.keys[next_idx]
+            self.slots[idx] = self.slots[next_idx]
+            idx = next_idx
+            next_idx = (next_idx + 1) % self.size
+        self.states[idx] = CustomerEntry.EMPTY_STATE
+        self.slots[idx] = -1
+
+    """Search for a customer by their ID."""
+    def search(self, customer_id):
+        idx = self._find_slot(customer_id)
+        if idx == -1:
+            raise hashError(f"customer ID {customer_id} not found")
+        return self.records[self.slots.item(idx)]
+
+    """Delete a customer from the hash table by their ID."""
+    def delete(self, customer_id):
+        idx = self._find_slot(customer_id)
+        if idx == -1:
+            return False
+        record = int(self.slots[idx])
+        self.records[record] = None
+        self.free_records.append(record)
+        if self.robin_hood:
+            self._shift_back(idx)
+        else:
+            self.states[idx] = CustomerEntry.DELETED_STATE
+            self.slots[idx] = -1
+            self.tombstones += 1
+        self.count -= 1
+
+        if (self.size > CustomerTableBase.MIN_SIZE and self.count / self.size < CustomerTableBase.MIN_LOAD_FACTOR):
+            self.resize(max(self.size // 2, CustomerTableBase.MIN_SIZE))
+        elif self.tombstones > CustomerTableBase.MAX_TOMBSTONE_FACTOR * self.size:
+            self.rehash()
+        return True
+
+    def update_delivery_status(self, customer_id, new_status):
+        idx = self._find_slot(customer_id)
+        if idx == -1:
+            return False
+        self.records[self.slots[idx]].setDeliveryStatus(new_status)
+        return True
+
+    """Slot of every ID in an array (-1 if absent), probing all of them together."""
+    def _find_slots(self, customer_ids):
+        customer_ids = np.asarray(customer_ids, dtype=np.int64)
+        found = np.full(len(customer_ids), -1, dtype=np.int64)
+        position = self._hash_many(customer_ids)
+        pending = np.arange(len(customer_ids))
+        for step in range(self.size):
+            if pending.size == 0:
+                break
+            current = position[pending]
+            states = self.states[current]
+            keys = self.keys[current]
+            hit = (states == CustomerEntry.USED_STATE) & (keys == customer_ids[pending])
+            found[pending[hit]] = current[hit]
+            going = ~hit & (states != CustomerEntry.EMPTY_STATE)             # Empty slot ends a miss
+            if self.robin_hood:                                               # So does a resident nearer home
+                going &= (current - self._hash_many(keys)) % self.size >= step
+            pending = pending[going]
+            position[pending] = (position[pending] + 1) % self.size
+        return found
+
+    """True/False array for a batch of IDs."""
+    def has_customers(self, customer_ids):
+        return self._find_slots(customer_ids) != -1
+
+    """Customers for a batch of IDs, None where an ID is not in the table."""
+    def search_many(self, customer_ids):
+        result = []
+        for idx in self._find_slots(customer_ids).tolist():
+            result.append(self.records[self.slots[idx]] if idx != -1 else None)
+        return result
+
+    """Bytes used by the slot columns and the record list (not the customers themselves)."""
+    def get_memory_usage(self):
+        return (self.keys.nbytes + self.states.nbytes + self.slots.nbytes
+                + 8 * len(self.records))
@@ -1,147 +1,505 @@
-import numpy as np
-from Module2.HashEntry import CustomerEntry, hashError
-from Module2.Customer import Customer
-
-"""
-Customer Hash Table Implementation
-Uses linear probing for collision resolution
-"""
-class TableStats:
-    def __init__(self, size, count, load_factor):
-        self.size = size
-        self.count = count
-        self.load_factor = load_factor
-
-
-class CustomerHashTable:
-    MIN_SIZE = 53
-    MAX_LOAD_FACTOR = 0.7
-    MIN_LOAD_FACTOR = 0.3
-
-    def __init__(self, size=53):
-        if size < CustomerHashTable.MIN_SIZE:  # Check if provided size is less than minimum
-            size = CustomerHashTable.MIN_SIZE  # Set size to minimum if too small
-        self.size = size                       # Store the table size
-        self.count = 0
-        self.hash_array = np.empty(size, dtype=object)
-        for i in range(size):                     # Iterate through each index in the array
-            self.hash_array[i] = CustomerEntry()  # Initialize each slot with an empty CustomerEntry
-
-    """Find the next prime number after the given number"""
-    def _get_next_prime(self, num):  # Find the next prime number
-
-        def is_prime(n):             # Helper function to check if a number is prime
-            if n < 2:                # Check if number is less than 2
-                return False         # Return False as it is not prime
-            i = 2                    # Start checking divisibility from 2
-            while i * i <= n:        # Check up to square root of n
-                if n % i == 0:       # Check if n is divisible by i
-                    return False     # Return False if divisible
-                i += 1               # Increment divisor
-            return True
-
-        while not is_prime(num):  # Keep incrementing until a prime is found
-            num += 1              # Increment the number
-        return num                # Return the next prime number
-
-    """Resize the hash table to a new capacity and rehash all entries."""
-    def resize(self, new_capacity):
-        new_capacity = self._get_next_prime(new_capacity)
-        old_array = self.hash_array
-        self.size = new_capacity
-        self.hash_array = np.empty(self.size, dtype=object)
-
-        for i in range(self.size):                # Iterate through new array
-            self.hash_array[i] = CustomerEntry()  # Initialize each slot with an empty CustomerEntry
-
-        self.count = 0  # Reset count of entries
-
-        for entry in old_array:                          # Iterate through old array
-            if entry.state == CustomerEntry.USED_STATE:  # Check if entry is used
-                self.insert(entry.customer)              # Reinsert customer into new table
-
-    """Compute the hash value for a customer ID."""
-    def _hash(self, customer_id):
-        return customer_id % self.size  # Return customer_id modulo table size
-
-    """Find the slot for a customer ID using linear probing."""
-    def _find_slot(self, customer_id, for_insert=False):
-        start_idx = self._hash(customer_id)  # Compute initial hash index
-        idx = start_idx                      # Start at the hash index
-
-        for i in range(self.size):        # Iterate up to table size
-            entry = self.hash_array[idx]  # Get entry at current index
-
-            if for_insert:                # If searching for insertion
-                if entry.state in (CustomerEntry.EMPTY_STATE, CustomerEntry.DELETED_STATE):  # Check if slot is empty or deleted
-                    return idx                                                               # Return index for insertion
-                elif entry.customer and entry.customer.getID() == customer_id:               # Check if customer ID matches
-                    return idx                                                               # Return index for existing customer
-            else:                                                                            # If searching for lookup
-                if entry.state == CustomerEntry.EMPTY_STATE:                                 # Check if slot is empty
-                    return -1                                                                # Return -1 as customer not found
-                elif entry.customer and entry.customer.getID() == customer_id:               # Check if customer ID matches
-                    return idx                  # Return index of found customer
-            idx = (idx + 1) % self.size         # Move to next slot using linear probing
-            if idx == start_idx:                # Check if we've looped back to start
-                return -1 if not for_insert else idx  # Return -1 for lookup, current idx for insert
-        return -1                                     # Return -1 if no slot found
-
-    """Insert or update a customer in the hash table."""
-    def insert(self, customer):
-        if self.count >= self.size:
-            raise Exception("Hash table is full")
-
-        idx = self._find_slot(customer.getID(), for_insert=True)  # Find slot for insertion
-        if idx == -1:                                             # Check if no slot was found
-            raise Exception("Unable to insert customer")
-
-        entry = self.hash_array[idx]                 # Get entry at found index
-        if entry.state != CustomerEntry.USED_STATE:  # Check if slot is not already used
-            self.count += 1                          # Increment count of entries
-
-        entry.customer = customer               # Store customer in the entry
-        entry.state = CustomerEntry.USED_STATE  # Mark entry as used
-
-        if self.count / self.size > CustomerHashTable.MAX_LOAD_FACTOR:  # Check if load factor exceeds threshold
-            self.resize(self.size * 2)                                  # Resize table to double the size
-        return True                                                     # Return True to indicate success
-
-    """Search for a customer by their ID."""
-    def search(self, customer_id):
-        idx = self._find_slot(customer_id)      # Find slot for customer ID
-        if idx == -1:                           # Check if customer was not found
-            raise hashError(f"customer ID {customer_id} not found")
-        return self.hash_array[idx].customer                         # Return the customer object
-
-    """Delete a customer from the hash table by their ID."""
-    def delete(self, customer_id):
-        idx = self._find_slot(customer_id)  # Find slot for customer ID
-        if idx == -1:                       # Check if customer was not found
-            return False                    # Return False if not found
-
-        entry = self.hash_array[idx]  # Get entry at found index
-        entry.customer = None         # Clear customer data
-        entry.state = CustomerEntry.DELETED_STATE  # Mark entry as deleted
-
-        self.count -= 1  # Decrement count of entries
-
-        # Check if load factor is too low
-        if (self.size > CustomerHashTable.MIN_SIZE and self.count / self.size < CustomerHashTable.MIN_LOAD_FACTOR):
-            self.resize(max(self.size // 2, CustomerHashTable.MIN_SIZE))  # Resize to half size or minimum
-        return True  # Return True to indicate successful deletion
-
-    """Check if a customer with the given ID exists in the hash table."""
-    def has_customer(self, customer_id):
-        return self._find_slot(customer_id) != -1  # Return True if slot is found, False otherwise
-
-    def get_statistics(self):  # Get hash table statistics
-        return TableStats(self.size, self.count, self.count / self.size)  # Return TableStats object with current stats
-
-    def update_delivery_status(self, customer_id, new_status):  # Update a customer's delivery status
-        idx = self._find_slot(customer_id)  # Find slot for customer ID
-        if idx == -1:                       # Check if customer was not found
-            return False                    # Return False if not found
-
-        self.hash_array[idx].customer.setDeliveryStatus(new_status)  # Update customer's delivery status
+import copy
+import gc
+import numpy as np
+from Module2.HashEntry import CustomerEntry, hashError
+from Module2.Customer import Customer
+
+"""
+Customer Hash Table Implementation
+Uses linear probing for collision resolution
+
+TableStats: probe lengths count the slots a successful search looks
+at, 1 when the customer sits in its home slot. probe_histogram[d] is
+the number of customers d slots past their home slot, so long clusters
+show up as a long tail. During an incremental resize count, tombstones
+and the probe figures cover the old array as well as the new one, size
+and load_factor are the new array's.
+"""
+class TableStats:
+    def __init__(self, size, count, load_factor, average_probe=0.0, max_probe=0, probe_histogram=None, tombstones=0):
+        self.size = size
+        self.count = count
+        self.load_factor = load_factor
+        self.tombstones = tombstones
+        self.average_probe = average_probe
+        self.max_probe = max_probe
+        self.probe_histogram = probe_histogram if probe_histogram is not None else np.zeros(0, dtype=np.int64)
+
+
+"""
+Interface shared by the customer tables: sizing, hashing, bulk loading
+and statistics. Subclasses store the slots and provide insert, search,
+delete, update_delivery_status, resize, rehash, _find_slot and
+_displacements.
+
+hashing picks how an ID maps to its home slot:
+- MODULO_HASH: customer_id % size, sequential IDs fill neighbouring slots
+- FIBONACCI_HASH: multiply by 2^64 / golden ratio (mod 2^64), then scale
+  the top 32 bits to the table size, which spreads patterned IDs
+  (multiples of the size, runs of sequential IDs) across the table
+
+Deleted slots (tombstones) are counted. Once they pass
+MAX_TOMBSTONE_FACTOR of the table, or customers plus tombstones pass
+the max load factor, the table is rehashed in place (same array, same
+entries) so lookups stop stepping over them. A table holding more than
+MAX_REHASH_LOAD customers grows instead, a rehash at the same size
+would leave so little room that the next few deletes and inserts
+trigger another one.
+
+robin_hood=True keeps every cluster ordered by home slot: an insert
+takes the slot of a customer closer to its own home and carries that
+customer on, so probe lengths stay even, and a lookup stops as soon as
+it passes where the ID would have been. Deletes shift the rest of the
+cluster back one slot instead of leaving a tombstone.
+"""
+class CustomerTableBase:
+    MIN_SIZE = 53
+    MAX_LOAD_FACTOR = 0.7
+    MIN_LOAD_FACTOR = 0.3
+    MODULO_HASH = 'modulo'
+    FIBONACCI_HASH = 'fibonacci'
+    FIBONACCI_MULTIPLIER = 11400714819323198485  # 2^64 / golden ratio, odd
+    MAX_TOMBSTONE_FACTOR = 0.2
+    MAX_REHASH_LOAD = 0.6    # Above this, tombstones passing the max load grow the table instead of rehashing
+
+    def __init__(self, size=53, hashing=MODULO_HASH, robin_hood=False):
+        if hashing not in (CustomerTableBase.MODULO_HASH, CustomerTableBase.FIBONACCI_HASH):
+            raise hashError(f"Unknown hashing '{hashing}'")
+        if size < CustomerTableBase.MIN_SIZE:  # Check if provided size is less than minimum
+            size = CustomerTableBase.MIN_SIZE  # Set size to minimum if too small
+        self.size = size                       # Store the table size
+        self.hashing = hashing
+        self.robin_hood = robin_hood
+        self.count = 0                         # Customers in the table
+        self.tombstones = 0                    # Slots in DELETED_STATE
+
+    """
+    Find the next prime number at or after the given number.
+    Deterministic Miller-Rabin (exact for n below 3.3 * 10^24), so
+    each candidate costs a few pow() calls instead of sqrt(n) divisions.
+    """
+    @staticmethod
+    def _get_next_prime(num):  # Find the next prime number
+
+        def is_prime(n):             # Helper function to check if a number is prime
+            if n < 2:                # Check if number is less than 2
+                return False         # Return False as it is not prime
+            for p in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):   # Small primes as divisors and bases
+                if n % p == 0:
+                    return n == p
+            d = n - 1                # Write n - 1 as d * 2^r with d odd
+            r = 0
+            while d % 2 == 0:
+                d //= 2
+                r += 1
+            for a in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+                x = pow(a, d, n)
+                if x == 1 or x == n - 1:
+                    continue
+                for i in range(r - 1):
+                    x = x * x % n
+                    if x == n - 1:
+                        break
+                else:
+                    return False     # a proves n composite
+            return True
+
+        if num > 2 and num % 2 == 0:  # Even numbers above 2 are never prime
+            num += 1
+        while not is_prime(num):  # Keep incrementing until a prime is found
+            num += 1 if num < 3 else 2  # Only odd candidates after 2
+        return num                # Return the next prime number
+
+    """Smallest prime size that holds expected customers without passing the max load factor."""
+    @staticmethod
+    def _capacity_for(expected):
+        needed = int(expected / CustomerTableBase.MAX_LOAD_FACTOR) + 1
+        return CustomerTableBase._get_next_prime(max(needed, CustomerTableBase.MIN_SIZE))
+
+    """Grow once so that expected more customers fit without any resize on the way."""
+    def reserve(self, expected):
+        capacity = self._capacity_for(self.count + expected)
+        if capacity > self.size:
+            self.resize(capacity)
+
+    """Insert many customers, call reserve first so insert never has to resize."""
+    def insert_many(self, customers):
+        gc_was_enabled = gc.isenabled()
+        gc.disable()                              # Millions of new objects, none of them cyclic garbage
+        try:
+            for customer in customers:
+                self.insert(customer)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    """
+    Build a table for an iterable of customers, sized once for expected
+    customers (len(customers) if not given) at the max load factor.
+    Inserting more than expected still works, with normal resizing.
+    """
+    @classmethod
+    def from_customers(cls, customers, expected=None, hashing=MODULO_HASH, robin_hood=False, incremental=False):
+        if expected is None:
+            if not hasattr(customers, '__len__'):
+                customers = list(customers)
+            expected = len(customers)
+        table = cls(cls._capacity_for(expected), hashing, robin_hood, incremental)
+        table.insert_many(customers)
+        return table
+
+    """Compute the hash value for a customer ID."""
+    def _hash(self, customer_id):
+        if self.hashing == CustomerTableBase.FIBONACCI_HASH:
+            mixed = (customer_id * CustomerTableBase.FIBONACCI_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF
+            return ((mixed >> 32) * self.size) >> 32   # Top bits are the well mixed ones
+        return customer_id % self.size  # Return customer_id modulo table size
+
+    """Check if a customer with the given ID exists in the hash table."""
+    def has_customer(self, customer_id):
+        return self._find_slot(customer_id) != -1  # Return True if slot is found, False otherwise
+
+    """Deleted slots lookups may step over, reported by get_statistics."""
+    def _tombstone_count(self):
+        return self.tombstones
+
+    def get_statistics(self):  # Get hash table statistics
+        displacements = self._displacements()
+        tombstones = self._tombstone_count()
+        if displacements.size == 0:
+            return TableStats(self.size, self.count, self.count / self.size, tombstones=tombstones)
+        return TableStats(self.size, self.count, self.count / self.size,  # Return TableStats object with current stats
+                          float(displacements.mean()) + 1, int(displacements.max()) + 1, np.bincount(displacements),
+                          tombstones)
+
+
+"""
+Slot table of CustomerEntry objects, one per slot.
+
+incremental=True spreads growing and shrinking over later operations
+instead of rehashing everything inside one insert. The current array
+is kept as old_table and a new one starts (filled with one shared empty
+entry, so no per slot objects up front). Every insert, search, update
+and delete first moves the next MIGRATION_STEP old slots across, and a
+customer still in the old array is found, updated or deleted there.
+Moved and deleted old slots become tombstones so the old probe
+sequences stay whole. Every old slot is swapped for a shared empty or
+deleted entry as it is passed, so its own entry is freed then and not
+all at once with the old array. Clearing tombstones is a move into a
+fresh array of the same size. Load and tombstone checks wait while a
+move is in progress, so a new resize never has to finish the last one
+in one go; a table already past the max load moves MIGRATION_CATCH_UP
+times as many slots per operation so it is not left overfull for long.
+"""
+_EMPTY_ENTRY = CustomerEntry()   # Shared by every untouched slot of a new incremental array, never written to
+_DELETED_ENTRY = CustomerEntry()  # Shared by every moved or deleted slot of an old array, never written to
+_DELETED_ENTRY.state = CustomerEntry.DELETED_STATE
+
+class CustomerHashTable(CustomerTableBase):
+    MIGRATION_STEP = 8                           # Old slots moved per operation while resizing incrementally
+    MIGRATION_CATCH_UP = 4                       # Step multiplier while a grow waits for the move to finish
+
+    def __init__(self, size=53, hashing=CustomerTableBase.MODULO_HASH, robin_hood=False, incremental=False):
+        super().__init__(size, hashing, robin_hood)
+        self.incremental = incremental
+        self.old_table = None                  # Table being moved out of during an incremental resize
+        self.migrated = 0                      # Old slots moved so far
+        self.hash_array = np.empty(self.size, dtype=object)
+        self.hash_array[:] = [CustomerEntry() for i in range(self.size)]  # Initialize each slot with an empty CustomerEntry
+
+    """
+    Resize the hash table to a new capacity and rehash all entries.
+    Used entries move into the new array as they are (no new
+    CustomerEntry for them and no call to insert), only the free slots
+    get fresh entries.
+    """
+    def resize(self, new_capacity):
+        if self.old_table is not None:
+            self._migrate(self.old_table.size)   # Finish an incremental resize first
+        new_capacity = self._get_next_prime(new_capacity)
+        old_array = self.hash_array
+        self.size = new_capacity
+        slots = [None] * self.size                # Plain list while placing, copied into numpy at the end
+
+        self.count = 0  # Reset count of entries
+        self.tombstones = 0
+        for entry in old_array:                          # Iterate through old array
+            if entry.state == CustomerEntry.USED_STATE:  # Check if entry is used
+                self._place(slots, entry)
+                self.count += 1
+
+        for i in range(self.size):                # Remaining slots get an empty CustomerEntry
+            if slots[i] is None:
+                slots[i] = CustomerEntry()
+        self.hash_array = np.empty(self.size, dtype=object)
+        self.hash_array[:] = slots
+
+    """
+    Put a used entry into a list of slots (None = empty) holding no
+    deleted slots, by linear probing or the Robin Hood rule.
+    """
+    def _place(self, slots, entry):
+        idx = self._hash(entry.customer.getID())
+        distance = 0
+        while slots[idx] is not None:
+            if self.robin_hood:
+                resident_distance = (idx - self._hash(slots[idx].customer.getID())) % self.size
+                if resident_distance < distance:     # Resident is closer to home, it moves on instead
+                    slots[idx], entry = entry, slots[idx]
+                    distance = resident_distance
+            idx = (idx + 1) % self.size
+            distance += 1
+        slots[idx] = entry
+
+    """
+    Rehash at the same size, reusing the array and its entries: clears
+    every tombstone and puts each customer back as close to home as it
+    can get.
+    """
+    def rehash(self):
+        slots = [None] * self.size
+        spare = []                                 # Empty and deleted entries, reused for the free slots
+        for entry in self.hash_array:
+            if entry.state == CustomerEntry.USED_STATE:
+                self._place(slots, entry)
+            else:
+                entry.customer = None
+                entry.state = CustomerEntry.EMPTY_STATE
+                spare.append(entry)
+        for idx in range(self.size):
+            if slots[idx] is None:
+                slots[idx] = spare.pop()
+        self.hash_array[:] = slots
+        self.tombstones = 0
+
+    """Start an incremental resize, the current array becomes old_table and is emptied a few slots at a time."""
+    def _start_migration(self, new_capacity):
+        if self.old_table is not None:
+            self._migrate(self.old_table.size)   # Not reached from insert or delete, their checks wait for the move
+        self.old_table = copy.copy(self)         # Shares the current array, only read and emptied from now on
+        self.migrated = 0
+        self.size = self._get_next_prime(new_capacity)
+        self.hash_array = np.full(self.size, _EMPTY_ENTRY, dtype=object)
+        self.tombstones = 0
+
+    """Old slots to move this operation, more while the table is past the max load and waiting to grow."""
+    def _migration_steps(self):
+        if self.count > CustomerHashTable.MAX_LOAD_FACTOR * self.size:
+            return CustomerHashTable.MIGRATION_STEP * CustomerHashTable.MIGRATION_CATCH_UP
+        return CustomerHashTable.MIGRATION_STEP
+
+    """Move up to steps old slots into the current array."""
+    def _migrate(self, steps):
+        old_table = self.old_table
+        old_array = old_table.hash_array
+        end = min(self.migrated + steps, old_table.size)
+        for idx in range(self.migrated, end):
+            entry = old_array[idx]
+            if entry.state == CustomerEntry.EMPTY_STATE:
+                old_array[idx] = _EMPTY_ENTRY
+            else:
+                if entry.state == CustomerEntry.USED_STATE:
+                    self._store(entry.customer)
+                old_array[idx] = _DELETED_ENTRY             # Keeps probe sequences through here whole
+        self.migrated = end
+        if end == old_table.size:
+            self.old_table = None
+
+    """Table (self or old_table) and slot holding a customer ID, slot -1 if neither has it."""
+    def _find_any(self, customer_id):
+        if self.old_table is not None:
+            self._migrate(self._migration_steps())
+        idx = self._find_slot(customer_id)
+        if idx == -1 and self.old_table is not None:
+            return self.old_table, self.old_table._find_slot(customer_id)
+        return self, idx
+
+    """
+    Find the slot for a customer ID using linear probing. An insert goes
+    into the first deleted slot on the way if the ID is not further on.
+    """
+    def _find_slot(self, customer_id, for_insert=False):
+        idx = self._hash(customer_id)  # Compute initial hash index
+        first_deleted = -1             # First tombstone passed, for insert
+
+        for distance in range(self.size):  # Iterate up to table size
+            entry = self.hash_array[idx]   # Get entry at current index
+
+            if entry.state == CustomerEntry.EMPTY_STATE:                          # Empty slot ends the probe
+                if for_insert:
+                    return first_deleted if first_deleted != -1 else idx         # Reuse a tombstone if one was passed
+                return -1                                                         # Return -1 as customer not found
+            if entry.state == CustomerEntry.DELETED_STATE:
+                if first_deleted == -1:
+                    first_deleted = idx
+            elif entry.customer.getID() == customer_id:                           # Check if customer ID matches
+                return idx                                                        # Return index of found customer
+            elif self.robin_hood and (idx - self._hash(entry.customer.getID())) % self.size < distance:
+                return -1                                                         # The ID would have taken this slot
+            idx = (idx + 1) % self.size                                           # Move to next slot using linear probing
+        return first_deleted if for_insert else -1                                # Looped round the whole table
+
+    """Insert or update a customer in the hash table."""
+    def insert(self, customer):
+        if self.old_table is not None:
+            self._migrate(self._migration_steps())
+            if self.old_table is not None:
+                idx = self.old_table._find_slot(customer.getID())
+                if idx != -1:                                         # Not moved yet, update it where it is
+                    self.old_table.hash_array[idx].customer = customer
+                    return True
+        if self.count >= self.size:
+            raise Exception("Hash table is full")
+
+        if self._store(customer):  # Store in the current array
+            self.count += 1        # Increment count of entries
+
+        if self.old_table is not None:
+            return True                                                 # Checks wait until the move in progress is done
+        if self.count / self.size > CustomerHashTable.MAX_LOAD_FACTOR:  # Check if load factor exceeds threshold
+            if self.incremental:
+                self._start_migration(self.size * 2)
+            else:
+                self.resize(self.size * 2)                              # Resize table to double the size
+        elif (self.count + self.tombstones) / self.size > CustomerHashTable.MAX_LOAD_FACTOR:
+            new_capacity = self.size
+            if self.count / self.size > CustomerHashTable.MAX_REHASH_LOAD:
+                new_capacity = self.size * 2                            # Nearly full anyway, grow
+            if self.incremental:
+                self._start_migration(new_capacity)                     # Tombstones stay behind in the old array
+            elif new_capacity > self.size:
+                self.resize(new_capacity)
+            else:
+                self.rehash()                                           # Mostly tombstones, same size is enough
+        return True                                                     # Return True to indicate success
+
+    """Put a customer in the current array, True if it was not there before."""
+    def _store(self, customer):
+        if self.robin_hood:
+            return self._insert_robin_hood(customer)
+        idx = self._find_slot(customer.getID(), for_insert=True)  # Find slot for insertion
+        if idx == -1:                                             # Check if no slot was found
+            raise Exception("Unable to insert customer")
+
+        entry = self.hash_array[idx]                 # Get entry at found index
+        if entry is _EMPTY_ENTRY:                    # Shared empty entry, give the slot its own
+            entry = CustomerEntry()
+            self.hash_array[idx] = entry
+        added = entry.state != CustomerEntry.USED_STATE  # Check if slot is not already used
+        if entry.state == CustomerEntry.DELETED_STATE:
+            self.tombstones -= 1                     # Tombstone reused
+
+        entry.customer = customer               # Store customer in the entry
+        entry.state = CustomerEntry.USED_STATE  # Mark entry as used
+        return added
+
+    """Robin Hood insert, take the slot of any customer closer to home than us and carry it on."""
+    def _insert_robin_hood(self, customer):
+        idx = self._find_slot(customer.getID())
+        if idx != -1:                               # Same ID, replace the customer
+            self.hash_array[idx].customer = customer
+            return False
+        idx = self._hash(customer.getID())
+        distance = 0
+        while True:
+            entry = self.hash_array[idx]
+            if entry.state != CustomerEntry.USED_STATE:   # No tombstones in Robin Hood mode, so empty
+                if entry is _EMPTY_ENTRY:
+                    entry = CustomerEntry()
+                    self.hash_array[idx] = entry
+                entry.customer = customer
+                entry.state = CustomerEntry.USED_STATE
+                return True
+            resident_distance = (idx - self._hash(entry.customer.getID())) % self.size
+            if resident_distance < distance:
+                entry.customer, customer = customer, entry.customer
+                distance = resident_distance
+            idx = (idx + 1) % self.size
+            distance += 1
+
+    """Backward shift delete: move the rest of the cluster back a slot until a customer is at home or a slot is empty."""
+    def _shift_back(self, idx):
+        next_idx = (idx + 1) % self.size
+        while True:
+            next_entry = self.hash_array[next_idx]
+            if (next_entry.state != CustomerEntry.USED_STATE
+                    or self._hash(next_entry.customer.getID()) == next_idx):
+                break
+            self.hash_array[idx].customer = next_entry.customer
+            idx = next_idx
+            next_idx = (next_idx + 1) % self.size
+        self.hash_array[idx].customer = None
+        self.hash_array[idx].state = CustomerEntry.EMPTY_STATE
+
+    """Search for a customer by their ID."""
+    def search(self, customer_id):
+        table, idx = self._find_any(customer_id)  # Find slot for customer ID
+        if idx == -1:                           # Check if customer was not found
+            raise hashError(f"customer ID {customer_id} not found")
+        return table.hash_array[idx].customer                         # Return the customer object
+
+    """Delete a customer from the hash table by their ID."""
+    def delete(self, customer_id):
+        table, idx = self._find_any(customer_id)  # Find slot for customer ID
+        if idx == -1:                       # Check if customer was not found
+            return False                    # Return False if not found
+
+        if table is not self:             # Not moved yet, leave a tombstone in the old array
+            entry = table.hash_array[idx]
+            entry.customer = None
+            entry.state = CustomerEntry.DELETED_STATE
+        elif self.robin_hood:
+            self._shift_back(idx)     # No tombstone left behind
+        else:
+            entry = self.hash_array[idx]  # Get entry at found index
+            entry.customer = None         # Clear customer data
+            entry.state = CustomerEntry.DELETED_STATE  # Mark entry as deleted
+            self.tombstones += 1
+
+        self.count -= 1  # Decrement count of entries
+
+        if self.old_table is not None:
+            return True                                                    # Checks wait until the move in progress is done
+        # Check if load factor is too low
+        if (self.size > CustomerHashTable.MIN_SIZE and self.count / self.size < CustomerHashTable.MIN_LOAD_FACTOR):
+            if self.incremental:
+                self._start_migration(max(self.size // 2, CustomerHashTable.MIN_SIZE))
+            else:
+                self.resize(max(self.size // 2, CustomerHashTable.MIN_SIZE))  # Resize to half size or minimum
+        elif self.tombstones > CustomerHashTable.MAX_TOMBSTONE_FACTOR * self.size:
+            if self.incremental:
+                self._start_migration(self.size)                           # Clear tombstones a few slots at a time
+            else:
+                self.rehash()                                              # Clear tombstones in place
+        return True  # Return True to indicate successful deletion
+
+    """Check if a customer with the given ID exists in either array."""
+    def has_customer(self, customer_id):
+        return self._find_any(customer_id)[1] != -1  # Return True if slot is found, False otherwise
+
+    """How far each stored customer sits past its home slot, as an int array. Customers not moved yet count in the old array."""
+    def _displacements(self):
+        displacements = []
+        for idx in range(self.size):
+            entry = self.hash_array[idx]
+            if entry.state == CustomerEntry.USED_STATE:
+                displacements.append((idx - self._hash(entry.customer.getID())) % self.size)
+        displacements = np.array(displacements, dtype=np.int64)
+        if self.old_table is not None:
+            displacements = np.concatenate((displacements, self.old_table._displacements()))
+        return displacements
+
+    """Tombstones of the current array plus, while resizing, the deleted and moved slots of the old one."""
+    def _tombstone_count(self):
+        if self.old_table is None:
+            return self.tombstones
+        old_deleted = sum(1 for entry in self.old_table.hash_array if entry.state == CustomerEntry.DELETED_STATE)
+        return self.tombstones + old_deleted
+
+    def update_delivery_status(self, customer_id, new_status):  # Update a customer's delivery status
+        table, idx = self._find_any(customer_id)  # Find slot for customer ID
+        if idx == -1:                       # Check if customer was not found
+            return False                    # Return False if not found
+
+        table.hash_array[idx].customer.setDeliveryStatus(new_status)  # Update customer's delivery status
         return True                                                  # Return True to indicate successful update
\ No newline at end of file
@@ -1,17 +1,36 @@
-from Module2.HashTable import CustomerHashTable
-
-class LookUpCustomer:
-    def __init__(self):
-        self.ht = CustomerHashTable()
-
-    def insertCustomer(self, customer):
-        return self.ht.insert(customer)
-
-    def searchCustomer(self, customer_id):
-        return self.ht.search(customer_id)
-
-    def deleteCustomer(self, customer_id):
-        return self.ht.delete(customer_id)
-
-    def updateStatus(self, customer_id, new_status):
-        return self.ht.update_delivery_status(customer_id, new_status)
\ No newline at end of file
+from Module2.HashTable import CustomerHashTable
+
+"""
+table: hash table to use, a CustomerHashTable by default. Pass a
+CustomerArrayTable for the array based table (integer IDs only).
+"""
+class LookUpCustomer:
+    def __init__(self, table=None):
+        self.ht = table if table is not None else CustomerHashTable()
+
+    def insertCustomer(self, customer):
+        return self.ht.insert(customer)
+
+    def searchCustomer(self, customer_id):
+        return self.ht.search(customer_id)
+
+    def deleteCustomer(self, customer_id):
+        return self.ht.delete(customer_id)
+
+    def updateStatus(self, customer_id, new_status):
+        return self.ht.update_delivery_status(customer_id, new_status)
+
+    """
+    Load many customers at once. The table grows once up front for
+    expected more customers (len(customers) if not given) instead of
+    doubling again and again while inserting.
+    """
+    def bulk_load(self, customers, expected=None):
+        if expected is None:
+            if not hasattr(customers, '__len__'):
+                customers = list(customers)
+            expected = len(customers)
+        before = self.ht.count
+        self.ht.reserve(expected)
+        self.ht.insert_many(customers)
+        return self.ht.count - before
@@ -1,366 +1,622 @@
-"""
-Test file for module 2: Customer Hash Table
-Tests core functionality, collision handling and resizing.
-uses customerdata.csv
-"""
-import os
-from Module2.Customer import Customer
-from Module2.LookUpCustomer import LookUpCustomer
-from Module2.HashEntry import hashError
-from Module2.HashTable import CustomerHashTable
-
-"""Parse CustomerData.csv, return num of customers loaded"""
-def parseCSV(filename):
-    module_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(module_dir, filename)
-    
-    lookup = LookUpCustomer()
-    loadedCustomers = 0
-
-    try:
-        with open(csv_path, 'r') as file:
-            lines = file.readlines()
-
-            # Skip header
-            for line in lines[1:]:
-                # Tokenize the line using split
-                fields = line.strip().split(',')
-
-                # Ensure the line has exactly 5 fields
-                if len(fields) != 5:
-                    print(f"Skipping invalid line: {line.strip()} (incorrect number of fields)")
-                    continue
-
-                # Extract fields
-                try:
-                    customerID = int(fields[0])  # Convert to int
-                    name = fields[1].replace('_', ' ')
-                    address = fields[2].replace('_', ' ')
-                    priorityLevel = int(fields[3])  # Convert to int
-                    deliveryStatus = fields[4].replace('_', ' ')
-
-                    # Create and insert customer
-                    customer = Customer(customerID, name, address, priorityLevel, deliveryStatus)
-                    lookup.insertCustomer(customer)
-                    loadedCustomers += 1
-                except ValueError as e:
-                    print(f"Skipping invalid line: {line.strip()} (value error: {e})")
-                except hashError as e:
-                    print(f"Skipping line due to invalid priority: {line.strip()} ({e})")
-            return loadedCustomers, lookup
-    except FileNotFoundError:
-        print(f"Error: {filename} was not found")
-        return 0, lookup
-    except Exception as e:
-        print(f"Error loading csv: {e}")
-        return 0, lookup
-
-"""Test insert, search, delete and updates"""
-def testFunctionality(lookup):
-    print("\n--- Testing the main functionality ---")
-
-    # insertion done in parseCsv, verify the count
-    stats = lookup.ht.get_statistics()
-    print(f"\n1) Inserted {stats.count} customers from CSV")
-    print(f"Table stats: size = {stats.size}, count = {stats.count}, load factor = {stats.load_factor:.3f}")
-
-    # test search
-    print("\n2) Testing search:")
-    customer_id = 53
-    try:
-        foundCustomer = lookup.searchCustomer(customer_id)
-        print(f"Found customer {customer_id:} {foundCustomer.getName()} - {foundCustomer.getDeliveryStatus()}")
-    except hashError as e:
-        print(f"Customer {customer_id} not found, (expected: {e}) ")
-
-    customer_id = 1001
-    try:
-        foundCustomer = lookup.searchCustomer(customer_id)
-        print(f" Found customer {customer_id}: {foundCustomer.getName()} - {foundCustomer.getDeliveryStatus()}")
-    except hashError as e:
-        print(f"Customer {customer_id} not found (expected: {e})")
-
-    customer_id = 1002
-    try:
-        foundCustomer = lookup.searchCustomer(customer_id)
-        print(f"Found customer {customer_id}: {foundCustomer.getName()} - {foundCustomer.getDeliveryStatus()}")
-    except hashError as e:
-        print(f"Customer {customer_id} not found (expected: {e})")
-
-    customer_id = 999
-    try:
-        foundCustomer = lookup.searchCustomer(customer_id)
-        print(f"Found non-existent customer {customer_id}!")
-    except hashError as e:
-        print(f"Customer {customer_id} not found (expected: {e})")
-
-    # Test update delivery status
-    print("\n3) Testing delivery status update")
-
-    customer_id = 53
-    new_status = "Delivered"
-    result = lookup.updateStatus(customer_id, new_status)
-    print(f"Update customer {customer_id} to '{new_status}': {'Success' if result else 'Failed'}")
-    if result:
-        try:
-            updated_customer = lookup.searchCustomer(customer_id)
-            print(f"Verified status: {updated_customer.getDeliveryStatus()}")
-        except hashError as e:
-            print(f" Verification failed: {e}")
-
-    customer_id = 1001
-    new_status = "Out for delivered"
-    result = lookup.updateStatus(customer_id, new_status)
-    print(f"Update customer {customer_id} to '{new_status}': {'Success' if result else 'Failed'}")
-    if result:
-        try:
-            updated_customer = lookup.searchCustomer(customer_id)
-            print(f"Verified status: {updated_customer.getDeliveryStatus()}")
-        except hashError as e:
-            print(f" Verification failed: {e}")
-
-    customer_id = 999
-    new_status = "Processing"
-    result = lookup.updateStatus(customer_id, new_status)
-    print(f"Update customer {customer_id} to '{new_status}': {'Success' if result else 'Failed'}")
-    if result:
-        try:
-            updated_customer = lookup.searchCustomer(customer_id)
-            print(f"Verified status: {updated_customer.getDeliveryStatus()}")
-        except hashError as e:
-            print(f" Verification failed: {e}")
-
-    # test delete
-    print("\n4) Testing the delete function")
-    customer_id = 1002
-    result = lookup.deleteCustomer(customer_id)
-    print(f"Delete customer {customer_id}: {'Success' if result else 'Failed'}")
-    try:
-        lookup.searchCustomer(customer_id)
-        print(f"Error, customer {customer_id} still found after deleting")
-    except hashError as e:
-        print(f"Confirmed, customer {customer_id} has been deleted")
-
-    customer_id = 999
-    result = lookup.deleteCustomer(customer_id)
-    print(f"Delete customer {customer_id}: {'Success' if result else 'Failed'}")
-    try:
-        lookup.searchCustomer(customer_id)
-        print(f"Error, customer {customer_id} still found after deleting")
-    except hashError as e:
-        print(f"Confirmed, customer {customer_id} has been deleted")
-
-"""Test linear probing with ID's 53 and 106"""
-def testCollisionHandling(lookup):
-    print("\n--- Testing collision handling ---")
-    print("\nVerifying customers with colliding hash values (53, 106):")
-
-    customer_id = 53
-    try:
-        found = lookup.searchCustomer(customer_id)
-        hash_value = customer_id % 53
-        print(f"Retrieved ID {customer_id} (hash: {hash_value}): {found.getName()} - {found.getDeliveryStatus()}")
-    except hashError as e:
-        print(f"Error, failed to retrieve ID {customer_id}: {e}")
-
-    customer_id = 106
-    try:
-        found = lookup.searchCustomer(customer_id)
-        hash_value = customer_id % 53
-        print(f"Retrieved ID {customer_id} (hash: {hash_value}): {found.getName()} - {found.getDeliveryStatus()}")
-    except hashError as e:
-        print(f"Error, failed to retrieve ID {customer_id}: {e}")
-
-"""Test resizing based on the load factor"""
-def testLoadFactor(lookup):
-    print("\n--- Testing load factor and resizing ---")
-    stats = lookup.ht.get_statistics()
-
-    print("\nCurrent table stats:")
-    print(f"Size: {stats.size}, count: {stats.count}, load factor: {stats.load_factor:.3f}")
-
-    # Check if table has already been upsized from minimum size
-    if stats.size > CustomerHashTable.MIN_SIZE:
-        print(f"Table has already been upsized from minimum size {CustomerHashTable.MIN_SIZE} to {stats.size}")
-        print("This occurred during CSV loading when load factor exceeded 0.7")
-
-    # Test additional upsizing if we're close to the threshold
-    if stats.load_factor > 0.5:  # Test when we're getting close to 0.7
-        print(f"\nTesting additional upsizing (current load factor: {stats.load_factor:.3f}):")
-        try:
-            current_size = stats.size
-
-            # Add customers until we trigger a resize
-            i = 10000
-            while i < 10010:
-                customer = Customer(i, f"Extra_{i}", f"{i}_Extra_St", 1, "In_Transit")
-                lookup.insertCustomer(customer)
-
-                new_stats = lookup.ht.get_statistics()
-                print(f"Added ID {i}: size = {new_stats.size}, count = {new_stats.count}, load factor = {new_stats.load_factor:.3f}")
-
-                if new_stats.size > current_size:
-                    print(f"Table successfully upsized from {current_size} to {new_stats.size}")
-                    return  # Exit early after successful resize
-
-                if new_stats.load_factor > 0.75:  # Safety check
-                    print("Reached high load factor without resize - stopping test")
-                    return
-                i += 1
-
-        except Exception as e:
-            print(f"Insertion error: {e}")
-    else:
-        print(f"Load factor ({stats.load_factor:.3f}) is too low to test upsizing efficiently")
-
-    # Test downsizing
-    print(f"\nTesting downsizing (need load factor < {CustomerHashTable.MIN_LOAD_FACTOR}):")
-    stats = lookup.ht.get_statistics()
-    initial_size = stats.size
-
-    # Calculate how many customers we need to delete to trigger downsizing
-    target_count_float = stats.size * CustomerHashTable.MIN_LOAD_FACTOR
-    target_count = int(target_count_float) - 1
-    customers_to_delete = stats.count - target_count
-    if customers_to_delete < 0:
-        customers_to_delete = 0
-
-    print(f"Current: {stats.count} customers, need to delete ~{customers_to_delete} to trigger downsize")
-
-    if customers_to_delete > 0 and stats.size > CustomerHashTable.MIN_SIZE:
-        deleted = 0
-        # Start from higher IDs to avoid deleting test-critical customers
-        customer_id = 1020
-        while customer_id < 1060 and deleted < customers_to_delete:
-            # Check if customer exists by trying to search for it
-            customer_exists = False
-            try:
-                lookup.searchCustomer(customer_id)
-                customer_exists = True
-            except hashError:
-                customer_exists = False
-
-            # If customer exists, try to delete it
-            if customer_exists:
-                delete_result = lookup.deleteCustomer(customer_id)
-                if delete_result:
-                    deleted += 1
-
-                    # Check progress every 5 deletions or when we reach target
-                    if deleted % 5 == 0 or deleted == customers_to_delete:
-                        new_stats = lookup.ht.get_statistics()
-                        print(f"Deleted {deleted} customers: size = {new_stats.size}, count = {new_stats.count}, load factor = {new_stats.load_factor:.3f}")
-
-                        if new_stats.size < initial_size:
-                            print(f"Table successfully downsized from {initial_size} to {new_stats.size}")
-                            return
-            customer_id += 1
-
-        # If we didn't trigger a downsize, check why
-        final_stats = lookup.ht.get_statistics()
-        if final_stats.size == initial_size:
-            if final_stats.size <= CustomerHashTable.MIN_SIZE:
-                print(f"Table remained at minimum size {CustomerHashTable.MIN_SIZE} (no downsizing below minimum)")
-            else:
-                print(f"Load factor {final_stats.load_factor:.3f} still above minimum threshold {CustomerHashTable.MIN_LOAD_FACTOR}")
-    else:
-        print(f"Cannot test downsizing: table at minimum size ({CustomerHashTable.MIN_SIZE}) or insufficient customers")
-
-"""Test error conditions"""
-def testErrorHandling(lookup):
-    print("\n--- Testing error handling ---")
-
-    # test invalid priority
-    priority = 0
-    try:
-        customer = Customer(9999, "test customer", "test address", priority, "test status")
-        lookup.insertCustomer(customer)
-        print(f"Error, priority {priority} should have been rejected")
-    except hashError as e:
-        print(f" correctly rejected priority {priority}: {e}")
-
-    priority = 6
-    try:
-        customer = Customer(9999, "test customer", "test address", priority, "test status")
-        lookup.insertCustomer(customer)
-        print(f"Error, priority {priority} should have been rejected")
-    except hashError as e:
-        print(f" correctly rejected priority {priority}: {e}")
-
-    priority = -1
-    try:
-        customer = Customer(9999, "test customer", "test address", priority, "test status")
-        lookup.insertCustomer(customer)
-        print(f"Error, priority {priority} should have been rejected")
-    except hashError as e:
-        print(f" correctly rejected priority {priority}: {e}")
-
-    # Test non existent customer
-    print("\n2) Testing on non existent customer")
-
-    customer_id = 999
-    try:
-        customer = lookup.searchCustomer(customer_id)
-        print(f"Error, found a non existent customer {customer_id}")
-    except hashError as e:
-        print(f"Correctly handled missing customer")
-    result = lookup.updateStatus(customer_id, "test status")
-    print(f"Update non existent ID {customer_id}: {'Success' if result else 'Failed (expected)'}")
-
-    customer_id = 1234
-    try:
-        customer = lookup.searchCustomer(customer_id)
-        print(f"Error, found a non existent customer {customer_id}")
-    except hashError as e:
-        print(f"Correctly handled missing customer")
-    result = lookup.updateStatus(customer_id, "test status")
-    print(f"Update non existent ID {customer_id}: {'Success' if result else 'Failed (expected)'}")
-
-
-"""Verify handling of 50+ customers"""
-def test50Customers(lookup, loadedCustomers):
-    print("\n--- Testing with 50+ customers ---")
-    stats = lookup.ht.get_statistics()
-    print(f"\nLoaded {loadedCustomers} customers from CSV")
-    if loadedCustomers < 50:
-        print(f"Warning, expected 50+ customers, loaded {loadedCustomers}")
-    print(f"Table stats size = {stats.size}, Count={stats.count}, Load Factor={stats.load_factor:.3f}")
-
-    print("\nVerifying retrieval of sample customers:")
-    customer_id = 53
-    try:
-        customer = lookup.searchCustomer(customer_id)
-        print(f"Retrieved ID {customer_id}: {customer.getName()} - {customer.getDeliveryStatus()}")
-    except hashError as e:
-        print(f"Failed to retrieve ID {customer_id}: {e}")
-
-    customer_id = 1001
-    try:
-        customer = lookup.searchCustomer(customer_id)
-        print(f"Retrieved ID {customer_id}: {customer.getName()} - {customer.getDeliveryStatus()}")
-    except hashError as e:
-        print(f"Failed to retrieve ID {customer_id}: {e}")
-
-def main():
-    print("Module 2: customer hash table test cases")
-
-    try:
-        loadedCustomers, lookup = parseCSV('CustomerData.csv')
-        if loadedCustomers == 0:
-            print("No customers have been loading")
-            return
-
-        testFunctionality(lookup)
-        testCollisionHandling(lookup)
-        testLoadFactor(lookup)
-        testErrorHandling(lookup)
-        test50Customers(lookup, loadedCustomers)
-
-        print("All tests complete")
-    except Exception as e:
-        print(f"\nTest case failed with error: {e}")
-        import traceback
-        traceback.print_exc()
-
-if __name__ == '__main__':
-    main()
+"""
+Test file for module 2: Customer Hash Table
+Tests core functionality, collision handling and resizing.
+uses customerdata.csv
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+from Module2.Customer import Customer
+from Module2.LookUpCustomer import LookUpCustomer
+from Module2.HashEntry import hashError
+from Module2.HashTable import CustomerHashTable
+from Module2.ArrayHashTable import CustomerArrayTable
+
+"""Parse CustomerData.csv, return num of customers loaded"""
+def parseCSV(filename, table=None):
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    csv_path = os.path.join(module_dir, filename)
+    
+    lookup = LookUpCustomer(table)
+    loadedCustomers = 0
+
+    try:
+        with open(csv_path, 'r') as file:
+            lines = file.readlines()
+
+            # Skip header
+            for line in lines[1:]:
+                # Tokenize the line using split
+                fields = line.strip().split(',')
+
+                # Ensure the line has exactly 5 fields
+                if len(fields) != 5:
+                    print(f"Skipping invalid line: {line.strip()} (incorrect number of fields)")
+                    continue
+
+                # Extract fields
+                try:
+                    customerID = int(fields[0])  # Convert to int
+                    name = fields[1].replace('_', ' ')
+                    address = fields[2].replace('_', ' ')
+                    priorityLevel = int(fields[3])  # Convert to int
+                    deliveryStatus = fields[4].replace('_', ' ')
+
+                    # Create and insert customer
+                    customer = Customer(customerID, name, address, priorityLevel, deliveryStatus)
+                    lookup.insertCustomer(customer)
+                    loadedCustomers += 1
+                except ValueError as e:
+                    print(f"Skipping invalid line: {line.strip()} (value error: {e})")
+                except hashError as e:
+                    print(f"Skipping line due to invalid priority: {line.strip()} ({e})")
+            return loadedCustomers, lookup
+    except FileNotFoundError:
+        print(f"Error: {filename} was not found")
+        return 0, lookup
+    except Exception as e:
+        print(f"Error loading csv: {e}")
+        return 0, lookup
+
+"""Test insert, search, delete and updates"""
+def testFunctionality(lookup):
+    print("\n--- Testing the main functionality ---")
+
+    # insertion done in parseCsv, verify the count
+    stats = lookup.ht.get_statistics()
+    print(f"\n1) Inserted {stats.count} customers from CSV")
+    print(f"Table stats: size = {stats.size}, count = {stats.count}, load factor = {stats.load_factor:.3f}")
+
+    # test search
+    print("\n2) Testing search:")
+    customer_id = 53
+    try:
+        foundCustomer = lookup.searchCustomer(customer_id)
+        print(f"Found customer {customer_id:} {foundCustomer.getName()} - {foundCustomer.getDeliveryStatus()}")
+    except hashError as e:
+        print(f"Customer {customer_id} not found, (expected: {e}) ")
+
+    customer_id = 1001
+    try:
+        foundCustomer = lookup.searchCustomer(customer_id)
+        print(f" Found customer {customer_id}: {foundCustomer.getName()} - {foundCustomer.getDeliveryStatus()}")
+    except hashError as e:
+        print(f"Customer {customer_id} not found (expected: {e})")
+
+    customer_id = 1002
+    try:
+        foundCustomer = lookup.searchCustomer(customer_id)
+        print(f"Found customer {customer_id}: {foundCustomer.getName()} - {foundCustomer.getDeliveryStatus()}")
+    except hashError as e:
+        print(f"Customer {customer_id} not found (expected: {e})")
+
+    customer_id = 999
+    try:
+        foundCustomer = lookup.searchCustomer(customer_id)
+        print(f"Found non-existent customer {customer_id}!")
+    except hashError as e:
+        print(f"Customer {customer_id} not found (expected: {e})")
+
+    # Test update delivery status
+    print("\n3) Testing delivery status update")
+
+    customer_id = 53
+    new_status = "Delivered"
+    result = lookup.updateStatus(customer_id, new_status)
+    print(f"Update customer {customer_id} to '{new_status}': {'Success' if result else 'Failed'}")
+    if result:
+        try:
+            updated_customer = lookup.searchCustomer(customer_id)
+            print(f"Verified status: {updated_customer.getDeliveryStatus()}")
+        except hashError as e:
+            print(f" Verification failed: {e}")
+
+    customer_id = 1001
+    new_status = "Out for delivered"
+    result = lookup.updateStatus(customer_id, new_status)
+    print(f"Update customer {customer_id} to '{new_status}': {'Success' if result else 'Failed'}")
+    if result:
+        try:
+            updated_customer = lookup.searchCustomer(customer_id)
+            print(f"Verified status: {updated_customer.getDeliveryStatus()}")
+        except hashError as e:
+            print(f" Verification failed: {e}")
+
+    customer_id = 999
+    new_status = "Processing"
+    result = lookup.updateStatus(customer_id, new_status)
+    print(f"Update customer {customer_id} to '{new_status}': {'Success' if result else 'Failed'}")
+    if result:
+        try:
+            updated_customer = lookup.searchCustomer(customer_id)
+            print(f"Verified status: {updated_customer.getDeliveryStatus()}")
+        except hashError as e:
+            print(f" Verification failed: {e}")
+
+    # test delete
+    print("\n4) Testing the delete function")
+    customer_id = 1002
+    result = lookup.deleteCustomer(customer_id)
+    print(f"Delete customer {customer_id}: {'Success' if result else 'Failed'}")
+    try:
+        lookup.searchCustomer(customer_id)
+        print(f"Error, customer {customer_id} still found after deleting")
+    except hashError as e:
+        print(f"Confirmed, customer {customer_id} has been deleted")
+
+    customer_id = 999
+    result = lookup.deleteCustomer(customer_id)
+    print(f"Delete customer {customer_id}: {'Success' if result else 'Failed'}")
+    try:
+        lookup.searchCustomer(customer_id)
+        print(f"Error, customer {customer_id} still found after deleting")
+    except hashError as e:
+        print(f"Confirmed, customer {customer_id} has been deleted")
+
+"""Test linear probing with ID's 53 and 106"""
+def testCollisionHandling(lookup):
+    print("\n--- Testing collision handling ---")
+    print("\nVerifying customers with colliding hash values (53, 106):")
+
+    customer_id = 53
+    try:
+        found = lookup.searchCustomer(customer_id)
+        hash_value = customer_id % 53
+        print(f"Retrieved ID {customer_id} (hash: {hash_value}): {found.getName()} - {found.getDeliveryStatus()}")
+    except hashError as e:
+        print(f"Error, failed to retrieve ID {customer_id}: {e}")
+
+    customer_id = 106
+    try:
+        found = lookup.searchCustomer(customer_id)
+        hash_value = customer_id % 53
+        print(f"Retrieved ID {customer_id} (hash: {hash_value}): {found.getName()} - {found.getDeliveryStatus()}")
+    except hashError as e:
+        print(f"Error, failed to retrieve ID {customer_id}: {e}")
+
+"""Test resizing based on the load factor"""
+def testLoadFactor(lookup):
+    print("\n--- Testing load factor and resizing ---")
+    stats = lookup.ht.get_statistics()
+
+    print("\nCurrent table stats:")
+    print(f"Size: {stats.size}, count: {stats.count}, load factor: {stats.load_factor:.3f}")
+
+    # Check if table has already been upsized from minimum size
+    if stats.size > CustomerHashTable.MIN_SIZE:
+        print(f"Table has already been upsized from minimum size {CustomerHashTable.MIN_SIZE} to {stats.size}")
+        print("This occurred during CSV loading when load factor exceeded 0.7")
+
+    # Test additional upsizing if we're close to the threshold
+    if stats.load_factor > 0.5:  # Test when we're getting close to 0.7
+        print(f"\nTesting additional upsizing (current load factor: {stats.load_factor:.3f}):")
+        try:
+            current_size = stats.size
+
+            # Add customers until we trigger a resize
+            i = 10000
+            while i < 10010:
+                customer = Customer(i, f"Extra_{i}", f"{i}_Extra_St", 1, "In_Transit")
+                lookup.insertCustomer(customer)
+
+                new_stats = lookup.ht.get_statistics()
+                print(f"Added ID {i}: size = {new_stats.size}, count = {new_stats.count}, load factor = {new_stats.load_factor:.3f}")
+
+                if new_stats.size > current_size:
+                    print(f"Table successfully upsized from {current_size} to {new_stats.size}")
+                    return  # Exit early after successful resize
+
+                if new_stats.load_factor > 0.75:  # Safety check
+                    print("Reached high load factor without resize - stopping test")
+                    return
+                i += 1
+
+        except Exception as e:
+            print(f"Insertion error: {e}")
+    else:
+        print(f"Load factor ({stats.load_factor:.3f}) is too low to test upsizing efficiently")
+
+    # Test downsizing
+    print(f"\nTesting downsizing (need load factor < {CustomerHashTable.MIN_LOAD_FACTOR}):")
+    stats = lookup.ht.get_statistics()
+    initial_size = stats.size
+
+    # Calculate how many customers we need to delete to trigger downsizing
+    target_count_float = stats.size * CustomerHashTable.MIN_LOAD_FACTOR
+    target_count = int(target_count_float) - 1
+    customers_to_delete = stats.count - target_count
+    if customers_to_delete < 0:
+        customers_to_delete = 0
+
+    print(f"Current: {stats.count} customers, need to delete ~{customers_to_delete} to trigger downsize")
+
+    if customers_to_delete > 0 and stats.size > CustomerHashTable.MIN_SIZE:
+        deleted = 0
+        # Start from higher IDs to avoid deleting test-critical customers
+        customer_id = 1020
+        while customer_id < 1060 and deleted < customers_to_delete:
+            # Check if customer exists by trying to search for it
+            customer_exists = False
+            try:
+                lookup.searchCustomer(customer_id)
+                customer_exists = True
+            except hashError:
+                customer_exists = False
+
+            # If customer exists, try to delete it
+            if customer_exists:
+                delete_result = lookup.deleteCustomer(customer_id)
+                if delete_result:
+                    deleted += 1
+
+                    # Check progress every 5 deletions or when we reach target
+                    if deleted % 5 == 0 or deleted == customers_to_delete:
+                        new_stats = lookup.ht.get_statistics()
+                        print(f"Deleted {deleted} customers: size = {new_stats.size}, count = {new_stats.count}, load factor = {new_stats.load_factor:.3f}")
+
+                        if new_stats.size < initial_size:
+                            print(f"Table successfully downsized from {initial_size} to {new_stats.size}")
+                            return
+            customer_id += 1
+
+        # If we didn't trigger a downsize, check why
+        final_stats = lookup.ht.get_statistics()
+        if final_stats.size == initial_size:
+            if final_stats.size <= CustomerHashTable.MIN_SIZE:
+                print(f"Table remained at minimum size {CustomerHashTable.MIN_SIZE} (no downsizing below minimum)")
+            else:
+                print(f"Load factor {final_stats.load_factor:.3f} still above minimum threshold {CustomerHashTable.MIN_LOAD_FACTOR}")
+    else:
+        print(f"Cannot test downsizing: table at minimum size ({CustomerHashTable.MIN_SIZE}) or insufficient customers")
+
+"""Test error conditions"""
+def testErrorHandling(lookup):
+    print("\n--- Testing error handling ---")
+
+    # test invalid priority
+    priority = 0
+    try:
+        customer = Customer(9999, "test customer", "test address", priority, "test status")
+        lookup.insertCustomer(customer)
+        print(f"Error, priority {priority} should have been rejected")
+    except hashError as e:
+        print(f" correctly rejected priority {priority}: {e}")
+
+    priority = 6
+    try:
+        customer = Customer(9999, "test customer", "test address", priority, "test status")
+        lookup.insertCustomer(customer)
+        print(f"Error, priority {priority} should have been rejected")
+    except hashError as e:
+        print(f" correctly rejected priority {priority}: {e}")
+
+    priority = -1
+    try:
+        customer = Customer(9999, "test customer", "test address", priority, "test status")
+        lookup.insertCustomer(customer)
+        print(f"Error, priority {priority} should have been rejected")
+    except hashError as e:
+        print(f" correctly rejected priority {priority}: {e}")
+
+    # Test non existent customer
+    print("\n2) Testing on non existent customer")
+
+    customer_id = 999
+    try:
+        customer = lookup.searchCustomer(customer_id)
+        print(f"Error, found a non existent customer {customer_id}")
+    except hashError as e:
+        print(f"Correctly handled missing customer")
+    result = lookup.updateStatus(customer_id, "test status")
+    print(f"Update non existent ID {customer_id}: {'Success' if result else 'Failed (expected)'}")
+
+    customer_id = 1234
+    try:
+        customer = lookup.searchCustomer(customer_id)
+        print(f"Error, found a non existent customer {customer_id}")
+    except hashError as e:
+        print(f"Correctly handled missing customer")
+    result = lookup.updateStatus(customer_id, "test status")
+    print(f"Update non existent ID {customer_id}: {'Success' if result else 'Failed (expected)'}")
+
+
+"""Verify handling of 50+ customers"""
+def test50Customers(lookup, loadedCustomers):
+    print("\n--- Testing with 50+ customers ---")
+    stats = lookup.ht.get_statistics()
+    print(f"\nLoaded {loadedCustomers} customers from CSV")
+    if loadedCustomers < 50:
+        print(f"Warning, expected 50+ customers, loaded {loadedCustomers}")
+    print(f"Table stats size = {stats.size}, Count={stats.count}, Load Factor={stats.load_factor:.3f}")
+
+    print("\nVerifying retrieval of sample customers:")
+    customer_id = 53
+    try:
+        customer = lookup.searchCustomer(customer_id)
+        print(f"Retrieved ID {customer_id}: {customer.getName()} - {customer.getDeliveryStatus()}")
+    except hashError as e:
+        print(f"Failed to retrieve ID {customer_id}: {e}")
+
+    customer_id = 1001
+    try:
+        customer = lookup.searchCustomer(customer_id)
+        print(f"Retrieved ID {customer_id}: {customer.getName()} - {customer.getDeliveryStatus()}")
+    except hashError as e:
+        print(f"Failed to retrieve ID {customer_id}: {e}")
+
+"""Array based table gives the same answers as the object table"""
+def testArrayTable():
+    print("\n--- Testing the array based table ---")
+    loadedCustomers, lookup = parseCSV('CustomerData.csv')
+    loadedCustomers, array_lookup = parseCSV('CustomerData.csv', CustomerArrayTable())
+    stats = array_lookup.ht.get_statistics()
+    print(f"Loaded {loadedCustomers} customers, size = {stats.size}, count = {stats.count}")
+
+    ids = [1001, 53, 106, 1042, 999999]
+    matches = 0
+    for customer_id in ids:
+        try:
+            expected = lookup.searchCustomer(customer_id).getName()
+        except hashError:
+            expected = None
+        try:
+            found = array_lookup.searchCustomer(customer_id).getName()
+        except hashError:
+            found = None
+        if found == expected:
+            matches += 1
+    print(f"{matches} of {len(ids)} lookups match the object table")
+
+    found = array_lookup.ht.search_many(ids)
+    print(f"Batch lookup found {sum(1 for customer in found if customer is not None)} of {len(ids)} IDs")
+
+    array_lookup.deleteCustomer(53)
+    print(f"After deleting 53, ID 106 still found: {bool(array_lookup.ht.has_customers([106])[0])}")
+    array_lookup.updateStatus(106, "Delivered")
+    print(f"Status of 106 after update: {array_lookup.searchCustomer(106).getDeliveryStatus()}")
+
+    try:
+        array_lookup.insertCustomer(Customer("C1", "Bad ID", "Nowhere", 1, "Pending"))
+        print("Error, non integer ID was accepted")
+    except hashError as e:
+        print(f"Correctly rejected non integer ID: {e}")
+
+    print(f"Slot memory: {array_lookup.ht.get_memory_usage() / stats.size:.1f} bytes per slot")
+
+"""Bulk loading sizes the table once and finds the same customers"""
+def testBulkLoad():
+    print("\n--- Testing bulk loading ---")
+    loadedCustomers, lookup = parseCSV('CustomerData.csv')
+    customers = [lookup.searchCustomer(customer_id) for customer_id in (1001, 1002, 53, 106, 1001)]
+
+    table = CustomerHashTable.from_customers(customers)
+    stats = table.get_statistics()
+    print(f"from_customers: size = {stats.size}, count = {stats.count} (duplicate ID stored once)")
+
+    bulk = LookUpCustomer()
+    loaded = bulk.bulk_load(customers[:4], expected=1000)
+    stats = bulk.ht.get_statistics()
+    print(f"bulk_load reserved for 1000: size = {stats.size}, count = {stats.count}, loaded {loaded}")
+    print(f"Retrieved ID 106 after bulk load: {bulk.searchCustomer(106).getName()}")
+
+    array_table = CustomerArrayTable.from_customers(iter(customers))
+    names_match = all(array_table.search(customer.getID()) is customer for customer in customers[:4])
+    print(f"Array table from_customers: count = {array_table.count}, same customers: {names_match}")
+    print(f"Next prime after 1000000: {CustomerHashTable._get_next_prime(1000000)}")
+
+"""Probe lengths of patterned IDs with modulo and Fibonacci hashing"""
+def testHashMixing():
+    print("\n--- Testing hash mixing and probe statistics ---")
+    # 700 customers make a 1009 slot table
+    patterns = (("sequential 1-700", list(range(1, 701))),
+                ("multiples of 1009", [i * 1009 for i in range(700)]),
+                ("blocks of 10 every 1000", [block * 1000 + i for block in range(70) for i in range(10)]))
+    for name, ids in patterns:
+        customers = [Customer(customer_id, "Test", "Test St", 1, "Pending") for customer_id in ids]
+        for hashing in (CustomerHashTable.MODULO_HASH, CustomerHashTable.FIBONACCI_HASH):
+            stats = CustomerHashTable.from_customers(customers, hashing=hashing).get_statistics()
+            array_stats = CustomerArrayTable.from_customers(customers, hashing=hashing).get_statistics()
+            same = abs(stats.average_probe - array_stats.average_probe) < 1e-9   # Insert order can change the max, not the total
+            print(f"{name:24} {hashing:9}: average probe {stats.average_probe:.2f}, max probe {stats.max_probe:3}, "
+                  f"home slot {stats.probe_histogram[0]}, average matches array table: {same}")
+
+    table = CustomerHashTable(hashing=CustomerHashTable.FIBONACCI_HASH)
+    for customer_id in (53, 106, 159):
+        table.insert(Customer(customer_id, "Test", "Test St", 1, "Pending"))
+    print(f"IDs 53, 106, 159 with Fibonacci hashing: max probe {table.get_statistics().max_probe}")
+    try:
+        CustomerHashTable(hashing='md5')
+        print("Error, unknown hashing was accepted")
+    except hashError as e:
+        print(f"Correctly rejected: {e}")
+
+"""Tombstones stay bounded under churn, Robin Hood evens out probe lengths"""
+def testTombstonesAndRobinHood():
+    print("\n--- Testing tombstone rehashing and Robin Hood probing ---")
+    for name, make_table in (("object table", CustomerHashTable), ("array table", CustomerArrayTable)):
+        table = make_table()
+        live = []
+        most_tombstones = 0
+        for customer_id in range(5000):     # 5000 customers come and go, 200 at a time
+            table.insert(Customer(customer_id, "Test", "Test St", 1, "Pending"))
+            live.append(customer_id)
+            if len(live) > 200:
+                table.delete(live.pop(0))
+            most_tombstones = max(most_tombstones, table.tombstones)
+        stats = table.get_statistics()
+        print(f"{name} after churn: size {stats.size}, count {stats.count}, tombstones {stats.tombstones}, "
+              f"most at once {most_tombstones} (limit {int(CustomerHashTable.MAX_TOMBSTONE_FACTOR * stats.size)})")
+
+        table = make_table.from_customers([Customer(customer_id, "Test", "Test St", 1, "Pending")
+                                           for customer_id in range(700)])
+        rebuilds = 0
+        for customer_id in range(700, 1400):   # Churn at the max load, each delete followed by an insert
+            table.delete(customer_id - 700)
+            tombstones = table.tombstones
+            table.insert(Customer(customer_id, "Test", "Test St", 1, "Pending"))
+            if tombstones > 1 and table.tombstones == 0:
+                rebuilds += 1
+        print(f"{name} churn at the max load: {rebuilds} rebuilds over 700 delete/insert pairs, "
+              f"size {table.size}")
+
+    random_ids = [(i * 7919 + 13) ** 2 % 1000003 for i in range(700)]
+    customers = [Customer(customer_id, "Test", "Test St", 1, "Pending") for customer_id in random_ids]
+    for robin_hood in (False, True):
+        table = CustomerHashTable.from_customers(customers, robin_hood=robin_hood)
+        stats = table.get_statistics()
+        print(f"Robin Hood {str(robin_hood):5}: average probe {stats.average_probe:.2f}, max probe {stats.max_probe}")
+
+    table = CustomerArrayTable.from_customers(customers, robin_hood=True)
+    for customer_id in random_ids[:350]:
+        table.delete(customer_id)
+    found = sum(1 for customer in table.search_many(random_ids[350:]) if customer is not None)
+    print(f"Robin Hood array table after 350 backward shift deletes: {found} of 350 left found, "
+          f"tombstones {table.tombstones}")
+
+"""Incremental resizing keeps every customer reachable while the arrays are moved"""
+def testIncrementalResize():
+    print("\n--- Testing incremental resizing ---")
+    table = CustomerHashTable(incremental=True)
+    operations_while_moving = 0
+    missing = 0
+    uncounted = 0
+    old_tombstones_seen = False
+    for customer_id in range(1, 3001):
+        table.insert(Customer(customer_id, "Test", "Test St", 1, "Pending"))
+        if table.old_table is not None:
+            operations_while_moving += 1
+            if not table.has_customer(customer_id // 2 + 1):   # Older customer, may still be in the old array
+                missing += 1
+            stats = table.get_statistics()
+            if int(stats.probe_histogram.sum()) != table.count:
+                uncounted += 1                                 # Statistics must see both arrays
+            if stats.tombstones > table.tombstones:
+                old_tombstones_seen = True                     # Moved slots of the old array are reported
+    stats = table.get_statistics()
+    print(f"Inserted 3000: size {stats.size}, count {stats.count}, "
+          f"{operations_while_moving} inserts during a resize, {missing} lookups missed, "
+          f"{uncounted} statistics missing customers, old array tombstones reported: {old_tombstones_seen}")
+
+    for customer_id in range(1, 2801):
+        table.delete(customer_id)
+    table.update_delivery_status(2900, "Delivered")
+    found = sum(1 for customer_id in range(2801, 3001) if table.has_customer(customer_id))
+    stats = table.get_statistics()
+    print(f"After deleting 2800: size {stats.size}, count {stats.count}, {found} of 200 left found, "
+          f"status of 2900: {table.search(2900).getDeliveryStatus()}")
+
+    table = CustomerHashTable(incremental=True)
+    live = []
+    cleanups = 0
+    old_table = None
+    for customer_id in range(5000):           # 5000 customers come and go, 200 at a time
+        table.insert(Customer(customer_id, "Test", "Test St", 1, "Pending"))
+        live.append(customer_id)
+        if len(live) > 200:
+            table.delete(live.pop(0))
+        if table.old_table is not old_table:
+            old_table = table.old_table
+            if old_table is not None and old_table.size == table.size:
+                cleanups += 1                 # Tombstones cleared by a same size move, not a rehash
+    found = sum(1 for customer_id in live if table.has_customer(customer_id))
+    print(f"Tombstone churn: {cleanups} same size moves, {found} of {len(live)} live customers found")
+    try:
+        CustomerArrayTable(incremental=True)
+        print("Error, array table accepted incremental resizing")
+    except hashError as e:
+        print(f"Correctly rejected: {e}")
+
+"""Slowest single insert while growing a table from empty, with and without incremental resizing"""
+def benchmarkInsertLatency(count=1000000):
+    print(f"\nInsert latency benchmark, {count} inserts")
+    print("=================================================")
+    customers = [Customer(customer_id, "Test", "Test St", 1, "Pending") for customer_id in range(count)]
+    for incremental in (False, True):
+        table = CustomerHashTable(incremental=incremental)
+        worst = 0.0
+        gc.disable()                # Garbage collector pauses would hide the resize stalls
+        start = time.perf_counter()
+        for customer in customers:
+            before = time.perf_counter()
+            table.insert(customer)
+            worst = max(worst, time.perf_counter() - before)
+        total = time.perf_counter() - start
+        gc.enable()
+        print(f"incremental {str(incremental):5}: total {total:.2f}s, slowest insert {worst * 1000:.1f}ms")
+
+"""Write a CSV of count customers in the CustomerData.csv format"""
+def writeCustomerCSV(path, count):
+    with open(path, 'w') as file:
+        file.write("customer_id,name,address,priority_level,delivery_status\n")
+        for i in range(count):
+            file.write(f"{i * 7 + 1},Customer_{i},{i}_Main_St,{i % 5 + 1},Pending\n")
+
+"""Read the customers of a generated CSV"""
+def readCustomerCSV(path):
+    customers = []
+    with open(path, 'r') as file:
+        file.readline()
+        for line in file:
+            fields = line.rstrip('\n').split(',')
+            customers.append(Customer(int(fields[0]), fields[1].replace('_', ' '),
+                                      fields[2].replace('_', ' '), int(fields[3]), fields[4]))
+    return customers
+
+"""Ingest a large CSV one insert at a time versus bulk_load, for both tables"""
+def benchmarkIngest(count=1000000):
+    print(f"\nCSV ingest benchmark, {count} rows")
+    print("=================================================")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'customers.csv')
+        writeCustomerCSV(path, count)
+        start = time.perf_counter()
+        customers = readCustomerCSV(path)
+        print(f"parse CSV:               {time.perf_counter() - start:.2f}s")
+
+    for name, make_table in (("object table", CustomerHashTable), ("array table", CustomerArrayTable)):
+        lookup = LookUpCustomer(make_table())
+        start = time.perf_counter()
+        for customer in customers:
+            lookup.insertCustomer(customer)
+        one_by_one = time.perf_counter() - start
+
+        lookup = LookUpCustomer(make_table())
+        start = time.perf_counter()
+        lookup.bulk_load(customers)
+        bulk = time.perf_counter() - start
+        print(f"{name}: insertCustomer {one_by_one:.2f}s, bulk_load {bulk:.2f}s, "
+              f"size {lookup.ht.get_statistics().size}")
+
+def main():
+    print("Module 2: customer hash table test cases")
+
+    try:
+        loadedCustomers, lookup = parseCSV('CustomerData.csv')
+        if loadedCustomers == 0:
+            print("No customers have been loading")
+            return
+
+        testFunctionality(lookup)
+        testCollisionHandling(lookup)
+        testLoadFactor(lookup)
+        testErrorHandling(lookup)
+        test50Customers(lookup, loadedCustomers)
+        testArrayTable()
+        testBulkLoad()
+        testHashMixing()
+        testTombstonesAndRobinHood()
+        testIncrementalResize()
+
+        print("All tests complete")
+        if len(sys.argv) > 1 and sys.argv[1] == "bench":
+            benchmarkIngest()
+            benchmarkInsertLatency()
+    except Exception as e:
+        print(f"\nTest case failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == '__main__':
+    main()
@@ -1,223 +1,485 @@
-from Module1.Graph import DSAGraph
-from Module1.Linked_list import DSALinkedList
-from Module2.LookUpCustomer import LookUpCustomer
-from Module2.Customer import Customer
-from Module3.Schedule import DeliveryScheduler
-from Module3.DeliveryRes import DeliveryRes
-import numpy as np
-import os
-
-"""Helper function to get absolute path for linux"""
-def get_module_path(filename):
-    module_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(module_dir, filename)
-    
-"""parse DeliveryReq.csv"""
-def parseRequests(filename):
-    requests = DSALinkedList()
-    csv_path = get_module_path(filename)
-
-    try:
-        with open(csv_path, 'r') as file:
-            lines = file.readlines()
-
-            for line in lines[1:]:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-
-                # Tokenize using split
-                fields = line.split(',')
-                if len(fields) != 2:
-                    print(f"Skipping invalid line: {line} (expected 2 fields)")
-                    continue
-
-                try:
-                    customer_id = int(fields[0])
-                    destination_hub = fields[1]
-                    if not destination_hub:
-                        raise ValueError("Destination hub cannot be empty")
-                    request = DeliveryRes(customer_id, destination_hub, None)
-                    requests.insertLast(request)
-                except ValueError as e:
-                    print(f"Skipping invalid line: {line} (error: {e})")
-    except FileNotFoundError:
-        print(f"Error: {filename} not found")
-    return requests
-
-"""parse CustomerData.csv"""
-def parseCustomers(filename):
-    customers = DSALinkedList()
-    csv_path = get_module_path(filename)
-
-    try:
-        with open(csv_path, 'r') as file:
-            lines = file.readlines()
-            # Skip header
-            for line in lines[1:]:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-
-                # Tokenize using split
-                fields = line.split(',')
-                if len(fields) != 5:
-                    print(f"Skipping invalid line: {line} (expected 5 fields)")
-                    continue
-
-                try:
-                    customer_id = int(fields[0])
-                    name = fields[1].replace('_', ' ')
-                    address = fields[2].replace('_', ' ')
-                    priority_level = int(fields[3])
-                    delivery_status = fields[4].replace('_', ' ')
-                    customer = Customer(customer_id, name, address, priority_level, delivery_status)
-                    customers.insertLast(customer)
-                except ValueError as e:
-                    print(f"Skipping invalid line: {line} (error: {e})")
-    except FileNotFoundError:
-        print(f"Error: {filename} not found")
-    return customers
-
-"""Set up graph and customer lookup."""
-def setupData():
-
-    # inner edge class
-    class Edge:
-        def __init__(self, source, destination, weight):
-            self.source = source
-            self.destination = destination
-            self.weight = weight
-
-    # Hardcode graph
-    graph = DSAGraph()
-    node_chars = "ABCDEFGH"
-    edges = DSALinkedList()
-    edges.insertLast(Edge('A', 'B', 5))
-    edges.insertLast(Edge('A', 'C', 3))
-    edges.insertLast(Edge('B', 'D', 4))
-    edges.insertLast(Edge('B', 'E', 6))
-    edges.insertLast(Edge('C', 'F', 2))
-    edges.insertLast(Edge('C', 'G', 7))
-    edges.insertLast(Edge('D', 'E', 3))
-    edges.insertLast(Edge('E', 'F', 4))
-    edges.insertLast(Edge('F', 'G', 5))
-    edges.insertLast(Edge('D', 'F', 2))
-    edges.insertLast(Edge('B', 'G', 8))
-
-    for node in node_chars:
-        graph.addVertex(node)
-    current = edges.head
-    while current:
-        edge = current.getValue()
-        graph.addEdge(edge.source, edge.destination, edge.weight)
-        current = current.getNext()
-
-    # Load customers
-    lookup = LookUpCustomer()
-    customers = parseCustomers("CustomerData.csv")
-    current = customers.head
-    while current:
-        customer = current.getValue()
-        lookup.insertCustomer(customer)
-        current = current.getNext()
-    return graph, lookup
-
-
-def testAddingRequests():
-    """Test adding delivery requests (Modules 1, 2, 3 integration)."""
-    print("\n" + "=" * 60)
-    print("TEST 1: ADDING DELIVERY REQUESTS - VALIDATION TEST")
-    print("=" * 60)
-    print("Purpose: Verify that delivery requests are properly validated and added")
-    print("Expected: 4 valid requests should be successfully added")
-    print("-" * 60)
-
-    graph, lookup = setupData()
-    scheduler = DeliveryScheduler(graph, lookup)
-
-    requests = parseRequests("DeliveryReq.csv")
-    valid_count = 0
-    current = requests.head
-    while current:
-        request = current.getValue()
-        customer_id = request.getCustomerID()
-        destination_hub = request.getDestinationHub()
-        try:
-            scheduler.insertDeliverRequest(customer_id, destination_hub)
-            valid_count += 1
-            print(f"[SUCCESS] Added valid request - Customer ID: {customer_id}, Destination: {destination_hub}\n")
-        except Exception as e:
-            print(f"[FILTERED] Rejected invalid request - Customer ID: {customer_id}, Destination: {destination_hub}")
-            print(f"           Reason: {e}\n")
-        current = current.getNext()
-
-    print("\n" + "-" * 60)
-    if valid_count >= 4:  # Expect 4 valid requests (53,B; 106,C; 1001,B; 106,F)
-        print(f"RESULT: PASS - Correct number of valid requests processed ({valid_count}/4)")
-    else:
-        print(f"RESULT: FAIL - Expected at least 4 valid requests, got {valid_count}")
-
-
-def testProcessingDeliveries():
-    """Test processing deliveries in priority order."""
-    print("\n" + "=" * 60)
-    print("TEST 2: PROCESSING DELIVERIES - PRIORITY ORDER TEST")
-    print("=" * 60)
-    print("Purpose: Verify deliveries are processed in correct priority order")
-    print("Expected Order: (106,C), (1001,B), (106,F), (53,B)")
-    print("-" * 60)
-
-    graph, lookup = setupData()
-    scheduler = DeliveryScheduler(graph, lookup)
-
-    # defining expected order
-    dtype = [('customer_id', int), ('hub', 'U1')]
-    expected_order = np.array([(106, 'C'), (1001, 'B'), (106, 'F'), (53, 'B')], dtype=dtype)
-
-    requests = parseRequests("DeliveryReq.csv")
-    current = requests.head
-    while current:
-        request = current.getValue()
-        try:
-            scheduler.insertDeliverRequest(request.getCustomerID(), request.getDestinationHub())
-            print()
-        except Exception as e:
-            print(f"Skipped invalid request: {e}")
-        current = current.getNext()
-
-    processed_deliveries = np.empty(4, dtype=object)
-    processed_count = 0
-    done = False
-
-    print("Processing deliveries in order:")
-    while processed_count < 4 and not done:
-        result = scheduler.processNextDelivery()
-        if result:
-            customer_id = result.getCustomerID()
-            hub = result.getDestinationHub()
-            processed_deliveries[processed_count] = result
-            if processed_count < 4:
-                expected_id = expected_order[processed_count]['customer_id']
-                expected_hub = expected_order[processed_count]['hub']
-                if customer_id == expected_id and hub == expected_hub:
-                    print(f"[CORRECT] Delivery {processed_count + 1}: Customer {customer_id} to {hub}\n")
-                else:
-                    print(
-                        f"[INCORRECT] Expected Customer {expected_id} to {expected_hub}, got {customer_id} to {hub}\n")
-            processed_count += 1
-        else:
-            print("[COMPLETE] No more deliveries in queue")
-            done = True
-
-    print("\n" + "-" * 60)
-    if processed_count == 4:
-        print("RESULT: PASS - All 4 expected deliveries were processed")
-    else:
-        print(f"RESULT: FAIL - Expected 4 deliveries, processed {processed_count}")
-    return processed_deliveries
-
-
-if __name__ == "__main__":
-    testAddingRequests()
-    processed_deliveries = testProcessingDeliveries()
+from Module1.Graph import DSAGraph
+from Module1.Linked_list import DSALinkedList
+from Module1.TravelProfile import DSATravelProfile
+from Module2.LookUpCustomer import LookUpCustomer
+from Module2.Customer import Customer
+from Module3.Schedule import DeliveryScheduler
+from Module3.DeliveryRes import DeliveryRes
+import numpy as np
+import os
+
+"""Helper function to get absolute path for linux"""
+def get_module_path(filename):
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(module_dir, filename)
+    
+"""parse DeliveryReq.csv"""
+def parseRequests(filename):
+    requests = DSALinkedList()
+    csv_path = get_module_path(filename)
+
+    try:
+        with open(csv_path, 'r') as file:
+            lines = file.readlines()
+
+            for line in lines[1:]:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+
+                # Tokenize using split
+                fields = line.split(',')
+                if len(fields) != 2:
+                    print(f"Skipping invalid line: {line} (expected 2 fields)")
+                    continue
+
+                try:
+                    customer_id = int(fields[0])
+                    destination_hub = fields[1]
+                    if not destination_hub:
+                        raise ValueError("Destination hub cannot be empty")
+                    request = DeliveryRes(customer_id, destination_hub, None)
+                    requests.insertLast(request)
+                except ValueError as e:
+                    print(f"Skipping invalid line: {line} (error: {e})")
+    except FileNotFoundError:
+        print(f"Error: {filename} not found")
+    return requests
+
+"""parse CustomerData.csv"""
+def parseCustomers(filename):
+    customers = DSALinkedList()
+    csv_path = get_module_path(filename)
+
+    try:
+        with open(csv_path, 'r') as file:
+            lines = file.readlines()
+            # Skip header
+            for line in lines[1:]:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+
+                # Tokenize using split
+                fields = line.split(',')
+                if len(fields) != 5:
+                    print(f"Skipping invalid line: {line} (expected 5 fields)")
+                    continue
+
+                try:
+                    customer_id = int(fields[0])
+                    name = fields[1].replace('_', ' ')
+                    address = fields[2].replace('_', ' ')
+                    priority_level = int(fields[3])
+                    delivery_status = fields[4].replace('_', ' ')
+                    customer = Customer(customer_id, name, address, priority_level, delivery_status)
+                    customers.insertLast(customer)
+                except ValueError as e:
+                    print(f"Skipping invalid line: {line} (error: {e})")
+    except FileNotFoundError:
+        print(f"Error: {filename} not found")
+    return customers
+
+"""Set up graph and customer lookup."""
+def setupData():
+
+    # inner edge class
+    class Edge:
+        def __init__(self, source, destination, weight):
+            self.source = source
+            self.destination = destination
+            self.weight = weight
+
+    # Hardcode graph
+    graph = DSAGraph()
+    node_chars = "ABCDEFGH"
+    edges = DSALinkedList()
+    edges.insertLast(Edge('A', 'B', 5))
+    edges.insertLast(Edge('A', 'C', 3))
+    edges.insertLast(Edge('B', 'D', 4))
+    edges.insertLast(Edge('B', 'E', 6))
+    edges.insertLast(Edge('C', 'F', 2))
+    edges.insertLast(Edge('C', 'G', 7))
+    edges.insertLast(Edge('D', 'E', 3))
+    edges.insertLast(Edge('E', 'F', 4))
+    edges.insertLast(Edge('F', 'G', 5))
+    edges.insertLast(Edge('D', 'F', 2))
+    edges.insertLast(Edge('B', 'G', 8))
+
+    for node in node_chars:
+        graph.addVertex(node)
+    current = edges.head
+    while current:
+        edge = current.getValue()
+        graph.addEdge(edge.source, edge.destination, edge.weight)
+        current = current.getNext()
+
+    # Load customers
+    lookup = LookUpCustomer()
+    customers = parseCustomers("CustomerData.csv")
+    current = customers.head
+    while current:
+        customer = current.getValue()
+        lookup.insertCustomer(customer)
+        current = current.getNext()
+    return graph, lookup
+
+
+def testAddingRequests():
+    """Test adding delivery requests (Modules 1, 2, 3 integration)."""
+    print("\n" + "=" * 60)
+    print("TEST 1: ADDING DELIVERY REQUESTS - VALIDATION TEST")
+    print("=" * 60)
+    print("Purpose: Verify that delivery requests are properly validated and added")
+    print("Expected: 4 valid requests should be successfully added")
+    print("-" * 60)
+
+    graph, lookup = setupData()
+    scheduler = DeliveryScheduler(graph, lookup)
+
+    requests = parseRequests("DeliveryReq.csv")
+    valid_count = 0
+    current = requests.head
+    while current:
+        request = current.getValue()
+        customer_id = request.getCustomerID()
+        destination_hub = request.getDestinationHub()
+        try:
+            scheduler.insertDeliverRequest(customer_id, destination_hub)
+            valid_count += 1
+            print(f"[SUCCESS] Added valid request - Customer ID: {customer_id}, Destination: {destination_hub}\n")
+        except Exception as e:
+            print(f"[FILTERED] Rejected invalid request - Customer ID: {customer_id}, Destination: {destination_hub}")
+            print(f"           Reason: {e}\n")
+        current = current.getNext()
+
+    print("\n" + "-" * 60)
+    if valid_count >= 4:  # Expect 4 valid requests (53,B; 106,C; 1001,B; 106,F)
+        print(f"RESULT: PASS - Correct number of valid requests processed ({valid_count}/4)")
+    else:
+        print(f"RESULT: FAIL - Expected at least 4 valid requests, got {valid_count}")
+
+
+def testProcessingDeliveries():
+    """Test processing deliveries in priority order."""
+    print("\n" + "=" * 60)
+    print("TEST 2: PROCESSING DELIVERIES - PRIORITY ORDER TEST")
+    print("=" * 60)
+    print("Purpose: Verify deliveries are processed in correct priority order")
+    print("Expected Order: (106,C), (1001,B), (106,F), (53,B)")
+    print("-" * 60)
+
+    graph, lookup = setupData()
+    scheduler = DeliveryScheduler(graph, lookup)
+
+    # defining expected order
+    dtype = [('customer_id', int), ('hub', 'U1')]
+    expected_order = np.array([(106, 'C'), (1001, 'B'), (106, 'F'), (53, 'B')], dtype=dtype)
+
+    requests = parseRequests("DeliveryReq.csv")
+    current = requests.head
+    while current:
+        request = current.getValue()
+        try:
+            scheduler.insertDeliverRequest(request.getCustomerID(), request.getDestinationHub())
+            print()
+        except Exception as e:
+            print(f"Skipped invalid request: {e}")
+        current = current.getNext()
+
+    processed_deliveries = np.empty(4, dtype=object)
+    processed_count = 0
+    done = False
+
+    print("Processing deliveries in order:")
+    while processed_count < 4 and not done:
+        result = scheduler.processNextDelivery()
+        if result:
+            customer_id = result.getCustomerID()
+            hub = result.getDestinationHub()
+            processed_deliveries[processed_count] = result
+            if processed_count < 4:
+                expected_id = expected_order[processed_count]['customer_id']
+                expected_hub = expected_order[processed_count]['hub']
+                if customer_id == expected_id and hub == expected_hub:
+                    print(f"[CORRECT] Delivery {processed_count + 1}: Customer {customer_id} to {hub}\n")
+                else:
+                    print(
+                        f"[INCORRECT] Expected Customer {expected_id} to {expected_hub}, got {customer_id} to {hub}\n")
+            processed_count += 1
+        else:
+            print("[COMPLETE] No more deliveries in queue")
+            done = True
+
+    print("\n" + "-" * 60)
+    if processed_count == 4:
+        print("RESULT: PASS - All 4 expected deliveries were processed")
+    else:
+        print(f"RESULT: FAIL - Expected 4 deliveries, processed {processed_count}")
+    return processed_deliveries
+
+
+def testPathCache():
+    """Test the shortest path cache is reused and dropped when the graph changes."""
+    print("\n" + "=" * 60)
+    print("TEST 3: SHORTEST PATH CACHE - HIT/MISS TEST")
+    print("=" * 60)
+    print("Purpose: Verify one dijkstra run serves every request from hub A")
+    print("Expected: 1 miss before the graph changes, 1 more miss after")
+    print("-" * 60)
+
+    graph, lookup = setupData()
+    scheduler = DeliveryScheduler(graph, lookup)
+
+    requests = parseRequests("DeliveryReq.csv")
+    current = requests.head
+    while current:
+        request = current.getValue()
+        try:
+            scheduler.insertDeliverRequest(request.getCustomerID(), request.getDestinationHub())
+        except Exception as e:
+            print(f"Skipped invalid request: {e}")
+        current = current.getNext()
+
+    stats = scheduler.getCacheStats()
+    print(f"After batch: hits = {stats.hits}, misses = {stats.misses}")
+    first_ok = stats.misses == 1 and stats.hits > 0
+
+    graph.addEdge('G', 'H', 6)       # Any mutation makes the cached tree stale
+    scheduler.getDistances('A')
+    stats = scheduler.getCacheStats()
+    print(f"After adding edge G-H: hits = {stats.hits}, misses = {stats.misses}")
+
+    print("\n" + "-" * 60)
+    if first_ok and stats.misses == 2:
+        print("RESULT: PASS - cache reused within a batch and invalidated on change")
+    else:
+        print("RESULT: FAIL - unexpected cache hit/miss counts")
+
+
+def testDistanceMatrix():
+    """Test travel times come from the precomputed hub matrix while it is current."""
+    print("\n" + "=" * 60)
+    print("TEST 4: PRECOMPUTED HUB DISTANCE MATRIX")
+    print("=" * 60)
+    print("Purpose: Verify the scheduler reads travel times from the matrix")
+    print("Expected: no dijkstra runs until the graph changes, same travel times")
+    print("-" * 60)
+
+    graph, lookup = setupData()
+    graph.precomputeDistanceMatrix()
+    scheduler = DeliveryScheduler(graph, lookup)
+
+    passed = True
+    requests = parseRequests("DeliveryReq.csv")
+    current = requests.head
+    while current:
+        request = current.getValue()
+        try:
+            scheduler.insertDeliverRequest(request.getCustomerID(), request.getDestinationHub())
+        except Exception as e:
+            print(f"Skipped invalid request: {e}")
+        current = current.getNext()
+    if scheduler.getCacheStats().misses != 0:
+        passed = False
+
+    distances = graph.distancesFrom('A')
+    hub = 'B'
+    from_matrix = graph.getTravelTime('A', hub)
+    print(f"A -> {hub}: matrix {from_matrix}, dijkstra {distances[graph.getVertexIndex(hub)]}")
+    if from_matrix != distances[graph.getVertexIndex(hub)]:
+        passed = False
+
+    graph.addEdge('G', 'H', 6)
+    print(f"After adding edge G-H the matrix is stale: {graph.isDistanceMatrixStale()}")
+    if not graph.isDistanceMatrixStale():
+        passed = False
+    graph.rebuildDistanceMatrix()
+    print(f"After rebuildDistanceMatrix, A -> H: {graph.getTravelTime('A', 'H')}")
+    if graph.getTravelTime('A', 'H') != 16.0:
+        passed = False
+
+    print("\n" + "-" * 60)
+    if passed:
+        print("RESULT: PASS - matrix used while current and rebuilt on request")
+    else:
+        print("RESULT: FAIL - distance matrix results are wrong")
+
+
+def testUnreachableHub():
+    """Test a request to the disconnected hub H is rejected without running dijkstra."""
+    print("\n" + "=" * 60)
+    print("TEST 5: UNREACHABLE HUB - COMPONENT INDEX TEST")
+    print("=" * 60)
+    print("Purpose: Verify impossible deliveries are rejected before routing")
+    print("Expected: request (53, H) rejected with 0 dijkstra runs")
+    print("-" * 60)
+
+    graph, lookup = setupData()
+    scheduler = DeliveryScheduler(graph, lookup)
+    print(f"Network has {graph.getComponentCount()} components, A reaches H: {graph.isReachable('A', 'H')}")
+
+    rejected = False
+    try:
+        scheduler.insertDeliverRequest(53, 'H')
+    except Exception as e:
+        print(f"[FILTERED] Rejected request - Customer ID: 53, Destination: H ({e})")
+        rejected = True
+
+    print("\n" + "-" * 60)
+    if rejected and scheduler.getCacheStats().misses == 0:
+        print("RESULT: PASS - unreachable hub rejected without routing")
+    else:
+        print("RESULT: FAIL - unreachable hub was routed or accepted")
+
+
+def testTravelTimeUpdate():
+    """Test a travel time change keeps the cached tree in use and correct."""
+    print("\n" + "=" * 60)
+    print("TEST 6: TRAVEL TIME UPDATE - TREE REPAIR TEST")
+    print("=" * 60)
+    print("Purpose: Verify updateEdgeWeight repairs the cached tree instead of rerunning dijkstra")
+    print("Expected: still 1 miss after the update, distances equal a fresh dijkstra")
+    print("-" * 60)
+
+    graph, lookup = setupData()
+    scheduler = DeliveryScheduler(graph, lookup)
+    before = scheduler.getDistances('A').copy()
+
+    graph.updateEdgeWeight('C', 'F', 9)       # Road on the shortest path to F, D and E
+    after = scheduler.getDistances('A')
+    fresh = graph.distancesFrom('A')
+    stats = scheduler.getCacheStats()
+    for label in "DEF":
+        idx = graph.getVertexIndex(label)
+        print(f"A to {label}: {before[idx]} -> {after[idx]}")
+    print(f"hits = {stats.hits}, misses = {stats.misses}")
+
+    print("\n" + "-" * 60)
+    if stats.misses == 1 and np.array_equal(after, fresh):
+        print("RESULT: PASS - tree repaired in place and matches dijkstra")
+    else:
+        print("RESULT: FAIL - cache missed or repaired distances are wrong")
+
+
+def testRushHour():
+    """Test a departure time inside a road's rush hour profile gives the longer travel time."""
+    print("\n" + "=" * 60)
+    print("TEST 7: RUSH HOUR - TIME DEPENDENT TRAVEL TIME TEST")
+    print("=" * 60)
+    print("Purpose: Verify requests use the travel time at their departure time")
+    print("Expected: F is 5 off peak and 11 at 7am (detour via D)")
+    print("-" * 60)
+
+    graph, lookup = setupData()
+    graph.setEdgeProfile('C', 'F', DSATravelProfile([0, 420, 600], [2, 12, 2], period=1440))
+    scheduler = DeliveryScheduler(graph, lookup)
+
+    off_peak = scheduler.getDistancesAt('A', 0)[graph.getVertexIndex('F')]
+    rush = scheduler.getDistancesAt('A', 420)[graph.getVertexIndex('F')]
+    scheduler.getDistancesAt('A', 420)          # Same departure again is a cache hit
+    next_day = scheduler.getDistancesAt('A', 1440 + 420)[graph.getVertexIndex('F')]   # 7am tomorrow, also a hit
+    stats = scheduler.getCacheStats()
+    print(f"A to F: {off_peak} leaving at 0, {rush} leaving at 420, {next_day} leaving at 1860")
+    print(f"hits = {stats.hits}, misses = {stats.misses}, path cache = {len(scheduler.path_cache)}")
+
+    print("\n" + "-" * 60)
+    if (off_peak == 5 and rush == 11 and next_day == 11 and stats.hits == 2 and stats.misses == 2
+            and len(scheduler.path_cache) == 0):
+        print("RESULT: PASS - travel time follows the departure time")
+    else:
+        print("RESULT: FAIL - wrong rush hour travel time")
+
+
+def testMultiDepot():
+    """Test each hub is assigned to its closest depot from a single multi source run."""
+    print("\n" + "=" * 60)
+    print("TEST 8: MULTI DEPOT - NEAREST DEPOT TEST")
+    print("=" * 60)
+    print("Purpose: Verify requests leave from the closest of several depots")
+    print("Expected: A, D, E from B and C, F from G, 1 dijkstra run in total")
+    print("-" * 60)
+
+    graph, lookup = setupData()
+    scheduler = DeliveryScheduler(graph, lookup, depots=('B', 'G'))
+    from_b = graph.distancesFrom('B')
+    from_g = graph.distancesFrom('G')
+
+    passed = True
+    for hub in "ACDEF":
+        depot, travel_time = scheduler.findNearestDepot(hub)
+        idx = graph.getVertexIndex(hub)
+        print(f"Hub {hub}: depot {depot}, travel time {travel_time}")
+        if travel_time != min(from_b[idx], from_g[idx]):
+            passed = False
+        if depot != ('B' if from_b[idx] < from_g[idx] else 'G'):
+            passed = False
+    stats = scheduler.getCacheStats()
+    print(f"hits = {stats.hits}, misses = {stats.misses}")
+
+    try:
+        DeliveryScheduler(graph, lookup, depots=('B', 'Z'))
+        passed = False
+    except ValueError as e:
+        print(f"Unknown depot rejected: {e}")
+
+    print("\n" + "-" * 60)
+    if passed and stats.misses == 1:
+        print("RESULT: PASS - every hub assigned to its nearest depot")
+    else:
+        print("RESULT: FAIL - wrong depot assignment")
+
+
+def testContractionHierarchy():
+    """Test the scheduler reads travel times from a contraction hierarchy while it is current."""
+    print("\n" + "=" * 60)
+    print("TEST 9: CONTRACTION HIERARCHY - POINT QUERY TEST")
+    print("=" * 60)
+    print("Purpose: Verify an up to date hierarchy answers without any dijkstra run")
+    print("Expected: same travel times as dijkstra, 0 misses, fallback once the graph changes or for another graph")
+    print("-" * 60)
+
+    graph, lookup = setupData()
+    scheduler = DeliveryScheduler(graph, lookup, hierarchy=graph.buildContractionHierarchy())
+    distances = graph.distancesFrom('A')
+    passed = True
+    for hub in "BCDEFG":
+        depot, travel_time = scheduler.findNearestDepot(hub)
+        if travel_time != distances[graph.getVertexIndex(hub)]:
+            passed = False
+    print(f"Hierarchy lookups: misses = {scheduler.getCacheStats().misses}")
+    if scheduler.getCacheStats().misses != 0:
+        passed = False
+
+    graph.addEdge('G', 'H', 6)                  # Hierarchy is now stale, dijkstra takes over
+    depot, travel_time = scheduler.findNearestDepot('H')
+    print(f"After adding G-H: A to H = {travel_time}, misses = {scheduler.getCacheStats().misses}")
+    if travel_time != 16 or scheduler.getCacheStats().misses != 1:
+        passed = False
+
+    other, other_lookup = setupData()
+    other.updateEdgeWeight('C', 'F', 9)         # Another network with the same number of changes
+    scheduler = DeliveryScheduler(graph, lookup, hierarchy=other.buildContractionHierarchy())
+    depot, travel_time = scheduler.findNearestDepot('F')
+    print(f"Hierarchy of another graph at version {other.getVersion()} (graph at {graph.getVersion()}): "
+          f"A to F = {travel_time}, misses = {scheduler.getCacheStats().misses}")
+    if other.getVersion() != graph.getVersion() or travel_time != 5 or scheduler.getCacheStats().misses != 1:
+        passed = False
+
+    print("\n" + "-" * 60)
+    if passed:
+        print("RESULT: PASS - hierarchy used while current, dijkstra after a change")
+    else:
+        print("RESULT: FAIL - wrong hierarchy travel times or cache use")
+
+
+if __name__ == "__main__":
+    testAddingRequests()
+    processed_deliveries = testProcessingDeliveries()
+    testPathCache()
+    testDistanceMatrix()
+    testUnreachableHub()
+    testTravelTimeUpdate()
+    testRushHour()
+    testMultiDepot()
+    testContractionHierarchy()
@@ -1,75 +1,189 @@
-from Module1.Graph import DSAGraph, GraphErrorHandle
-from Module2.LookUpCustomer import LookUpCustomer
-from Module3.Heap import DSAHeap
-from Module3.DeliveryRes import DeliveryRes
-
-class DeliveryScheduler:
-    def __init__(self, graph, lookup):
-        if not isinstance(graph, DSAGraph):
-            raise ValueError("Graph must be a DSAGraph instance")
-        if not isinstance(lookup, LookUpCustomer):
-            raise ValueError("Lookup must be a lookupcustomer instance")
-
-        self.heap = DSAHeap(capacity=100)
-        self.graph = graph
-        self.lookup = lookup
-
-    """Adds a delivery request to the scheduler"""
-    def insertDeliverRequest(self, customer_id, destination_hub):
-        #  fetch customer data using module 2
-        try:
-            customer = self.lookup.searchCustomer(customer_id)
-        except Exception as e:
-            raise ValueError(f"Customers ID {customer_id} not found: {e}")
-
-        delivery_status = customer.getDeliveryStatus()
-        is_active = (delivery_status == 'In_Transit' or delivery_status == 'In Transit' or delivery_status == 'Delayed'
-                     or delivery_status == 'Delayed_')
-        if not is_active:
-            print(f"Skipping {customer_id}: not an active delivery ({delivery_status})")
-            return False
-
-        # Get travel time from dijksra in module 1
-        source_hub = 'A'
-        try:
-            dijkstra_results = self.graph.dijkstra(source_hub)
-            travel_time = None
-            current = dijkstra_results.head
-            found = False
-
-            while current and not found:
-                result = current.getValue()
-                if result.getLabel() == destination_hub:
-                    travel_time = result.getDistance()
-                    found = True
-                else:
-                    current = current.getNext()
-            if travel_time is None or travel_time == float('inf'):
-                raise GraphErrorHandle(f"No path to hub {destination_hub}")
-            if travel_time == 0:
-                raise ValueError("Travel time cannot be zero")
-        except GraphErrorHandle as e:
-            raise GraphErrorHandle(f"Error computing travel time: {e}")
-
-        # calculate priority
-        priority_level = customer.getPriorityLevel()
-        priority = (6 - priority_level) + (1000 / travel_time)
-
-        # insert into heap with travel time
-        self.heap.insert(priority, customer_id, destination_hub, travel_time)
-        return True
-
-    """Process deliveries with the highest priority"""
-    def processNextDelivery(self):
-        try:
-            entry = self.heap.extract_priority()
-            customer_id = entry.getCustomerID()
-            destination_hub = entry.getDestinationHub()
-            priority = entry.getPriority()
-            travel_time = entry.getTravelTime()
-
-            print(f"Processing delivery: customer = {customer_id}, hub = {destination_hub}, priority = {priority:.2f}, travel time = {travel_time}")
-            return DeliveryRes(customer_id, destination_hub, travel_time)
-        except Exception as e:
-            print(f"Error processing delivery: {e}")
+from Module1.Graph import DSAGraph, GraphErrorHandle
+from Module1.CSRGraph import DSACSRGraph
+from Module2.LookUpCustomer import LookUpCustomer
+from Module3.Heap import DSAHeap
+from Module3.DeliveryRes import DeliveryRes
+
+"""Hit and miss counts of the scheduler's shortest path cache"""
+class CacheStats:
+    def __init__(self, hits, misses, size):
+        self.hits = hits
+        self.misses = misses
+        self.size = size
+
+
+class DeliveryScheduler:
+    TIMED_CACHE_SIZE = 32   # Departure trees kept by getDistancesAt, the oldest is dropped first
+
+    def __init__(self, graph, lookup, depots=('A',), hierarchy=None):
+        if not isinstance(graph, (DSAGraph, DSACSRGraph)):   # A loaded snapshot works too
+            raise ValueError("Graph must be a DSAGraph or DSACSRGraph instance")
+        if not isinstance(lookup, LookUpCustomer):
+            raise ValueError("Lookup must be a lookupcustomer instance")
+        if isinstance(depots, str):
+            depots = (depots,)
+        if len(depots) == 0:
+            raise ValueError("At least one depot is needed")
+        for depot in depots:
+            if not graph.hasVertex(depot):
+                raise ValueError(f"Depot {depot} is not a hub in the graph")
+
+        self.heap = DSAHeap(capacity=100)
+        self.graph = graph
+        self.lookup = lookup
+        self.depots = tuple(depots)   # Hubs deliveries can leave from, each request uses the nearest
+        self.hierarchy = hierarchy    # Optional contraction hierarchy of the graph for point queries
+        self.path_cache = {}     # source hub -> shortest path tree, valid while its version matches the graph
+        self.timed_cache = {}    # (hub, time within the profile period) -> departure tree, bounded
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    """
+    Distances from a source hub, reused until the graph changes.
+    Travel time updates keep the tree current (the graph repairs it),
+    adding or removing hubs and roads forces a new dijkstra.
+    """
+    def getDistances(self, source_hub):
+        tree = self.path_cache.get(source_hub)
+        if tree is not None and tree.getVersion() == self.graph.getVersion():
+            self.cache_hits += 1
+            return tree.getDistances()
+        self.cache_misses += 1
+        tree = self.graph.shortestPathTree(source_hub)   # One dijkstra per source until hubs/roads change
+        self.path_cache[source_hub] = tree
+        return tree.getDistances()
+
+    """
+    Travel times leaving the source hub at a given time. Trees are kept
+    in their own cache of at most TIMED_CACHE_SIZE entries, keyed on the
+    time within the profile period so every day's departure at the same
+    clock time shares one tree.
+    """
+    def getDistancesAt(self, source_hub, departure_time):
+        if not isinstance(self.graph, DSAGraph):        # Snapshots only hold the static weights
+            raise GraphErrorHandle("Time dependent routing needs a DSAGraph")
+        period = self.graph.getProfilePeriod()
+        if period is not None and departure_time >= 0:
+            departure_time = departure_time % period     # Same clock time on another day, same tree
+        key = (source_hub, departure_time)
+        tree = self.timed_cache.pop(key, None)
+        if tree is not None and tree.getVersion() == self.graph.getVersion():
+            self.cache_hits += 1
+            self.timed_cache[key] = tree                 # Back to the newest end
+            return tree.getDistances()
+        self.cache_misses += 1
+        tree = self.graph.dijkstraAt(source_hub, departure_time)
+        if len(self.timed_cache) >= DeliveryScheduler.TIMED_CACHE_SIZE:
+            del self.timed_cache[next(iter(self.timed_cache))]   # Least recently used
+        self.timed_cache[key] = tree
+        return tree.getDistances()
+
+    """Nearest depot tree for all depots, one multi source dijkstra per graph version"""
+    def getDepotTree(self):
+        tree = self.path_cache.get(self.depots)
+        if tree is not None and tree.getVersion() == self.graph.getVersion():
+            self.cache_hits += 1
+            return tree
+        self.cache_misses += 1
+        tree = self.graph.nearestDepots(self.depots)
+        self.path_cache[self.depots] = tree
+        return tree
+
+    """
+    Closest depot to a hub and the travel time from it. A single depot
+    uses its own cached tree (or the distance matrix), several depots
+    share one nearest depot tree. A contraction hierarchy built from the
+    current graph answers each depot with a point query instead. Time
+    dependent requests compare the departure trees of each depot.
+    """
+    def findNearestDepot(self, destination_hub, departure_time=None):
+        depots = []
+        for depot in self.depots:
+            if self.graph.isReachable(depot, destination_hub):   # O(1) reject, no routing needed
+                depots.append(depot)
+        if not depots:
+            raise GraphErrorHandle(f"No path to hub {destination_hub}")
+
+        if departure_time is not None:
+            best_depot, best_time = None, float('inf')
+            for depot in depots:
+                distances = self.getDistancesAt(depot, departure_time)
+                travel_time = float(distances[self.graph.getVertexIndex(destination_hub)])
+                if travel_time < best_time:
+                    best_depot, best_time = depot, travel_time
+            return best_depot, best_time
+        if self.hierarchy is not None and self.hierarchy.isCurrentFor(self.graph):
+            best_depot, best_time = None, float('inf')
+            for depot in depots:
+                travel_time = self.hierarchy.travelTime(depot, destination_hub)
+                if travel_time < best_time:
+                    best_depot, best_time = depot, travel_time
+            return best_depot, best_time
+        if (isinstance(self.graph, DSAGraph) and self.graph.hasDistanceMatrix()
+                and not self.graph.isDistanceMatrixStale()):
+            best_depot, best_time = None, float('inf')
+            for depot in depots:
+                travel_time = self.graph.getTravelTime(depot, destination_hub)
+                if travel_time < best_time:
+                    best_depot, best_time = depot, travel_time
+            return best_depot, best_time
+        if len(self.depots) == 1:
+            distances = self.getDistances(self.depots[0])
+            return self.depots[0], float(distances[self.graph.getVertexIndex(destination_hub)])
+        tree = self.getDepotTree()
+        return tree.getNearestDepot(destination_hub), float(tree.getDistance(destination_hub))
+
+    def getCacheStats(self):
+        return CacheStats(self.cache_hits, self.cache_misses, len(self.path_cache) + len(self.timed_cache))
+
+    """
+    Adds a delivery request to the scheduler. With a departure_time the
+    travel time follows the roads' time of day profiles (rush hour).
+    """
+    def insertDeliverRequest(self, customer_id, destination_hub, departure_time=None):
+        #  fetch customer data using module 2
+        try:
+            customer = self.lookup.searchCustomer(customer_id)
+        except Exception as e:
+            raise ValueError(f"Customers ID {customer_id} not found: {e}")
+
+        delivery_status = customer.getDeliveryStatus()
+        is_active = (delivery_status == 'In_Transit' or delivery_status == 'In Transit' or delivery_status == 'Delayed'
+                     or delivery_status == 'Delayed_')
+        if not is_active:
+            print(f"Skipping {customer_id}: not an active delivery ({delivery_status})")
+            return False
+
+        # Get travel time from module 1, from the depot closest to the destination
+        try:
+            depot, travel_time = self.findNearestDepot(destination_hub, departure_time)
+            if travel_time == float('inf'):
+                raise GraphErrorHandle(f"No path to hub {destination_hub}")
+            if travel_time == 0:
+                raise ValueError("Travel time cannot be zero")
+        except GraphErrorHandle as e:
+            raise GraphErrorHandle(f"Error computing travel time: {e}")
+
+        # calculate priority
+        priority_level = customer.getPriorityLevel()
+        priority = (6 - priority_level) + (1000 / travel_time)
+
+        # insert into heap with travel time
+        self.heap.insert(priority, customer_id, destination_hub, travel_time, depot)
+        return True
+
+    """Process deliveries with the highest priority"""
+    def processNextDelivery(self):
+        try:
+            entry = self.heap.extract_priority()
+            customer_id = entry.getCustomerID()
+            destination_hub = entry.getDestinationHub()
+            priority = entry.getPriority()
+            travel_time = entry.getTravelTime()
+            depot = entry.getDepot()
+
+            print(f"Processing delivery: customer = {customer_id}, hub = {destination_hub}, priority = {priority:.2f}, travel time = {travel_time}")
+            return DeliveryRes(customer_id, destination_hub, travel_time, depot)
+        except Exception as e:
+            print(f"Error processing delivery: {e}")
             return None
\ No newline at end of file